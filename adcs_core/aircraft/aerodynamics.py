@@ -1,13 +1,45 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 import numpy as np
 
 from adcs_core.aircraft.parameters import AircraftParameters, qbar
+from adcs_core.complex_step import as_real_or_complex, cs_arctan2, cs_clip, cs_maximum
 from adcs_core.state import State
 
+if TYPE_CHECKING:
+    from adcs_core.aircraft.compiled import CompiledAircraft
+
+# Coefficient vector layouts (contiguous float64, fixed order) packed by CompiledAircraft.
+LONGITUDINAL_COEFF_FIELDS = (
+    "CL0",
+    "CL_alpha_per_rad",
+    "CL_q",
+    "CL_de_per_rad",
+    "CD0",
+    "CD_k",
+    "Cm0",
+    "Cm_alpha_per_rad",
+    "Cm_q_per_rad",
+    "Cm_de_per_rad",
+)
+LATERAL_COEFF_FIELDS = (
+    "CY_beta_per_rad",
+    "CY_dr_per_rad",
+    "Cl_beta_per_rad",
+    "Cl_p",
+    "Cl_r",
+    "Cl_da_per_rad",
+    "Cl_dr_per_rad",
+    "Cn_beta_per_rad",
+    "Cn_p",
+    "Cn_r",
+    "Cn_da_per_rad",
+    "Cn_dr_per_rad",
+)
+
 
 @dataclass(frozen=True)
 class ControlInputs:
@@ -57,6 +89,13 @@ def wind_to_body(alpha: float, beta: float) -> np.ndarray:
     return Ry_ma @ Rz_mb
 
 
+def reference_products(params: AircraftParameters) -> Tuple[float, float, float, float]:
+    """
+    (S*b, S*cbar, b/2, cbar/2) as every aero path applies them; CompiledAircraft caches these.
+    """
+    return params.S_m2 * params.b_m, params.S_m2 * params.cbar_m, 0.5 * params.b_m, 0.5 * params.cbar_m
+
+
 def compute_coefficients(
     state: State, controls: ControlInputs, params: AircraftParameters
 ) -> Tuple[AeroCoefficients, float, float, float]:
@@ -66,9 +105,10 @@ def compute_coefficients(
     alpha, beta, V = _alpha_beta_from_body_vel(state.u, state.v, state.w)
 
     # Nondimensional rates
-    p_hat = state.p * params.b_m / (2.0 * V)
-    q_hat = state.q * params.cbar_m / (2.0 * V)
-    r_hat = state.r * params.b_m / (2.0 * V)
+    _, _, half_b, half_cbar = reference_products(params)
+    p_hat = state.p * half_b / V
+    q_hat = state.q * half_cbar / V
+    r_hat = state.r * half_b / V
 
     CL = params.CL0 + params.CL_alpha_per_rad * alpha + params.CL_de_per_rad * controls.elevator
     CD = params.CD0 + params.CD_k * (CL * CL)
@@ -117,9 +157,10 @@ def compute_coefficients_from_body_vel(
     """
     alpha, beta, V = _alpha_beta_from_body_vel(u, v, w)
 
-    p_hat = p * params.b_m / (2.0 * V)
-    q_hat = q * params.cbar_m / (2.0 * V)
-    r_hat = r * params.b_m / (2.0 * V)
+    _, _, half_b, half_cbar = reference_products(params)
+    p_hat = p * half_b / V
+    q_hat = q * half_cbar / V
+    r_hat = r * half_b / V
 
     CL = params.CL0 + params.CL_alpha_per_rad * alpha + params.CL_de_per_rad * controls.elevator
     CD = params.CD0 + params.CD_k * (CL * CL)
@@ -170,9 +211,10 @@ def compute_aero_forces_moments_body(
     F_body = wind_to_body(alpha, beta) @ F_wind
 
     # Moments in body axes
-    Lb = q * params.S_m2 * params.b_m * coeffs.Cl
-    Mb = q * params.S_m2 * params.cbar_m * coeffs.Cm
-    Nb = q * params.S_m2 * params.b_m * coeffs.Cn
+    S_b, S_cbar, _, _ = reference_products(params)
+    Lb = q * S_b * coeffs.Cl
+    Mb = q * S_cbar * coeffs.Cm
+    Nb = q * S_b * coeffs.Cn
     M_body = np.array([Lb, Mb, Nb], dtype=float)
 
     debug = {
@@ -215,9 +257,10 @@ def compute_aero_forces_moments_body_from_air_vel(
     F_wind = np.array([-D, Y, -L], dtype=float)
     F_body = wind_to_body(alpha, beta) @ F_wind
 
-    Lb = qd * params.S_m2 * params.b_m * coeffs.Cl
-    Mb = qd * params.S_m2 * params.cbar_m * coeffs.Cm
-    Nb = qd * params.S_m2 * params.b_m * coeffs.Cn
+    S_b, S_cbar, _, _ = reference_products(params)
+    Lb = qd * S_b * coeffs.Cl
+    Mb = qd * S_cbar * coeffs.Cm
+    Nb = qd * S_b * coeffs.Cn
     M_body = np.array([Lb, Mb, Nb], dtype=float)
 
     debug = {
@@ -238,4 +281,75 @@ def compute_aero_forces_moments_body_from_air_vel(
     return F_body, M_body, debug
 
 
+def compute_aero_forces_moments_body_batch(
+    *,
+    uvw_air_mps: np.ndarray,
+    pqr_radps: np.ndarray,
+    controls: np.ndarray,
+    params: AircraftParameters,
+    pack: CompiledAircraft | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized aerodynamic forces/moments for N independent aircraft.
+
+    uvw_air_mps: (N, 3) air-relative body velocity (wind already subtracted).
+    pqr_radps:   (N, 3) body rates.
+    controls:    (N, 4) control vectors ordered as ControlIndex (already clamped).
+    pack:        optional CompiledAircraft of params; its cached reference products and
+                 coefficient vectors are used instead of reading them off params.
+    Returns (forces_body_N, moments_body_Nm), each (N, 3). No debug dict is built.
+    Complex inputs are propagated (complex-step differentiation); real inputs take
+    exactly the float path.
+    """
+    if pack is None:
+        S_b, S_cbar, half_b, half_cbar = reference_products(params)
+        lon = [getattr(params, name) for name in LONGITUDINAL_COEFF_FIELDS]
+        lat = [getattr(params, name) for name in LATERAL_COEFF_FIELDS]
+    else:
+        S_b, S_cbar, half_b, half_cbar = pack.S_b, pack.S_cbar, pack.half_b, pack.half_cbar
+        lon, lat = pack.lon_coeffs, pack.lat_coeffs
+    CL0, CL_a, _CL_q, CL_de, CD0, CD_k, Cm0, Cm_a, Cm_q, Cm_de = lon
+    CY_b, CY_dr, Cl_b, Cl_p, Cl_r, Cl_da, Cl_dr, Cn_b, Cn_p, Cn_r, Cn_da, Cn_dr = lat
+
+    uvw = as_real_or_complex(uvw_air_mps)
+    pqr = as_real_or_complex(pqr_radps)
+    ctrl = as_real_or_complex(controls)
+    u, v, w = uvw[:, 0], uvw[:, 1], uvw[:, 2]
+    p, q, r = pqr[:, 0], pqr[:, 1], pqr[:, 2]
+    da, de, dr = ctrl[:, 1], ctrl[:, 2], ctrl[:, 3]
+
+    V = cs_maximum(np.sqrt(u * u + v * v + w * w), 1e-3)
+    alpha = cs_arctan2(w, u)
+    beta = np.arcsin(cs_clip(v / V, -0.999, 0.999))
+
+    p_hat = p * half_b / V
+    q_hat = q * half_cbar / V
+    r_hat = r * half_b / V
+
+    CL = CL0 + CL_a * alpha + CL_de * de
+    CD = CD0 + CD_k * (CL * CL)
+    CY = CY_b * beta + CY_dr * dr
+    Cm = Cm0 + Cm_a * alpha + Cm_q * q_hat + Cm_de * de
+    Cl = Cl_b * beta + Cl_p * p_hat + Cl_r * r_hat + Cl_da * da + Cl_dr * dr
+    Cn = Cn_b * beta + Cn_p * p_hat + Cn_r * r_hat + Cn_da * da + Cn_dr * dr
 
+    qd = qbar(params.rho_kgm3, V)
+    qS = qd * params.S_m2
+    L = qS * CL
+    D = qS * CD
+    Y = qS * CY
+
+    # wind_to_body(alpha, beta) @ [-D, Y, -L], expanded per component.
+    ca, sa = np.cos(alpha), np.sin(alpha)
+    cb, sb = np.cos(beta), np.sin(beta)
+    dtype = np.result_type(uvw, pqr, ctrl)
+    F_body = np.empty(uvw.shape, dtype=dtype)
+    F_body[:, 0] = -ca * cb * D + ca * sb * Y + sa * L
+    F_body[:, 1] = sb * D + cb * Y
+    F_body[:, 2] = -sa * cb * D + sa * sb * Y - ca * L
+
+    M_body = np.empty(uvw.shape, dtype=dtype)
+    M_body[:, 0] = qd * S_b * Cl
+    M_body[:, 1] = qd * S_cbar * Cm
+    M_body[:, 2] = qd * S_b * Cn
+    return F_body, M_body
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass, fields
+from typing import Any
+
+import numpy as np
+
+from adcs_core.aircraft.aerodynamics import LATERAL_COEFF_FIELDS, LONGITUDINAL_COEFF_FIELDS, reference_products
+from adcs_core.aircraft.database import AircraftModel
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+
+
+def _hash_value(h: Any, name: str, value: Any) -> None:
+    h.update(name.encode("utf-8"))
+    if isinstance(value, np.ndarray) or isinstance(value, (list, tuple)):
+        arr = np.ascontiguousarray(np.asarray(value, dtype=float))
+        h.update(str(arr.shape).encode("utf-8"))
+        h.update(arr.tobytes())
+    else:
+        h.update(float(value).hex().encode("utf-8"))
+
+
+def parameters_fingerprint(params: AircraftParameters, limits: ActuatorLimits | None = None) -> str:
+    """
+    Stable content hash (sha256 hex) of the physical parameters and actuator limits.
+    Equal inputs give equal fingerprints across processes and sessions.
+    """
+    if not isinstance(params, AircraftParameters):
+        raise TypeError(f"Cannot fingerprint {type(params).__name__}; expected AircraftParameters.")
+    h = hashlib.sha256(b"AircraftParameters/v1")
+    for f in fields(AircraftParameters):
+        _hash_value(h, f.name, getattr(params, f.name))
+    if limits is not None:
+        h.update(b"ActuatorLimits/v1")
+        for f in fields(ActuatorLimits):
+            _hash_value(h, f.name, getattr(limits, f.name))
+    return h.hexdigest()
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledAircraft:
+    """
+    Parameter pack built once from AircraftParameters/AircraftModel: the parameters
+    (.params), their actuator limits, the cached inertia inverse, the reference products
+    S*b, S*cbar, b/2, cbar/2, contiguous coefficient vectors (LONGITUDINAL_COEFF_FIELDS /
+    LATERAL_COEFF_FIELDS order) and the fingerprint.
+
+    Entry points typed AircraftParameters | CompiledAircraft (xdot_full, xdot_full_batch,
+    FastRhs, trim, linearization, analysis simulate) take their limits from the pack and
+    reuse its cached values; pass .params anywhere else.
+    """
+
+    params: AircraftParameters
+    limits: ActuatorLimits
+    inertia_inv: np.ndarray
+    S_b: float
+    S_cbar: float
+    half_b: float
+    half_cbar: float
+    lon_coeffs: np.ndarray
+    lat_coeffs: np.ndarray
+    fingerprint: str
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompiledAircraft) and other.fingerprint == self.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
+
+
+def compile_aircraft(
+    source: AircraftParameters | AircraftModel | CompiledAircraft,
+    limits: ActuatorLimits | None = None,
+) -> CompiledAircraft:
+    """
+    Build a CompiledAircraft. Limits default to the model's limits (or ActuatorLimits()).
+    Passing an already compiled pack without new limits returns it unchanged.
+    """
+    if isinstance(source, CompiledAircraft):
+        if limits is None or limits == source.limits:
+            return source
+        source = source.params
+    if isinstance(source, AircraftModel):
+        limits = limits or source.limits
+        source = source.params
+    if not isinstance(source, AircraftParameters):
+        raise TypeError(f"Cannot compile aircraft from {type(source).__name__}")
+    params = source
+    limits = limits or ActuatorLimits()
+
+    inertia_inv = np.linalg.inv(params.inertia_kgm2)
+    inertia_inv.setflags(write=False)
+    lon = np.array([getattr(params, n) for n in LONGITUDINAL_COEFF_FIELDS], dtype=float)
+    lat = np.array([getattr(params, n) for n in LATERAL_COEFF_FIELDS], dtype=float)
+    lon.setflags(write=False)
+    lat.setflags(write=False)
+    S_b, S_cbar, half_b, half_cbar = reference_products(params)
+    return CompiledAircraft(
+        params=params,
+        limits=limits,
+        inertia_inv=inertia_inv,
+        S_b=float(S_b),
+        S_cbar=float(S_cbar),
+        half_b=float(half_b),
+        half_cbar=float(half_cbar),
+        lon_coeffs=lon,
+        lat_coeffs=lat,
+        fingerprint=parameters_fingerprint(params, limits),
+    )
+
+
+def resolve_parameters(
+    params: AircraftParameters | CompiledAircraft | None,
+    limits: ActuatorLimits | None,
+) -> tuple[AircraftParameters, ActuatorLimits]:
+    """
+    Default handling shared by entrypoints that accept either parameter type; returns the
+    plain parameters. A compiled pack supplies its own limits unless explicit limits are given.
+    """
+    if params is None:
+        params = AircraftParameters()
+    if isinstance(params, CompiledAircraft):
+        return params.params, params.limits if limits is None else limits
+    return params, ActuatorLimits() if limits is None else limits
+
+
+def inertia_inverse(params: AircraftParameters | CompiledAircraft) -> np.ndarray:
+    if isinstance(params, CompiledAircraft):
+        return params.inertia_inv
+    return np.linalg.inv(params.inertia_kgm2)
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 import numpy as np
 
-from adcs_core.aircraft.aerodynamics import ControlInputs, compute_aero_forces_moments_body_from_air_vel
+from adcs_core.aircraft.aerodynamics import (
+    ControlInputs,
+    compute_aero_forces_moments_body_batch,
+    compute_aero_forces_moments_body_from_air_vel,
+)
 from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.complex_step import as_real_or_complex, cs_clip
 from adcs_core.state import State
+from adcs_core.state.state_definition import ControlIndex, RATE_INDICES, VELOCITY_INDICES
+
+if TYPE_CHECKING:
+    from adcs_core.aircraft.compiled import CompiledAircraft
 
 
 @dataclass(frozen=True)
@@ -26,6 +35,19 @@ def clamp_controls(u: ControlInputs, lim: ActuatorLimits) -> ControlInputs:
     )
 
 
+def clamp_controls_batch(U: np.ndarray, lim: ActuatorLimits) -> np.ndarray:
+    """
+    Vectorized clamp_controls for an (N, 4) control array ordered as ControlIndex.
+    """
+    U = as_real_or_complex(U)
+    out = np.empty_like(U)
+    out[:, ControlIndex.THROTTLE] = cs_clip(U[:, ControlIndex.THROTTLE], 0.0, 1.0)
+    out[:, ControlIndex.AILERON] = cs_clip(U[:, ControlIndex.AILERON], -lim.aileron_max_rad, lim.aileron_max_rad)
+    out[:, ControlIndex.ELEVATOR] = cs_clip(U[:, ControlIndex.ELEVATOR], -lim.elevator_max_rad, lim.elevator_max_rad)
+    out[:, ControlIndex.RUDDER] = cs_clip(U[:, ControlIndex.RUDDER], -lim.rudder_max_rad, lim.rudder_max_rad)
+    return out
+
+
 def thrust_force_body(u: ControlInputs, params: AircraftParameters) -> np.ndarray:
     # Phase 2: simple prop model = commanded thrust along +x body
     T = params.max_thrust_N * float(np.clip(u.throttle, 0.0, 1.0))
@@ -78,4 +100,28 @@ def forces_and_moments_body(
     return F, M, debug
 
 
+def forces_and_moments_body_batch(
+    X: np.ndarray,
+    U: np.ndarray,
+    params: AircraftParameters,
+    limits: ActuatorLimits,
+    *,
+    uvw_air_mps: np.ndarray | None = None,
+    pack: CompiledAircraft | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Net forces/moments in body axes for N aircraft at once.
 
+    X: (N, 12) states, U: (N, 4) controls, uvw_air_mps: optional (N, 3) air-relative
+    body velocity (defaults to the state velocity), pack: optional CompiledAircraft of
+    params whose cached aero constants are reused. Returns (F, M), each (N, 3).
+    """
+    X = as_real_or_complex(X)
+    u = clamp_controls_batch(U, limits)
+    uvw_air = X[:, VELOCITY_INDICES] if uvw_air_mps is None else as_real_or_complex(uvw_air_mps).reshape(-1, 3)
+
+    F, M = compute_aero_forces_moments_body_batch(
+        uvw_air_mps=uvw_air, pqr_radps=X[:, RATE_INDICES], controls=u, params=params, pack=pack
+    )
+    F[:, 0] += params.max_thrust_N * u[:, ControlIndex.THROTTLE]
+    return F, M
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import Any, Mapping, Sequence
 
 import numpy as np
 
@@ -56,6 +57,43 @@ class AircraftParameters:
     Cn_dr_per_rad: float = -0.08
 
 
+@dataclass(frozen=True, eq=False)
+class StackedParameters:
+    """
+    AircraftParameters of N ensemble members for the batched dynamics (xdot_full_batch).
+
+    values holds every AircraftParameters field, shared where all members agree and as a
+    per-member array ((N,), inertia (N, 3, 3)) where they differ; fields read as
+    attributes. Not an AircraftParameters, so it is not fingerprinted or compiled.
+    """
+
+    n_members: int
+    values: Mapping[str, Any]
+
+    def __getattr__(self, name: str) -> Any:
+        values = self.__dict__.get("values")
+        if values is None or name not in values:
+            raise AttributeError(f"{type(self).__name__} has no attribute '{name}'")
+        return values[name]
+
+
+def stack_parameters(params: Sequence[AircraftParameters]) -> StackedParameters:
+    """
+    Stack per-member parameters; only the fields on which members differ become arrays.
+    """
+    params = list(params)
+    if not params:
+        raise ValueError("params must be non-empty.")
+    values = {}
+    for f in fields(AircraftParameters):
+        member_values = [np.asarray(getattr(p, f.name), dtype=float) for p in params]
+        if any(not np.array_equal(v, member_values[0]) for v in member_values[1:]):
+            values[f.name] = np.stack(member_values)
+        else:
+            values[f.name] = getattr(params[0], f.name)
+    return StackedParameters(n_members=len(params), values=values)
+
+
 def qbar(rho: float, V: float) -> float:
     return 0.5 * rho * V * V
 
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+from adcs_core.aircraft.compiled import parameters_fingerprint
+from adcs_core.aircraft.database import AircraftModel
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.lqr_lateral import design_lateral_lqr
+from adcs_core.analysis.lqr_longitudinal import design_longitudinal_lqr
+from adcs_core.analysis.trim_envelope import compute_trim_envelope
+from adcs_core.dynamics.jacobian import linearize_xdot_full
+from adcs_core.state.state_definition import ControlIndex, StateIndex
+
+GAIN_SCHEDULE_TABLE_VERSION = 1
+
+_ARRAYS = ("V_grid", "alt_grid", "rho_kgm3", "K_lon", "K_lat", "x_trim", "u_trim", "valid")
+
+
+@dataclass(frozen=True)
+class GainScheduleTable:
+    """
+    Longitudinal and lateral LQR gains on an (altitude, airspeed) grid.
+
+    K_lon/K_lat are (n_alt, n_V, 2, 4) for LONGITUDINAL_*/LATERAL_* index sets;
+    x_trim/u_trim are the level trims they were designed at. Cells whose trim or design
+    failed are NaN with valid=False; lookups blend only the valid cells around a query.
+    """
+
+    V_grid: np.ndarray
+    alt_grid: np.ndarray
+    rho_kgm3: np.ndarray
+    K_lon: np.ndarray
+    K_lat: np.ndarray
+    x_trim: np.ndarray
+    u_trim: np.ndarray
+    valid: np.ndarray
+    fingerprint: str
+
+    def __post_init__(self) -> None:
+        # Both gain tables in one array so a lookup blends them in a single pass; invalid
+        # cells are zeroed so that their zero blend weight cannot turn into 0 * NaN.
+        valid = np.asarray(self.valid, dtype=bool)
+        K = np.stack([self.K_lon, self.K_lat], axis=2)
+        object.__setattr__(self, "_K", np.where(valid[..., None, None, None], K, 0.0))
+        object.__setattr__(self, "_x", np.where(valid[..., None], self.x_trim, 0.0))
+        object.__setattr__(self, "_u", np.where(valid[..., None], self.u_trim, 0.0))
+        object.__setattr__(self, "_w", valid.astype(float))
+        object.__setattr__(self, "_axes", (tuple(map(float, self.V_grid)), tuple(map(float, self.alt_grid))))
+
+    def _interp(self, table: np.ndarray, V_mps: np.ndarray | float, alt_m: np.ndarray | float) -> np.ndarray:
+        """
+        Bilinear lookup of a zero-filled table (n_alt, n_V, ...) at broadcast (V, alt)
+        queries, clamped to the grid. Only valid corners are blended (weights renormalised
+        over them); queries whose cell has no valid corner are NaN. Returns (*query_shape, ...).
+        """
+        w = self._w
+        if np.ndim(V_mps) == 0 and np.ndim(alt_m) == 0:
+            # Scalar fast path for per-step use: bisect on cached tuples, few temporaries.
+            iv0, iv1, fv = _bracket_scalar(self._axes[0], float(V_mps))
+            ia0, ia1, fa = _bracket_scalar(self._axes[1], float(alt_m))
+            w00 = (1.0 - fa) * (1.0 - fv) * w[ia0, iv0]
+            w01 = (1.0 - fa) * fv * w[ia0, iv1]
+            w10 = fa * (1.0 - fv) * w[ia1, iv0]
+            w11 = fa * fv * w[ia1, iv1]
+            total = float(w00 + w01 + w10 + w11)
+            if total <= 0.0:
+                return np.full(table.shape[2:], np.nan)
+            return (w00 * table[ia0, iv0] + w01 * table[ia0, iv1] + w10 * table[ia1, iv0] + w11 * table[ia1, iv1]) / total
+        V, alt = np.broadcast_arrays(np.asarray(V_mps, dtype=float), np.asarray(alt_m, dtype=float))
+        iv0, iv1, fv = _bracket(self.V_grid, V)
+        ia0, ia1, fa = _bracket(self.alt_grid, alt)
+        w00 = (1.0 - fa) * (1.0 - fv) * w[ia0, iv0]
+        w01 = (1.0 - fa) * fv * w[ia0, iv1]
+        w10 = fa * (1.0 - fv) * w[ia1, iv0]
+        w11 = fa * fv * w[ia1, iv1]
+        total = w00 + w01 + w10 + w11
+        shape = V.shape + (1,) * (table.ndim - 2)
+        w00, w01, w10, w11 = (x.reshape(shape) for x in (w00, w01, w10, w11))
+        num = w00 * table[ia0, iv0] + w01 * table[ia0, iv1] + w10 * table[ia1, iv0] + w11 * table[ia1, iv1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(total.reshape(shape) > 0.0, num / total.reshape(shape), np.nan)
+
+    def gains(self, V_mps: np.ndarray | float, alt_m: np.ndarray | float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        (K_lon, K_lat) at one or many flight conditions, each (*query_shape, 2, 4).
+        """
+        K = self._interp(self._K, V_mps, alt_m)
+        return K[..., 0, :, :], K[..., 1, :, :]
+
+    def trim(self, V_mps: np.ndarray | float, alt_m: np.ndarray | float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolated (x_trim, u_trim), each (*query_shape, 12) / (*query_shape, 4).
+        """
+        return self._interp(self._x, V_mps, alt_m), self._interp(self._u, V_mps, alt_m)
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path,
+            version=np.array(GAIN_SCHEDULE_TABLE_VERSION),
+            fingerprint=np.array(self.fingerprint),
+            **{name: getattr(self, name) for name in _ARRAYS},
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "GainScheduleTable":
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != GAIN_SCHEDULE_TABLE_VERSION:
+                raise ValueError(f"Gain schedule table version {version} != {GAIN_SCHEDULE_TABLE_VERSION}.")
+            return cls(fingerprint=str(data["fingerprint"]), **{name: np.array(data[name]) for name in _ARRAYS})
+
+
+def _bracket(grid: np.ndarray, q: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (lower index, upper index, blend weight) of each query on an ascending grid.
+    """
+    n = grid.size
+    if n == 1:
+        zero = np.zeros(q.shape, dtype=int)
+        return zero, zero, np.zeros(q.shape, dtype=float)
+    q = np.clip(q, grid[0], grid[-1])
+    i = np.clip(np.searchsorted(grid, q, side="right") - 1, 0, n - 2)
+    return i, i + 1, (q - grid[i]) / (grid[i + 1] - grid[i])
+
+
+def _bracket_scalar(grid: tuple[float, ...], q: float) -> tuple[int, int, float]:
+    n = len(grid)
+    if n == 1:
+        return 0, 0, 0.0
+    q = min(max(q, grid[0]), grid[-1])
+    i = min(max(bisect_right(grid, q) - 1, 0), n - 2)
+    return i, i + 1, (q - grid[i]) / (grid[i + 1] - grid[i])
+
+
+def _design_row(
+    args: tuple[AircraftParameters, ActuatorLimits, np.ndarray, np.ndarray, np.ndarray, tuple, str],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    params, limits, X, U, ok, weights, method = args
+    Q_lon, R_lon, Q_lat, R_lat = weights
+    n = X.shape[0]
+    K_lon = np.full((n, 2, 4), np.nan, dtype=float)
+    K_lat = np.full((n, 2, 4), np.nan, dtype=float)
+    valid = np.zeros(n, dtype=bool)
+    for j in range(n):
+        if not ok[j]:
+            continue
+        try:
+            A, B = linearize_xdot_full(X[j], U[j], params, limits, method=method)
+            K_lon[j] = design_longitudinal_lqr(A, B, Q=Q_lon, R=R_lon).K
+            K_lat[j] = design_lateral_lqr(A, B, Q=Q_lat, R=R_lat).K
+        except (ValueError, RuntimeError, np.linalg.LinAlgError):
+            K_lon[j] = K_lat[j] = np.nan
+            continue
+        valid[j] = True
+    return K_lon, K_lat, valid
+
+
+def build_gain_schedule_table(
+    model: AircraftModel,
+    V_grid: Sequence[float],
+    alt_grid: Sequence[float],
+    *,
+    Q_lon: np.ndarray | None = None,
+    R_lon: np.ndarray | None = None,
+    Q_lat: np.ndarray | None = None,
+    R_lat: np.ndarray | None = None,
+    isa_temp_offset_c: float = 0.0,
+    method: str = "analytic",
+    max_workers: int | None = 1,
+) -> GainScheduleTable:
+    """
+    Trim (compute_trim_envelope), linearize and design both LQR loops at every grid point.
+    Altitude rows are independent and are spread over a process pool when max_workers != 1.
+    Weights default to those of design_longitudinal_lqr / design_lateral_lqr.
+    """
+    env = compute_trim_envelope(
+        model, V_grid, alt_grid, isa_temp_offset_c=isa_temp_offset_c, max_workers=max_workers
+    )
+    V, alt = env.V_grid, env.alt_grid
+    n_alt, n_V = env.alpha.shape
+
+    # Full trim vectors from the envelope tables, laid out as compute_level_trim's x0/u0.
+    X = np.zeros((n_alt, n_V, 12), dtype=float)
+    X[..., int(StateIndex.U)] = V * np.cos(env.alpha)
+    X[..., int(StateIndex.W)] = V * np.sin(env.alpha)
+    X[..., int(StateIndex.THETA)] = env.theta
+    U = np.zeros((n_alt, n_V, 4), dtype=float)
+    U[..., int(ControlIndex.THROTTLE)] = env.throttle
+    U[..., int(ControlIndex.ELEVATOR)] = env.elevator
+
+    weights = (Q_lon, R_lon, Q_lat, R_lat)
+    tasks = [
+        (replace(model.params, rho_kgm3=float(rho)), model.limits, X[i], U[i], env.converged[i], weights, method)
+        for i, rho in enumerate(env.rho_kgm3)
+    ]
+    if max_workers == 1 or n_alt == 1:
+        rows = [_design_row(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_design_row, tasks))
+
+    valid = np.stack([r[2] for r in rows])
+    X[~valid] = np.nan
+    U[~valid] = np.nan
+    return GainScheduleTable(
+        V_grid=V,
+        alt_grid=alt,
+        rho_kgm3=env.rho_kgm3,
+        K_lon=np.stack([r[0] for r in rows]),
+        K_lat=np.stack([r[1] for r in rows]),
+        x_trim=X,
+        u_trim=U,
+        valid=valid,
+        fingerprint=parameters_fingerprint(model.params, model.limits),
+    )
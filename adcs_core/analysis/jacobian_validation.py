@@ -7,6 +7,7 @@ import numpy as np
 from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.dynamics.jacobian import jacobian_full
 from adcs_core.dynamics.linearize import linearize
 from adcs_core.model import xdot_full
 from adcs_core.state.state_definition import ControlIndex
@@ -44,10 +45,12 @@ def validate_jacobian(
     limits: ActuatorLimits,
     epsilon: float = 1e-6,
     seed: int = 0,
+    method: str = "fd",
 ) -> JacobianValidationResult:
     """
     Validate local Jacobian via directional derivative check:
       (f(x + eps*v) - f(x))/eps  ~  A v
+    method="fd" checks the finite-difference A, method="analytic" the closed-form jacobian_full.
     """
     x0 = np.asarray(x_trim, dtype=float).reshape(-1)
     u0 = np.asarray(u_trim, dtype=float).reshape(-1)
@@ -55,7 +58,12 @@ def validate_jacobian(
     def f(x: np.ndarray, u_vec: np.ndarray) -> np.ndarray:
         return _xdot_from_vectors(x, u_vec, params=params, limits=limits)
 
-    A, _B = linearize(f, x0, u0)
+    if method == "analytic":
+        A, _B = jacobian_full(x0, u0, params, limits)
+    elif method == "fd":
+        A, _B = linearize(f, x0, u0)
+    else:
+        raise ValueError(f"Unknown Jacobian method '{method}'.")
 
     rng = np.random.default_rng(seed)
     v = rng.standard_normal(x0.size)
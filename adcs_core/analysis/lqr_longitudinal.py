@@ -5,12 +5,10 @@ from dataclasses import dataclass
 import numpy as np
 from scipy import linalg
 
-from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.simulation import StateFeedback, simulate
 from adcs_core.analysis.trim import TrimResult
-from adcs_core.dynamics.integrator import rk4_step
-from adcs_core.model import xdot_full
 from adcs_core.state.state_definition import ControlIndex, StateIndex
 
 
@@ -126,11 +124,6 @@ def _apply_alpha_perturbation(x_trim: np.ndarray, alpha_perturb_deg: float) -> n
     return x0
 
 
-def _longitudinal_error_norm(x: np.ndarray, x_trim: np.ndarray) -> float:
-    idx = np.asarray(LONGITUDINAL_STATE_IDX_FULL, dtype=int)
-    return float(np.linalg.norm(np.asarray(x)[idx] - np.asarray(x_trim)[idx]))
-
-
 def _settling_time(
     t_hist: np.ndarray,
     err_hist: np.ndarray,
@@ -161,39 +154,29 @@ def simulate_longitudinal_perturbation(
     x = _apply_alpha_perturbation(x_trim, alpha_perturb_deg=alpha_perturb_deg)
 
     t_hist = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s)
-    err_hist = np.zeros_like(t_hist)
-    peak_q = 0.0
-
-    def control_from_state(xi: np.ndarray) -> ControlInputs:
-        if K is None:
-            return ControlInputs(
-                throttle=float(u_trim[int(ControlIndex.THROTTLE)]),
-                aileron=0.0,
-                elevator=float(u_trim[int(ControlIndex.ELEVATOR)]),
-                rudder=0.0,
-            )
-        x_sub = np.asarray(xi, dtype=float)[LONGITUDINAL_STATE_IDX_FULL]
-        x_ref = x_trim[LONGITUDINAL_STATE_IDX_FULL]
-        du = -np.asarray(K, dtype=float) @ (x_sub - x_ref)
-        de = float(
-            np.clip(
-                u_trim[int(ControlIndex.ELEVATOR)] + du[0],
-                -limits.elevator_max_rad,
-                limits.elevator_max_rad,
-            )
-        )
-        thr = float(np.clip(u_trim[int(ControlIndex.THROTTLE)] + du[1], 0.0, 1.0))
-        return ControlInputs(throttle=thr, aileron=0.0, elevator=de, rudder=0.0)
-
-    def f_dyn(tt: float, xx: np.ndarray) -> np.ndarray:
-        ctrl = control_from_state(xx)
-        return xdot_full(xx, ctrl, params=params, limits=limits)
-
-    for i, tt in enumerate(t_hist):
-        err_hist[i] = _longitudinal_error_norm(x, x_trim)
-        peak_q = max(peak_q, abs(float(x[int(StateIndex.Q)])))
-        if i < len(t_hist) - 1:
-            x = rk4_step(f_dyn, float(tt), x, dt_s)
+    idx = np.asarray(LONGITUDINAL_STATE_IDX_FULL, dtype=int)
+    controller = StateFeedback(
+        x_ref=x_trim,
+        u_ref=u_trim,
+        K=K,
+        state_idx=LONGITUDINAL_STATE_IDX_FULL,
+        input_idx=LONGITUDINAL_INPUT_IDX_FULL,
+        limits=limits,
+    )
+    sim = simulate(
+        x,
+        controller,
+        dt_s,
+        t_hist.size - 1,
+        params=params,
+        limits=limits,
+        record={
+            "err": lambda X, _U: np.linalg.norm(X[:, idx] - x_trim[idx], axis=1),
+            "q": "q",
+        },
+    )
+    err_hist = sim["err"]
+    peak_q = float(np.max(np.abs(sim["q"])))
 
     threshold = 0.02 * max(1e-9, float(err_hist[0]))
     settling = _settling_time(t_hist, err_hist, threshold=threshold)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from adcs_core.analysis.lqr_lateral import LATERAL_INPUT_IDX_FULL, LATERAL_STATE_IDX_FULL
+from adcs_core.analysis.lqr_longitudinal import (
+    LONGITUDINAL_INPUT_IDX_FULL,
+    LONGITUDINAL_STATE_IDX_FULL,
+    controllability_matrix,
+)
+from adcs_core.analysis.riccati import solve_care_batch
+
+# Base weights match design_longitudinal_lqr / design_lateral_lqr defaults.
+_LOOPS = {
+    "longitudinal": (LONGITUDINAL_STATE_IDX_FULL, LONGITUDINAL_INPUT_IDX_FULL, (1.0, 10.0, 100.0, 50.0), (1.0, 0.5)),
+    "lateral": (LATERAL_STATE_IDX_FULL, LATERAL_INPUT_IDX_FULL, (1.0, 10.0, 10.0, 50.0), (1.0, 1.0)),
+}
+
+
+@dataclass(frozen=True)
+class LqrSweepResult:
+    """
+    One LQR design per weight point (n points), as arrays.
+
+    Q_diag/R_diag: (n, nx)/(n, nu) diagonal weights; K: (n, nu, nx); eigenvalues: (n, nx).
+    spectral_margin = -max Re(eig); min_damping over oscillatory closed-loop poles (NaN if
+    none); control_effort = trace(K W K') and state_energy = trace(W), with W the
+    closed-loop Gramian for unit initial-state covariance (integrated u'u and x'x).
+    pareto: non-dominated points for (max spectral_margin, max min_damping, min control_effort).
+    """
+
+    loop: str
+    Q_diag: np.ndarray
+    R_diag: np.ndarray
+    K: np.ndarray
+    eigenvalues: np.ndarray
+    spectral_margin: np.ndarray
+    min_damping: np.ndarray
+    control_effort: np.ndarray
+    state_energy: np.ndarray
+    pareto: np.ndarray
+
+
+def pareto_mask(costs: np.ndarray) -> np.ndarray:
+    """
+    Non-dominated rows of costs (n, m), all objectives minimized. NaN counts as worst.
+    """
+    c = np.where(np.isnan(costs), np.inf, np.asarray(costs, dtype=float))
+    n = c.shape[0]
+    mask = np.ones(n, dtype=bool)
+    # Chunked all-pairs comparison keeps memory at O(chunk * n * m).
+    chunk = max(1, 2_000_000 // max(1, n * c.shape[1]))
+    for lo in range(0, n, chunk):
+        ci = c[lo : lo + chunk, None, :]
+        dominated = np.all(c[None, :, :] <= ci, axis=2) & np.any(c[None, :, :] < ci, axis=2)
+        mask[lo : lo + chunk] = ~np.any(dominated, axis=1)
+    return mask
+
+
+def _diag_stack(d: np.ndarray) -> np.ndarray:
+    out = np.zeros(d.shape + (d.shape[-1],), dtype=float)
+    idx = np.arange(d.shape[-1])
+    out[:, idx, idx] = d
+    return out
+
+
+def _solve_chunk(args: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    A, B, Q_diag, R_diag = args
+    return solve_care_batch(A, B, _diag_stack(Q_diag), _diag_stack(R_diag))[1]
+
+
+def _closed_loop_metrics(A: np.ndarray, B: np.ndarray, K: np.ndarray) -> tuple[np.ndarray, ...]:
+    n, nx = K.shape[0], A.shape[0]
+    Acl = A[None] - B[None] @ K
+    eig = np.linalg.eigvals(Acl)
+    margin = -np.max(eig.real, axis=1)
+
+    wn = np.abs(eig)
+    osc = (np.abs(eig.imag) >= 1e-10) & (wn > 1e-12)
+    zeta = np.where(osc, -eig.real / np.where(wn > 0.0, wn, 1.0), np.inf)
+    min_zeta = np.min(zeta, axis=1)
+    min_zeta[~np.any(osc, axis=1)] = np.nan
+
+    # Batched Lyapunov Acl W + W Acl' + I = 0 via the Kronecker form (nx is 4).
+    I = np.eye(nx)
+    L = np.einsum("ij,nkl->nikjl", I, Acl).reshape(n, nx * nx, nx * nx) + np.einsum(
+        "nij,kl->nikjl", Acl, I
+    ).reshape(n, nx * nx, nx * nx)
+    W = np.linalg.solve(L, np.broadcast_to(-I.reshape(-1), (n, nx * nx))[..., None])[..., 0].reshape(n, nx, nx)
+    stable = margin > 0.0
+    effort = np.where(stable, np.einsum("nij,njk,nik->n", K, W, K), np.inf)
+    energy = np.where(stable, np.trace(W, axis1=1, axis2=2), np.inf)
+    return eig, margin, min_zeta, effort, energy
+
+
+def sweep_lqr_weights(
+    A_full: np.ndarray,
+    B_full: np.ndarray,
+    Q_scale: np.ndarray,
+    R_scale: np.ndarray,
+    *,
+    loop: str = "longitudinal",
+    Q: np.ndarray | None = None,
+    R: np.ndarray | None = None,
+    max_workers: int | None = 1,
+    chunk_size: int = 512,
+) -> LqrSweepResult:
+    """
+    Batched LQR designs for one plant over many diagonal weightings.
+
+    Q_scale (n, nx) and R_scale (n, nu) multiply the diagonals of the base Q/R (the
+    design_*_lqr defaults unless given); a (n,) R_scale scales all of R. Controllability is
+    checked once; points are solved in chunks with solve_care_batch (lockstep
+    Newton-Kleinman), spread over a process pool when max_workers != 1. Closed-loop
+    metrics are evaluated for all points at once.
+    """
+    try:
+        s_idx, i_idx, q_base, r_base = _LOOPS[loop]
+    except KeyError as exc:
+        raise ValueError(f"Unknown LQR loop '{loop}'.") from exc
+    A = np.asarray(A_full, dtype=float)[np.ix_(s_idx, s_idx)]
+    B = np.asarray(B_full, dtype=float)[np.ix_(s_idx, i_idx)]
+    nx, nu = B.shape
+
+    rank = int(np.linalg.matrix_rank(controllability_matrix(A, B)))
+    if rank < nx:
+        raise RuntimeError(f"{loop.capitalize()} subsystem not controllable: rank={rank}, n={nx}")
+
+    q0 = np.asarray(q_base if Q is None else np.diag(Q), dtype=float)
+    r0 = np.asarray(r_base if R is None else np.diag(R), dtype=float)
+    Q_scale = np.atleast_2d(np.asarray(Q_scale, dtype=float))
+    R_scale = np.asarray(R_scale, dtype=float)
+    if R_scale.ndim == 1:
+        R_scale = np.repeat(R_scale[:, None], nu, axis=1)
+    Q_diag = np.broadcast_to(q0, Q_scale.shape) * np.maximum(Q_scale, 1e-6)
+    R_diag = np.broadcast_to(r0, R_scale.shape) * np.maximum(R_scale, 1e-6)
+    if Q_diag.shape != (Q_diag.shape[0], nx) or R_diag.shape != (Q_diag.shape[0], nu):
+        raise ValueError(f"Q_scale must be (n, {nx}) and R_scale (n,) or (n, {nu}) with matching n.")
+
+    bounds = range(0, Q_diag.shape[0], max(1, int(chunk_size)))
+    tasks = [(A, B, Q_diag[lo : lo + chunk_size], R_diag[lo : lo + chunk_size]) for lo in bounds]
+    if max_workers == 1 or len(tasks) <= 1:
+        chunks = [_solve_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunks = list(pool.map(_solve_chunk, tasks))
+    K = np.concatenate(chunks, axis=0)
+
+    eig, margin, min_zeta, effort, energy = _closed_loop_metrics(A, B, K)
+    pareto = pareto_mask(np.column_stack([-margin, -np.nan_to_num(min_zeta, nan=-np.inf), effort]))
+    return LqrSweepResult(
+        loop=loop,
+        Q_diag=np.array(Q_diag),
+        R_diag=np.array(R_diag),
+        K=K,
+        eigenvalues=eig,
+        spectral_margin=margin,
+        min_damping=min_zeta,
+        control_effort=effort,
+        state_energy=energy,
+        pareto=pareto,
+    )
+
+
+def longitudinal_weight_grid(
+    q_speed_mults: Sequence[float],
+    q_pitch_mults: Sequence[float],
+    r_effort_mults: Sequence[float],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (Q_scale, R_scale) for every combination of the workbench sliders, in C order over
+    (q_speed, q_pitch, r_effort): q_speed scales u, q_pitch scales w, q and theta.
+    """
+    qs, qp, re = np.meshgrid(
+        np.asarray(q_speed_mults, dtype=float),
+        np.asarray(q_pitch_mults, dtype=float),
+        np.asarray(r_effort_mults, dtype=float),
+        indexing="ij",
+    )
+    Q_scale = np.column_stack([qs.ravel(), qp.ravel(), qp.ravel(), qp.ravel()])
+    return Q_scale, re.ravel()
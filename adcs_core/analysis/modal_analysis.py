@@ -3,9 +3,26 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 
 import numpy as np
+from scipy.optimize import linear_sum_assignment
 
 from adcs_core.state.state_definition import DynamicStateIndex
 
+# Dynamic-state ordering in A_d is [u, v, w, phi, theta, psi, p, q, r].
+_LONG_IDX = np.array(
+    [int(DynamicStateIndex.U), int(DynamicStateIndex.W), int(DynamicStateIndex.THETA), int(DynamicStateIndex.Q)],
+    dtype=int,
+)
+_LAT_IDX = np.array(
+    [
+        int(DynamicStateIndex.V),
+        int(DynamicStateIndex.PHI),
+        int(DynamicStateIndex.PSI),
+        int(DynamicStateIndex.P),
+        int(DynamicStateIndex.R),
+    ],
+    dtype=int,
+)
+
 
 @dataclass(frozen=True)
 class ModeSummary:
@@ -87,30 +104,9 @@ def _classify_mode(
     *,
     imag_tol: float,
 ) -> tuple[str, str, float | None, float | None]:
-    # Dynamic-state ordering in A_d is [u, v, w, phi, theta, psi, p, q, r].
-    long_idx = np.array(
-        [
-            int(DynamicStateIndex.U),
-            int(DynamicStateIndex.W),
-            int(DynamicStateIndex.THETA),
-            int(DynamicStateIndex.Q),
-        ],
-        dtype=int,
-    )
-    lat_idx = np.array(
-        [
-            int(DynamicStateIndex.V),
-            int(DynamicStateIndex.PHI),
-            int(DynamicStateIndex.PSI),
-            int(DynamicStateIndex.P),
-            int(DynamicStateIndex.R),
-        ],
-        dtype=int,
-    )
-
     mag2 = np.abs(vec) ** 2
-    long_energy = float(np.sum(mag2[long_idx]))
-    lat_energy = float(np.sum(mag2[lat_idx]))
+    long_energy = float(np.sum(mag2[_LONG_IDX]))
+    lat_energy = float(np.sum(mag2[_LAT_IDX]))
     family = "longitudinal" if long_energy >= lat_energy else "lateral"
 
     sigma = float(np.real(eig))
@@ -215,3 +211,158 @@ def analyze_modal_structure(
         unstable_modes=unstable_modes,
         neutral_modes=neutral_modes,
     )
+
+
+@dataclass(frozen=True)
+class ModalStackResult:
+    """
+    Modal analysis of a stack of A matrices (n points, m = 9 dynamic eigenvalues each).
+
+    Columns are mode tracks: column j follows one eigenvalue continuously across the
+    stack (matched by eigenvector similarity), so eigenvalues[:, j] is a root-locus
+    branch. partner[k, j] is the column of the complex conjugate (j itself for real
+    roots). wn/zeta are NaN for real roots; min_damping_ratio is NaN without oscillatory
+    modes. track_type is the most frequent per-point classification of each track.
+    """
+
+    eigenvalues: np.ndarray
+    eigenvectors: np.ndarray
+    partner: np.ndarray
+    mode_type: np.ndarray
+    family: np.ndarray
+    wn: np.ndarray
+    zeta: np.ndarray
+    spectral_margin: np.ndarray
+    min_damping_ratio: np.ndarray
+    unstable_modes: np.ndarray
+    track_type: list[str]
+
+    def tracks(self, mode_type: str) -> list[int]:
+        """
+        Columns whose track_type is mode_type (both members of a conjugate pair).
+        """
+        return [j for j, t in enumerate(self.track_type) if t == mode_type]
+
+    def as_dict(self) -> dict:
+        def nullable(a: np.ndarray) -> list:
+            return np.where(np.isfinite(a), a, None).tolist()
+
+        return {
+            "eigenvalues_real": self.eigenvalues.real.tolist(),
+            "eigenvalues_imag": self.eigenvalues.imag.tolist(),
+            "partner": self.partner.tolist(),
+            "mode_type": self.mode_type.tolist(),
+            "family": self.family.tolist(),
+            "wn": nullable(self.wn),
+            "zeta": nullable(self.zeta),
+            "spectral_margin": self.spectral_margin.tolist(),
+            "min_damping_ratio": nullable(self.min_damping_ratio),
+            "unstable_modes": self.unstable_modes.tolist(),
+            "track_type": list(self.track_type),
+        }
+
+
+def _track_order(eigvals: np.ndarray, eigvecs: np.ndarray) -> np.ndarray:
+    """
+    Column permutation (n, m) that keeps each eigenvalue on one track across the stack.
+
+    Consecutive points are matched by a linear assignment on
+    (1 - |v_prev^H v|) + |lambda_prev - lambda| / (|lambda_prev| + |lambda|): eigenvector
+    similarity carries modes through near-crossings, the eigenvalue term separates the
+    two members of a conjugate pair (whose eigenvectors are equally similar).
+    """
+    n, m = eigvals.shape
+    order = np.empty((n, m), dtype=int)
+    order[0] = np.lexsort((-eigvals[0].imag, eigvals[0].real))
+    if n == 1:
+        return order
+    # All pairwise costs between raw columns of consecutive points, in one batch.
+    sim = np.abs(np.einsum("nji,njk->nik", np.conjugate(eigvecs[:-1]), eigvecs[1:]))
+    lam_prev, lam = eigvals[:-1, :, None], eigvals[1:, None, :]
+    dist = np.abs(lam_prev - lam) / np.maximum(np.abs(lam_prev) + np.abs(lam), 1e-12)
+    cost = (1.0 - sim) + dist
+    for k in range(1, n):
+        _, cols = linear_sum_assignment(cost[k - 1][order[k - 1]])
+        order[k] = cols
+    return order
+
+
+def analyze_modal_stack(
+    A_stack: np.ndarray,
+    *,
+    unstable_tol: float = 1e-8,
+    imag_tol: float = 1e-8,
+    pair_tol: float = 1e-6,
+) -> ModalStackResult:
+    """
+    Batched counterpart of analyze_modal_structure for a sweep (speed, gain, ...).
+
+    A_stack is (n, 12, 12) or (n, 9, 9), ordered along the sweep. One stacked
+    np.linalg.eig call; conjugate pairing and classification (same rules as
+    analyze_modal_structure) are vectorized, then modes are tracked point to point.
+    """
+    A = np.asarray(A_stack, dtype=float)
+    if A.ndim != 3:
+        raise ValueError(f"Expected A_stack shape (n,12,12) or (n,9,9), got {A.shape}")
+    if A.shape[1:] == (12, 12):
+        A = A[:, 3:12, 3:12]
+    elif A.shape[1:] != (9, 9):
+        raise ValueError(f"Expected A_stack shape (n,12,12) or (n,9,9), got {A.shape}")
+    eigvals, eigvecs = np.linalg.eig(A)
+    if not np.iscomplexobj(eigvals):
+        eigvals, eigvecs = eigvals.astype(complex), eigvecs.astype(complex)
+
+    order = _track_order(eigvals, eigvecs)
+    eigvals = np.take_along_axis(eigvals, order, axis=1)
+    eigvecs = np.take_along_axis(eigvecs, order[:, None, :], axis=2)
+    n, m = eigvals.shape
+
+    sigma, omega = eigvals.real, eigvals.imag
+    osc = np.abs(omega) > imag_tol
+    # Conjugate partner: nearest conj(lambda) among the other columns.
+    gap = np.abs(eigvals[:, :, None] - np.conjugate(eigvals)[:, None, :])
+    gap[:, np.arange(m), np.arange(m)] = np.inf
+    nearest = np.argmin(gap, axis=2)
+    paired = osc & (np.take_along_axis(gap, nearest[:, :, None], axis=2)[..., 0] < pair_tol)
+    partner = np.where(paired, nearest, np.arange(m)[None, :])
+
+    mag2 = np.abs(eigvecs) ** 2
+    longitudinal = mag2[:, _LONG_IDX, :].sum(axis=1) >= mag2[:, _LAT_IDX, :].sum(axis=1)
+    family = np.where(longitudinal, "longitudinal", "lateral")
+    wn_all = np.hypot(sigma, omega)
+    wn = np.where(osc, wn_all, np.nan)
+    zeta = np.where(osc, -sigma / np.maximum(wn_all, 1e-12), np.nan)
+    mode_type = np.select(
+        [
+            osc & longitudinal & (wn_all < 1.0),
+            osc & longitudinal,
+            osc,
+            longitudinal,
+            np.abs(sigma) < 0.05,
+            sigma < -0.5,
+        ],
+        ["phugoid", "short_period", "dutch_roll", "longitudinal_aperiodic", "spiral", "roll"],
+        default="lateral_aperiodic",
+    )
+
+    track_type = []
+    for j in range(m):
+        labels, counts = np.unique(mode_type[:, j], return_counts=True)
+        track_type.append(str(labels[np.argmax(counts)]))
+
+    min_zeta = np.full(n, np.nan)
+    has_osc = np.any(osc, axis=1)
+    min_zeta[has_osc] = np.nanmin(zeta[has_osc], axis=1)
+    return ModalStackResult(
+        eigenvalues=eigvals,
+        eigenvectors=eigvecs,
+        partner=partner,
+        mode_type=mode_type,
+        family=family,
+        wn=wn,
+        zeta=zeta,
+        spectral_margin=-np.max(sigma, axis=1),
+        min_damping_ratio=min_zeta,
+        unstable_modes=np.sum(sigma > unstable_tol, axis=1),
+        track_type=track_type,
+    )
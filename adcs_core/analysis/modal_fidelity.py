@@ -5,14 +5,12 @@ from dataclasses import dataclass
 import numpy as np
 from scipy.signal import find_peaks
 
-from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters
-from adcs_core.analysis.lqr_longitudinal import LONGITUDINAL_STATE_IDX_FULL
+from adcs_core.analysis.lqr_longitudinal import LONGITUDINAL_INPUT_IDX_FULL, LONGITUDINAL_STATE_IDX_FULL
+from adcs_core.analysis.simulation import StateFeedback, simulate
 from adcs_core.analysis.trim import TrimResult
-from adcs_core.dynamics.integrator import rk4_step
-from adcs_core.model import xdot_full
-from adcs_core.state.state_definition import ControlIndex, StateIndex
+from adcs_core.state.state_definition import StateIndex
 
 
 @dataclass(frozen=True)
@@ -64,35 +62,6 @@ def _apply_alpha_perturbation(x_trim: np.ndarray, alpha_perturb_deg: float) -> n
     return x0
 
 
-def _controller_from_state(
-    x: np.ndarray,
-    *,
-    x_trim: np.ndarray,
-    u_trim: np.ndarray,
-    limits: ActuatorLimits,
-    K: np.ndarray | None,
-) -> ControlInputs:
-    if K is None:
-        return ControlInputs(
-            throttle=float(u_trim[int(ControlIndex.THROTTLE)]),
-            aileron=0.0,
-            elevator=float(u_trim[int(ControlIndex.ELEVATOR)]),
-            rudder=0.0,
-        )
-    x_sub = np.asarray(x, dtype=float)[LONGITUDINAL_STATE_IDX_FULL]
-    x_ref = np.asarray(x_trim, dtype=float)[LONGITUDINAL_STATE_IDX_FULL]
-    du = -np.asarray(K, dtype=float) @ (x_sub - x_ref)
-    de = float(
-        np.clip(
-            float(u_trim[int(ControlIndex.ELEVATOR)]) + float(du[0]),
-            -limits.elevator_max_rad,
-            limits.elevator_max_rad,
-        )
-    )
-    thr = float(np.clip(float(u_trim[int(ControlIndex.THROTTLE)]) + float(du[1]), 0.0, 1.0))
-    return ControlInputs(throttle=thr, aileron=0.0, elevator=de, rudder=0.0)
-
-
 def _simulate_response(
     *,
     params: AircraftParameters,
@@ -102,26 +71,25 @@ def _simulate_response(
     tfinal_s: float,
     dt_s: float,
     alpha_perturb_deg: float,
+    method: str = "rk4",
+    rtol: float = 1e-8,
 ) -> tuple[np.ndarray, np.ndarray]:
-    t_hist = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s)
+    """
+    method="rk4" marches at dt_s; method="dopri45" steps adaptively and samples the
+    dense output on the same dt_s grid.
+    """
+    n_steps = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s).size - 1
     x = _apply_alpha_perturbation(trim.x0, alpha_perturb_deg=alpha_perturb_deg)
-    x_hist = np.zeros((t_hist.size, 12), dtype=float)
-
-    def f_dyn(tt: float, xx: np.ndarray) -> np.ndarray:
-        ctrl = _controller_from_state(
-            xx,
-            x_trim=trim.x0,
-            u_trim=trim.u0,
-            limits=limits,
-            K=K,
-        )
-        return xdot_full(xx, ctrl, params=params, limits=limits)
-
-    for i, tt in enumerate(t_hist):
-        x_hist[i] = x
-        if i < t_hist.size - 1:
-            x = rk4_step(f_dyn, float(tt), x, dt_s)
-    return t_hist, x_hist
+    controller = StateFeedback(
+        x_ref=trim.x0,
+        u_ref=trim.u0,
+        K=K,
+        state_idx=LONGITUDINAL_STATE_IDX_FULL,
+        input_idx=LONGITUDINAL_INPUT_IDX_FULL,
+        limits=limits,
+    )
+    sim = simulate(x, controller, dt_s, n_steps, params=params, limits=limits, method=method, rtol=rtol)
+    return sim.t, sim["state"]
 
 
 def _relative_error_percent(estimate: float, reference: float) -> float:
@@ -215,6 +183,7 @@ def validate_modal_fidelity(
     dt_s: float = 0.01,
     alpha_perturb_deg: float = 0.5,
     signal: str = "q",
+    method: str = "rk4",
 ) -> ModalFidelityResult:
     linear = linear_prediction_from_eigenvalue(eigenvalue)
     t_hist, x_hist = _simulate_response(
@@ -225,6 +194,7 @@ def validate_modal_fidelity(
         tfinal_s=tfinal_s,
         dt_s=dt_s,
         alpha_perturb_deg=alpha_perturb_deg,
+        method=method,
     )
 
     if signal == "q":
@@ -254,6 +224,7 @@ def estimate_unstable_growth_rate(
     dt_s: float = 0.01,
     alpha_perturb_deg: float = 0.5,
     fit_window_s: tuple[float, float] = (0.4, 2.0),
+    method: str = "rk4",
 ) -> UnstableGrowthEstimate:
     t_hist, x_hist = _simulate_response(
         params=params,
@@ -263,6 +234,7 @@ def estimate_unstable_growth_rate(
         tfinal_s=tfinal_s,
         dt_s=dt_s,
         alpha_perturb_deg=alpha_perturb_deg,
+        method=method,
     )
     x_ref = np.asarray(trim.x0, dtype=float)
     idx = np.asarray(LONGITUDINAL_STATE_IDX_FULL, dtype=int)
@@ -1,7 +1,9 @@
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 
-def run_monte_carlo(sim_fn, runs=20, seed: int | None = None):
+def run_monte_carlo(sim_fn, runs=20, seed: int | None = None, sampler: str = "random"):
     """
     Runs Monte Carlo simulations with stochastic wind gusts.
 
@@ -10,15 +12,28 @@ def run_monte_carlo(sim_fn, runs=20, seed: int | None = None):
                 states expected to be [N, state_dim], where col 3 is theta.
         runs: Number of iterations.
         seed: Optional deterministic seed for reproducible batches.
+        sampler: "random" (i.i.d. normal draws), or "sobol" / "lhs" for scrambled
+                 low-discrepancy gusts mapped through the normal inverse CDF. Sobol
+                 points are only balanced when runs is a power of two; other counts
+                 use the first runs points of the next power-of-two draw.
 
     Returns:
         List of result dictionaries.
     """
     results = []
     rng = np.random.default_rng(seed)
+    if sampler == "random":
+        winds = [float(rng.normal(0.0, 1.5)) for _ in range(runs)]  # m/s gust (sigma = 1.5)
+    elif sampler in ("sobol", "lhs"):
+        if sampler == "sobol":
+            u = qmc.Sobol(1, seed=rng).random_base2(max(0, int(np.ceil(np.log2(max(1, runs))))))[:runs, 0]
+        else:
+            u = qmc.LatinHypercube(1, seed=rng).random(runs)[:, 0]
+        winds = (1.5 * ndtri(np.clip(u, 1e-12, 1.0 - 1e-12))).tolist()
+    else:
+        raise ValueError(f"Unknown sampler '{sampler}'.")
 
-    for i in range(runs):
-        wind = float(rng.normal(0.0, 1.5))  # m/s gust (sigma = 1.5)
+    for i, wind in enumerate(winds):
         t, states = sim_fn(wind)
 
         # Assuming theta is index 3 (standard longitudinal state: u, w, q, theta)
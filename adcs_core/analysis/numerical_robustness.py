@@ -4,14 +4,12 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters
 from adcs_core.analysis.modal_estimators import estimator_invariance_from_signal, extract_peak_series
 from adcs_core.analysis.modal_fidelity import linear_prediction_from_eigenvalue
+from adcs_core.analysis.simulation import simulate
 from adcs_core.analysis.trim import TrimResult
-from adcs_core.dynamics.integrator import rk4_step
-from adcs_core.model import xdot_full
 from adcs_core.state.state_definition import ControlIndex, StateIndex
 
 
@@ -90,39 +88,27 @@ def _simulate_signal(
     alpha_perturb_deg: float,
     signal: str,
 ) -> tuple[np.ndarray, np.ndarray]:
-    t = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s)
+    n_steps = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s).size - 1
     x = _apply_alpha_perturbation(trim.x0, alpha_perturb_deg=alpha_perturb_deg)
     x0 = np.asarray(trim.x0, dtype=float)
 
     u_trim = np.asarray(trim.u0, dtype=float)
-    ctrl = ControlInputs(
-        throttle=float(u_trim[int(ControlIndex.THROTTLE)]),
-        aileron=0.0,
-        elevator=float(u_trim[int(ControlIndex.ELEVATOR)]),
-        rudder=0.0,
-    )
-
-    y = np.zeros_like(t)
-    for i, tt in enumerate(t):
-        if signal == "w":
-            y[i] = float(x[int(StateIndex.W)] - x0[int(StateIndex.W)])
-        elif signal == "q":
-            y[i] = float(x[int(StateIndex.Q)] - x0[int(StateIndex.Q)])
-        elif signal == "alpha":
-            y[i] = float(
-                np.arctan2(x[int(StateIndex.W)], x[int(StateIndex.U)])
-                - np.arctan2(x0[int(StateIndex.W)], x0[int(StateIndex.U)])
-            )
-        else:
-            raise ValueError(f"Unsupported signal '{signal}'")
-        if i < t.size - 1:
-            x = rk4_step(
-                lambda _t, xx: xdot_full(xx, ctrl, params=params, limits=limits),
-                float(tt),
-                x,
-                dt_s,
-            )
-    return t, y
+    u_open = np.zeros(4, dtype=float)
+    u_open[int(ControlIndex.THROTTLE)] = u_trim[int(ControlIndex.THROTTLE)]
+    u_open[int(ControlIndex.ELEVATOR)] = u_trim[int(ControlIndex.ELEVATOR)]
+
+    if signal == "w":
+        channel = lambda X, _U: X[:, int(StateIndex.W)] - x0[int(StateIndex.W)]  # noqa: E731
+    elif signal == "q":
+        channel = lambda X, _U: X[:, int(StateIndex.Q)] - x0[int(StateIndex.Q)]  # noqa: E731
+    elif signal == "alpha":
+        alpha0 = np.arctan2(x0[int(StateIndex.W)], x0[int(StateIndex.U)])
+        channel = lambda X, _U: np.arctan2(X[:, int(StateIndex.W)], X[:, int(StateIndex.U)]) - alpha0  # noqa: E731
+    else:
+        raise ValueError(f"Unsupported signal '{signal}'")
+
+    sim = simulate(x, u_open, dt_s, n_steps, params=params, limits=limits, record={"y": channel})
+    return sim.t, sim["y"]
 
 
 def _observed_order(errors: list[float], *, tol: float = 1e-9) -> float | None:
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from adcs_core.aircraft.compiled import CompiledAircraft, parameters_fingerprint, resolve_parameters
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.modal_analysis import ModalAnalysisResult, analyze_modal_structure
+from adcs_core.analysis.result_store import ResultStore, code_revision
+from adcs_core.analysis.trim import TrimResult, compute_level_trim
+from adcs_core.dynamics.jacobian import linearize_xdot_full
+
+# Bump when the OperatingPoint layout changes; solver edits are covered by code_revision().
+OPERATING_POINT_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True)
+class OperatingPoint:
+    """
+    Solved level-flight operating point: trim, full (A, B), eigenvalues and modal structure.
+    Arrays are read-only because entries are shared between callers.
+    """
+
+    key: str
+    trim: TrimResult
+    A: np.ndarray
+    B: np.ndarray
+    eigenvalues: np.ndarray
+    modal: ModalAnalysisResult
+
+
+def operating_point_key(
+    params: AircraftParameters | CompiledAircraft,
+    limits: ActuatorLimits,
+    V_mps: float,
+    *,
+    aircraft_category: str = "stable",
+    residual_tol: float = 1e-6,
+    method: str = "batch",
+    scheme: str = "central",
+) -> str:
+    """
+    Content hash of everything that determines an OperatingPoint. Flight condition enters
+    through the parameters (density from altitude/ISA offset) and V_mps.
+    """
+    raw = params.params if isinstance(params, CompiledAircraft) else params
+    h = hashlib.sha256(f"OperatingPoint/v{OPERATING_POINT_CACHE_VERSION}/{code_revision()}".encode("utf-8"))
+    h.update(parameters_fingerprint(raw, limits).encode("utf-8"))
+    h.update(float(V_mps).hex().encode("utf-8"))
+    h.update(float(residual_tol).hex().encode("utf-8"))
+    h.update(f"{aircraft_category.lower()}|{method}|{scheme}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _freeze(a: np.ndarray) -> np.ndarray:
+    a = np.array(a, copy=True)
+    a.setflags(write=False)
+    return a
+
+
+def solve_operating_point(
+    params: AircraftParameters | CompiledAircraft,
+    limits: ActuatorLimits,
+    V_mps: float,
+    *,
+    aircraft_category: str = "stable",
+    residual_tol: float = 1e-6,
+    method: str = "batch",
+    scheme: str = "central",
+    key: str | None = None,
+) -> OperatingPoint:
+    """
+    Uncached trim + linearization + modal analysis (raises like compute_level_trim).
+    """
+    trim = compute_level_trim(
+        V_mps, params, limits=limits, residual_tol=residual_tol, aircraft_category=aircraft_category
+    )
+    trim = replace(trim, x0=_freeze(trim.x0), u0=_freeze(trim.u0))
+    A, B = linearize_xdot_full(trim.x0, trim.u0, params, limits, method=method, scheme=scheme)
+    if key is None:
+        key = operating_point_key(
+            params, limits, V_mps, aircraft_category=aircraft_category, residual_tol=residual_tol, method=method, scheme=scheme
+        )
+    return OperatingPoint(
+        key=key,
+        trim=trim,
+        A=_freeze(A),
+        B=_freeze(B),
+        eigenvalues=_freeze(np.linalg.eigvals(A)),
+        modal=analyze_modal_structure(A),
+    )
+
+
+class OperatingPointCache:
+    """
+    Thread-safe LRU of solved operating points keyed by operating_point_key.
+
+    With a ResultStore attached, solved entries are written through to disk and memory
+    misses are looked up there first, so a restarted process reuses earlier solves.
+    Counters: hits, disk_hits, misses, evictions.
+    """
+
+    def __init__(self, maxsize: int = 128, *, store: ResultStore | None = None) -> None:
+        if int(maxsize) < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = int(maxsize)
+        self.store = store
+        self._entries: OrderedDict[str, OperatingPoint] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        params: AircraftParameters | CompiledAircraft | None,
+        limits: ActuatorLimits | None,
+        V_mps: float,
+        *,
+        aircraft_category: str = "stable",
+        residual_tol: float = 1e-6,
+        method: str = "batch",
+        scheme: str = "central",
+    ) -> OperatingPoint:
+        params, limits = resolve_parameters(params, limits)
+        key = operating_point_key(
+            params, limits, V_mps, aircraft_category=aircraft_category, residual_tol=residual_tol, method=method, scheme=scheme
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._load_stored(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            # Solved outside the lock; concurrent misses on one key may both solve.
+            entry = solve_operating_point(
+                params,
+                limits,
+                V_mps,
+                aircraft_category=aircraft_category,
+                residual_tol=residual_tol,
+                method=method,
+                scheme=scheme,
+                key=key,
+            )
+            if self.store is not None:
+                self.store.put(key, entry)
+        else:
+            with self._lock:
+                self.disk_hits += 1
+        self._insert(entry)
+        return entry
+
+    def _insert(self, entry: OperatingPoint) -> None:
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _load_stored(self, key: str) -> OperatingPoint | None:
+        if self.store is None:
+            return None
+        entry = self.store.get(key)
+        if not isinstance(entry, OperatingPoint) or entry.key != key:
+            return None
+        # Unpickled arrays come back writeable; restore the shared-entry guarantee.
+        return replace(
+            entry,
+            trim=replace(entry.trim, x0=_freeze(entry.trim.x0), u0=_freeze(entry.trim.u0)),
+            A=_freeze(entry.A),
+            B=_freeze(entry.B),
+            eigenvalues=_freeze(entry.eigenvalues),
+        )
+
+    def stats(self) -> dict[str, int | str | None]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "store": None if self.store is None else str(self.store.root),
+            }
+
+    def clear(self) -> None:
+        """
+        Drop in-memory entries and reset counters (stored files are kept).
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+
+_DEFAULT_CACHE = OperatingPointCache()
+
+
+def default_operating_point_cache() -> OperatingPointCache:
+    """
+    Process-wide cache shared by the backend analysis endpoints and the sim runtime.
+    """
+    return _DEFAULT_CACHE
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+
+from adcs_core.aircraft.compiled import CompiledAircraft, parameters_fingerprint
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+
+# Bump when the stored record layout changes; entries of other versions are ignored.
+RESULT_STORE_VERSION = 2
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+T = TypeVar("T")
+
+
+def _hash_part(h: Any, part: Any) -> None:
+    if isinstance(part, CompiledAircraft):
+        part = part.params
+    if isinstance(part, AircraftParameters):
+        h.update(b"P" + parameters_fingerprint(part).encode("utf-8"))
+    elif isinstance(part, ActuatorLimits):
+        h.update(b"L")
+        for f in fields(ActuatorLimits):
+            _hash_part(h, float(getattr(part, f.name)))
+    elif part is None:
+        h.update(b"N")
+    elif isinstance(part, (bool, str)):
+        h.update(b"S" + repr(part).encode("utf-8"))
+    elif isinstance(part, (int, np.integer)):
+        h.update(b"I" + str(int(part)).encode("utf-8"))
+    elif isinstance(part, (float, np.floating)):
+        h.update(b"F" + float(part).hex().encode("utf-8"))
+    elif isinstance(part, (np.ndarray, list, tuple)):
+        arr = np.ascontiguousarray(np.asarray(part))
+        if arr.dtype == object:
+            h.update(b"T" + str(len(part)).encode("utf-8"))
+            for item in part:
+                _hash_part(h, item)
+            return
+        h.update(b"A" + f"{arr.dtype.str}{arr.shape}".encode("utf-8"))
+        h.update(arr.tobytes())
+    else:
+        raise TypeError(f"Cannot fingerprint result-store key part of type {type(part).__name__}.")
+
+
+@lru_cache(maxsize=1)
+def code_revision() -> str:
+    """
+    Hash of the adcs_core sources. It is part of every stored key, so a change to a solver
+    or model invalidates earlier results without a manual version bump.
+    """
+    h = hashlib.sha256()
+    for path in sorted(_PACKAGE_ROOT.rglob("*.py")):
+        h.update(path.relative_to(_PACKAGE_ROOT).as_posix().encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def result_key(kind: str, *parts: Any) -> str:
+    """
+    Deterministic key (sha256 hex) for a stored result. parts may be AircraftParameters,
+    CompiledAircraft, ActuatorLimits, numbers, strings, None or arrays (solver settings,
+    weights); equal inputs give equal keys across processes and sessions of the same
+    code_revision().
+    """
+    h = hashlib.sha256(f"ResultStore/v{RESULT_STORE_VERSION}/{code_revision()}/{kind}".encode("utf-8"))
+    for part in parts:
+        _hash_part(h, part)
+    return h.hexdigest()
+
+
+def _owned_by_us(st: os.stat_result) -> bool:
+    """
+    True if a stored file may be unpickled: owned by this user and not group/other
+    writable. Always true where there are no POSIX owners (Windows).
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+@dataclass(frozen=True)
+class _Record:
+    version: int
+    key: str
+    value: Any
+
+
+class ResultStore:
+    """
+    File-backed, size-bounded store of solved results (trim, operating points, gains).
+
+    Entries are pickled to <root>/v<version>/<key[:2]>/<key>.pkl with atomic renames, so
+    concurrent processes can share a directory. Reads refresh the file mtime and the
+    least recently used files are deleted once the total size exceeds max_bytes.
+    I/O errors are treated as misses so a read-only or full disk only costs recomputes.
+
+    Directories are created with mode 0700, and (on POSIX) only entries owned by the
+    current user and not writable by group or others are unpickled; anything else,
+    including symlinks, is a miss, so a shared or pre-created root cannot inject pickles.
+    """
+
+    def __init__(self, root: str | Path, *, max_bytes: int = 256 * 1024 * 1024, version: int = RESULT_STORE_VERSION) -> None:
+        if int(max_bytes) < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.root = Path(root)
+        self.version = int(version)
+        self.max_bytes = int(max_bytes)
+        self._dir = self.root / f"v{self.version}"
+        self._lock = threading.Lock()
+        self._size: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.pkl"
+
+    def _files(self) -> list[tuple[int, int, Path]]:
+        """
+        (mtime_ns, size, path) of every entry, oldest first.
+        """
+        out = []
+        for p in self._dir.glob("*/*.pkl") if self._dir.is_dir() else ():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out.append((st.st_mtime_ns, st.st_size, p))
+        out.sort()
+        return out
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        record = None
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0))
+            with os.fdopen(fd, "rb") as fh:
+                if _owned_by_us(os.fstat(fh.fileno())):
+                    record = pickle.load(fh)
+            if record is not None:
+                os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            record = None
+        ok = isinstance(record, _Record) and record.version == self.version and record.key == key
+        with self._lock:
+            if ok:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return record.value if ok else default
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        data = pickle.dumps(_Record(self.version, key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            for d in (self.root, self._dir, path.parent):
+                d.mkdir(mode=0o700, parents=True, exist_ok=True)
+            old = path.stat().st_size if path.exists() else 0
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            return
+        with self._lock:
+            self.writes += 1
+            if self._size is not None:
+                self._size += len(data) - old
+        self._evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], T]) -> T:
+        """
+        Stored value for key, or compute(), store and return it.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._size is not None and self._size <= self.max_bytes:
+                return
+            files = self._files()
+            self._size = sum(size for _, size, _ in files)
+            for _, size, p in files:
+                if self._size <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except OSError:
+                    continue
+                self._size -= size
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int | str]:
+        files = self._files()
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "version": self.version,
+                "entries": len(files),
+                "bytes": sum(size for _, size, _ in files),
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        """
+        Delete every entry of this version and reset counters.
+        """
+        for _, _, p in self._files():
+            try:
+                p.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+            self.hits = self.misses = self.writes = self.evictions = 0
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import linalg
+
+
+@dataclass(frozen=True)
+class CareSolution:
+    """
+    Stabilizing solution P of A'P + PA - PBR^-1B'P + Q = 0 and K = R^-1 B'P.
+    method is "newton-kleinman" (warm-started) or "schur" (scipy, cold).
+    """
+
+    P: np.ndarray
+    K: np.ndarray
+    iterations: int
+    method: str
+
+
+def _is_hurwitz(A: np.ndarray) -> bool:
+    return bool(np.all(np.real(np.linalg.eigvals(A)) < 0.0))
+
+
+def solve_care(
+    A: np.ndarray,
+    B: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    *,
+    P0: np.ndarray | None = None,
+    tol: float = 1e-10,
+    max_iter: int = 25,
+) -> CareSolution:
+    """
+    Continuous-time algebraic Riccati equation with an optional warm start.
+
+    With P0 (e.g. the solution for nearby weights) whose gain stabilizes A, runs
+    Newton-Kleinman: each step solves one Lyapunov equation for the closed loop of the
+    current gain, converging quadratically and staying stabilizing; it stops once the
+    gain update is below tol (relative) or stalls at round-off. Falls back to
+    scipy.linalg.solve_continuous_are when there is no usable warm start or the
+    iteration does not settle within max_iter.
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    R = np.asarray(R, dtype=float)
+    RinvBt = np.linalg.solve(R, B.T)
+
+    if P0 is not None and np.shape(P0) == A.shape:
+        K = RinvBt @ np.asarray(P0, dtype=float)
+        if _is_hurwitz(A - B @ K):
+            prev_step = np.inf
+            for it in range(1, int(max_iter) + 1):
+                Acl = A - B @ K
+                P = linalg.solve_continuous_lyapunov(Acl.T, -(Q + K.T @ R @ K))
+                P = 0.5 * (P + P.T)
+                K_next = RinvBt @ P
+                if not np.all(np.isfinite(K_next)):
+                    break
+                step = float(np.max(np.abs(K_next - K)))
+                K = K_next
+                scale = max(1.0, float(np.max(np.abs(K))))
+                # Converged, or quadratic convergence has hit the Lyapunov round-off floor.
+                if step <= tol * scale or (step >= prev_step and step <= 1e3 * tol * scale):
+                    return CareSolution(P=P, K=K, iterations=it, method="newton-kleinman")
+                prev_step = step
+
+    P = linalg.solve_continuous_are(A, B, Q, R)
+    return CareSolution(P=P, K=RinvBt @ P, iterations=0, method="schur")
+
+
+class RiccatiSession:
+    """
+    Repeated CARE solves for one plant (A, B) while Q/R change, each warm-started from
+    the previous solution. Intended for interactive weight tuning; safe to share
+    between request threads.
+    """
+
+    def __init__(self, A: np.ndarray, B: np.ndarray) -> None:
+        self.A = np.asarray(A, dtype=float)
+        self.B = np.asarray(B, dtype=float)
+        self._P: np.ndarray | None = None
+        self._lock = threading.Lock()
+
+    def solve(self, Q: np.ndarray, R: np.ndarray) -> CareSolution:
+        with self._lock:
+            sol = solve_care(self.A, self.B, Q, R, P0=self._P)
+            self._P = sol.P
+        return sol
+
+
+def _lyapunov_batch(Acl: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """
+    Solve Acl[i]' P + P Acl[i] = -M[i] for a stack of small systems via the Kronecker
+    form (one batched dense solve of size nx^2).
+    """
+    n, nx, _ = Acl.shape
+    I = np.eye(nx)
+    At = np.swapaxes(Acl, 1, 2)
+    L = np.einsum("nij,kl->nikjl", At, I) + np.einsum("ij,nkl->nikjl", I, At)
+    P = np.linalg.solve(L.reshape(n, nx * nx, nx * nx), -M.reshape(n, nx * nx, 1)).reshape(n, nx, nx)
+    return 0.5 * (P + np.swapaxes(P, 1, 2))
+
+
+def solve_care_batch(
+    A: np.ndarray,
+    B: np.ndarray,
+    Q: np.ndarray,
+    R: np.ndarray,
+    *,
+    P0: np.ndarray | None = None,
+    tol: float = 1e-10,
+    max_iter: int = 30,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    CARE for one (A, B) and a stack of weights Q (n, nx, nx), R (n, nu, nu).
+
+    Newton-Kleinman runs in lockstep over the whole stack, seeded from P0 or, by default,
+    one Schur solve at the point with the heaviest R: by the LQR gain margin the seeded
+    gain stays stabilizing wherever R is no more than twice as heavy per channel. Points
+    whose seed does not stabilize, or that do not converge, are re-solved with Schur.
+    Returns (P, K, iterations) with iterations 0 for Schur solves.
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    R = np.asarray(R, dtype=float)
+    n = Q.shape[0]
+    Bt = np.broadcast_to(B.T, (n,) + B.T.shape)
+    if P0 is None:
+        seed = int(np.argmax(np.min(np.diagonal(R, axis1=1, axis2=2), axis=1)))
+        P0 = linalg.solve_continuous_are(A, B, Q[seed], R[seed])
+    K = np.linalg.solve(R, Bt @ np.asarray(P0, dtype=float))
+    P = np.broadcast_to(np.asarray(P0, dtype=float), Q.shape).copy()
+    iterations = np.zeros(n, dtype=int)
+
+    active = np.all(np.real(np.linalg.eigvals(A[None] - B[None] @ K)) < 0.0, axis=1)
+    done = np.zeros(n, dtype=bool)
+    prev_step = np.full(n, np.inf)
+    for it in range(1, int(max_iter) + 1):
+        idx = np.flatnonzero(active & ~done)
+        if idx.size == 0:
+            break
+        Ki = K[idx]
+        Pi = _lyapunov_batch(A[None] - B[None] @ Ki, Q[idx] + np.swapaxes(Ki, 1, 2) @ R[idx] @ Ki)
+        K_next = np.linalg.solve(R[idx], Bt[idx] @ Pi)
+        finite = np.all(np.isfinite(K_next), axis=(1, 2))
+        step = np.max(np.abs(K_next - Ki), axis=(1, 2))
+        scale = np.maximum(1.0, np.max(np.abs(K_next), axis=(1, 2)))
+        K[idx], P[idx], iterations[idx] = K_next, Pi, it
+        conv = (step <= tol * scale) | ((step >= prev_step[idx]) & (step <= 1e3 * tol * scale))
+        prev_step[idx] = step
+        done[idx[conv & finite]] = True
+        active[idx[~finite]] = False
+
+    for i in np.flatnonzero(~done):
+        P[i] = linalg.solve_continuous_are(A, B, Q[i], R[i])
+        K[i] = np.linalg.solve(R[i], B.T @ P[i])
+        iterations[i] = 0
+    return P, K, iterations
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Mapping, Sequence
+
+import numpy as np
+
+from adcs_core.aircraft.compiled import CompiledAircraft, compile_aircraft
+from adcs_core.aircraft.forces_moments import ActuatorLimits, clamp_controls_batch
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.dynamics.integrator import Rk4Workspace, integrate_dopri45, rk4_step_inplace
+from adcs_core.model import xdot_full_batch
+from adcs_core.state.state_definition import StateIndex
+
+# (t, X[N, 12]) -> U[N, 4] ordered as ControlIndex
+Controller = Callable[[float, np.ndarray], np.ndarray]
+# X[N, 12], U[N, 4] -> per-member channel value, shape (N,) or (N, ...)
+Channel = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+@dataclass(frozen=True)
+class StateFeedback:
+    """
+    u = clamp(u_ref + scatter(input_idx, -K (x[state_idx] - x_ref[state_idx]))).
+
+    x_ref/u_ref may be single vectors or per-member stacks (N, 12)/(N, 4); K may be
+    (m, k) shared or (N, m, k) per member, so one call can run many controllers.
+    K=None holds u_ref (open loop).
+    """
+
+    x_ref: np.ndarray
+    u_ref: np.ndarray
+    K: np.ndarray | None = None
+    state_idx: Sequence[int] = ()
+    input_idx: Sequence[int] = ()
+    limits: ActuatorLimits = field(default_factory=ActuatorLimits)
+
+    def __call__(self, t: float, X: np.ndarray) -> np.ndarray:
+        X = np.atleast_2d(X)
+        n = X.shape[0]
+        U = np.array(np.broadcast_to(np.asarray(self.u_ref, dtype=float), (n, 4)), dtype=float)
+        if self.K is None:
+            return U
+        s_idx = np.asarray(self.state_idx, dtype=int)
+        i_idx = np.asarray(self.input_idx, dtype=int)
+        x_ref = np.atleast_2d(np.asarray(self.x_ref, dtype=float))
+        dx = X[:, s_idx] - x_ref[:, s_idx]
+        K = np.asarray(self.K, dtype=float)
+        if K.ndim == 2:
+            du = dx @ (-K).T
+        else:
+            du = np.einsum("nij,nj->ni", -K, dx)
+        U[:, i_idx] = U[:, i_idx] + du
+        return clamp_controls_batch(U, self.limits)
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """
+    t: (n_steps + 1,) sample times. channels[name]: (n_steps + 1, ...) for a single
+    initial condition, or (n_steps + 1, N, ...) for a batch.
+    """
+
+    t: np.ndarray
+    channels: dict[str, np.ndarray]
+    nfev: int
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.channels[name]
+
+
+def _builtin_channel(name: str) -> Channel:
+    if name == "state":
+        return lambda X, U: X
+    if name == "controls":
+        return lambda X, U: U
+    if name == "alpha":
+        return lambda X, U: np.arctan2(X[:, int(StateIndex.W)], X[:, int(StateIndex.U)])
+    try:
+        idx = int(StateIndex[name.upper()])
+    except KeyError as exc:
+        raise ValueError(f"Unknown record channel '{name}'.") from exc
+    return lambda X, U: X[:, idx]
+
+
+def _resolve_channels(record: Sequence[str] | Mapping[str, Channel]) -> dict[str, Channel]:
+    if isinstance(record, Mapping):
+        return {str(k): (_builtin_channel(v) if isinstance(v, str) else v) for k, v in record.items()}
+    return {str(name): _builtin_channel(str(name)) for name in record}
+
+
+def simulate(
+    x0: np.ndarray,
+    controller: Controller | np.ndarray,
+    dt: float,
+    n_steps: int,
+    *,
+    params: AircraftParameters | CompiledAircraft | None = None,
+    limits: ActuatorLimits | None = None,
+    record: Sequence[str] | Mapping[str, Channel] = ("state",),
+    t0: float = 0.0,
+    method: str = "rk4",
+    rtol: float = 1e-8,
+) -> SimulationResult:
+    """
+    Closed-loop nonlinear trajectory engine shared by the analysis tools.
+
+    x0 is (12,) or a batch (N, 12) advanced in lockstep through the vectorized dynamics.
+    controller is evaluated at every integrator stage (continuous feedback); a fixed
+    (4,)/(N, 4) control array may be given instead. Only the requested channels are
+    stored: names "state", "controls", "alpha", any StateIndex name ("q", "theta", ...),
+    or a mapping of name -> callable(X, U) for derived signals.
+
+    method="rk4" steps at dt in place; method="dopri45" integrates adaptively and
+    samples the dense output on the same grid.
+    """
+    pack = compile_aircraft(AircraftParameters() if params is None else params, limits)
+    limits = pack.limits
+    x0_arr = np.asarray(x0, dtype=float)
+    single = x0_arr.ndim == 1
+    X = np.atleast_2d(x0_arr).copy()
+    n = X.shape[0]
+    n_steps = int(n_steps)
+
+    if callable(controller):
+        ctrl = controller
+    else:
+        U_fixed = np.array(np.broadcast_to(np.asarray(controller, dtype=float), (n, 4)), dtype=float)
+        ctrl = lambda _t, _X: U_fixed  # noqa: E731
+
+    channels = _resolve_channels(record)
+    t = float(t0) + float(dt) * np.arange(n_steps + 1, dtype=float)
+    out: dict[str, np.ndarray] = {}
+    nfev = 0
+
+    def f_into(tt: float, XX: np.ndarray, dX: np.ndarray) -> np.ndarray:
+        nonlocal nfev
+        nfev += 1
+        return xdot_full_batch(XX, ctrl(tt, XX), params=pack, limits=limits, out=dX)
+
+    def store(i: int, XX: np.ndarray, tt: float) -> None:
+        UU = ctrl(tt, XX)
+        for name, fn in channels.items():
+            val = np.asarray(fn(XX, UU), dtype=float)
+            if name not in out:
+                out[name] = np.empty((n_steps + 1,) + val.shape, dtype=float)
+            out[name][i] = val
+
+    if method == "rk4":
+        work = Rk4Workspace.for_shape(X.shape)
+        for i in range(n_steps + 1):
+            store(i, X, float(t[i]))
+            if i < n_steps:
+                rk4_step_inplace(f_into, float(t[i]), X, float(dt), out=X, work=work)
+    elif method == "dopri45":
+        shape = X.shape
+
+        def f_flat(tt: float, xf: np.ndarray) -> np.ndarray:
+            return f_into(tt, xf.reshape(shape), np.empty(shape, dtype=float)).reshape(-1)
+
+        if n_steps > 0:
+            sol = integrate_dopri45(f_flat, (float(t[0]), float(t[-1])), X.reshape(-1), t_eval=t, rtol=rtol, atol=1e-3 * rtol)
+            if not sol.success:
+                raise RuntimeError(f"Adaptive integration failed: {sol.message}")
+            states = sol.x.reshape((t.size,) + shape)
+        else:
+            states = X[None]
+        for i in range(n_steps + 1):
+            store(i, states[i], float(t[i]))
+    else:
+        raise ValueError(f"Unknown integration method '{method}'.")
+
+    if single:
+        out = {k: v[:, 0] for k, v in out.items()}
+    return SimulationResult(t=t, channels=out, nfev=int(nfev))
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable log-bucket quantile sketch (DDSketch-style) for every element of an array.
+
+    Each element keeps counts over 2K+1 signed buckets: |x| in
+    (min_value * gamma^(k-1), min_value * gamma^k] with gamma = (1 + a) / (1 - a), plus a
+    zero bucket for |x| <= min_value. Quantiles are then within relative error a
+    (values beyond max_value are clamped to the last bucket). Memory depends only on the
+    element shape and accuracy (about 4 kB per element with the defaults), never on the
+    number of samples; merging adds counts.
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int] | int,
+        *,
+        relative_accuracy: float = 0.02,
+        min_value: float = 1e-4,
+        max_value: float = 1e5,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        if not 0.0 < min_value < max_value:
+            raise ValueError("Need 0 < min_value < max_value")
+        self.shape = (int(shape),) if np.isscalar(shape) else tuple(int(s) for s in shape)
+        self.relative_accuracy = float(relative_accuracy)
+        self.min_value = float(min_value)
+        self.max_value = float(max_value)
+        self._log_gamma = float(np.log((1.0 + relative_accuracy) / (1.0 - relative_accuracy)))
+        self._K = int(np.ceil(np.log(max_value / min_value) / self._log_gamma))
+        self.counts = np.zeros((int(np.prod(self.shape)), 2 * self._K + 1), dtype=np.int32)
+
+    @property
+    def n_buckets(self) -> int:
+        return 2 * self._K + 1
+
+    def _positions(self, x: np.ndarray) -> np.ndarray:
+        mag = np.abs(x)
+        with np.errstate(divide="ignore"):
+            k = np.ceil(np.log(np.maximum(mag, self.min_value) / self.min_value) / self._log_gamma)
+        k = np.where(mag <= self.min_value, 0, np.clip(k, 1, self._K)).astype(np.int64)
+        return self._K + np.sign(x).astype(np.int64) * k
+
+    def update(self, x: np.ndarray) -> None:
+        """
+        Add one sample per element (x of the sketch shape) or a batch (k, *shape). NaNs are skipped.
+        """
+        x = np.asarray(x, dtype=float).reshape(-1, self.counts.shape[0])
+        ok = np.isfinite(x)
+        elem = np.broadcast_to(np.arange(self.counts.shape[0]), x.shape)[ok]
+        lin = elem * self.n_buckets + self._positions(x[ok])
+        flat = self.counts.reshape(-1)
+        if x.shape[0] == 1:
+            flat[lin] += 1
+        else:
+            flat += np.bincount(lin, minlength=flat.size).astype(flat.dtype)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.counts.shape != self.counts.shape or other._log_gamma != self._log_gamma or other.min_value != self.min_value:
+            raise ValueError("Cannot merge quantile sketches with different layouts.")
+        self.counts += other.counts
+
+    def _values(self) -> np.ndarray:
+        k = np.abs(np.arange(self.n_buckets) - self._K)
+        # Midpoint that bounds the relative error of every value in the bucket.
+        mag = np.where(k == 0, 0.0, self.min_value * 2.0 * np.exp(k * self._log_gamma) / (1.0 + np.exp(self._log_gamma)))
+        return np.sign(np.arange(self.n_buckets) - self._K) * mag
+
+    def quantile(self, q: float | Sequence[float]) -> np.ndarray:
+        """
+        Quantile(s) per element: shape (*shape,) for scalar q, (len(q), *shape) otherwise.
+        Elements without samples are NaN.
+        """
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if np.any((qs < 0.0) | (qs > 1.0)):
+            raise ValueError("Quantiles must be in [0, 1].")
+        cum = np.cumsum(self.counts, axis=1)
+        n = cum[:, -1]
+        values = self._values()
+        out = np.full((qs.size, self.counts.shape[0]), np.nan)
+        has = n > 0
+        for i, qi in enumerate(qs):
+            rank = np.floor(qi * (n[has] - 1))
+            idx = np.argmax(cum[has] > rank[:, None], axis=1)
+            out[i, has] = values[idx]
+        out = out.reshape((qs.size,) + self.shape)
+        return out[0] if np.ndim(q) == 0 else out
+
+
+class SignalStats:
+    """
+    Streaming statistics of one signal of fixed shape (e.g. a time history (n_time,)):
+    Welford/Chan mean and variance, min/max, exceedance counts and a QuantileSketch,
+    all per element. Non-finite samples are ignored element by element.
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int] | int,
+        *,
+        thresholds: Iterable[float] = (),
+        relative_accuracy: float = 0.02,
+        min_value: float = 1e-4,
+        max_value: float = 1e5,
+    ) -> None:
+        self.sketch = QuantileSketch(shape, relative_accuracy=relative_accuracy, min_value=min_value, max_value=max_value)
+        self.shape = self.sketch.shape
+        self.thresholds = np.asarray(tuple(thresholds), dtype=float)
+        self.count = np.zeros(self.shape, dtype=np.int64)
+        self.mean = np.zeros(self.shape, dtype=float)
+        self.m2 = np.zeros(self.shape, dtype=float)
+        self.min = np.full(self.shape, np.inf)
+        self.max = np.full(self.shape, -np.inf)
+        self.exceed = np.zeros((self.thresholds.size,) + self.shape, dtype=np.int64)
+
+    def layout(self) -> dict:
+        """
+        Constructor arguments of an empty SignalStats with this layout (small and picklable).
+        """
+        s = self.sketch
+        return {
+            "shape": self.shape,
+            "thresholds": tuple(self.thresholds.tolist()),
+            "relative_accuracy": s.relative_accuracy,
+            "min_value": s.min_value,
+            "max_value": s.max_value,
+        }
+
+    def empty_like(self) -> "SignalStats":
+        return SignalStats(**self.layout())
+
+    def _combine(self, n_b: np.ndarray, mean_b: np.ndarray, m2_b: np.ndarray) -> None:
+        # Chan et al. pairwise update; reduces to Welford for a single sample.
+        n_a = self.count
+        n = n_a + n_b
+        safe = np.maximum(n, 1)
+        delta = mean_b - self.mean
+        self.mean = np.where(n > 0, self.mean + delta * (n_b / safe), self.mean)
+        self.m2 = self.m2 + m2_b + delta * delta * (n_a * n_b / safe)
+        self.count = n
+
+    def update(self, x: np.ndarray) -> None:
+        """
+        Add one sample (x of the signal shape) or a batch of runs (k, *shape).
+        """
+        x = np.asarray(x, dtype=float)
+        batch = x.reshape((-1,) + self.shape)
+        ok = np.isfinite(batch)
+        n_b = ok.sum(axis=0)
+        xz = np.where(ok, batch, 0.0)
+        mean_b = xz.sum(axis=0) / np.maximum(n_b, 1)
+        m2_b = np.where(ok, (batch - mean_b) ** 2, 0.0).sum(axis=0)
+        self._combine(n_b, mean_b, m2_b)
+        self.min = np.minimum(self.min, np.where(ok, batch, np.inf).min(axis=0))
+        self.max = np.maximum(self.max, np.where(ok, batch, -np.inf).max(axis=0))
+        if self.thresholds.size:
+            thr = self.thresholds.reshape((-1, 1) + (1,) * len(self.shape))
+            self.exceed += np.sum(ok[None] & (batch[None] > thr), axis=1)
+        self.sketch.update(batch)
+
+    def merge(self, other: "SignalStats") -> None:
+        if other.shape != self.shape or not np.array_equal(other.thresholds, self.thresholds):
+            raise ValueError("Cannot merge SignalStats with different shapes or thresholds.")
+        self._combine(other.count, other.mean, other.m2)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.exceed += other.exceed
+        self.sketch.merge(other.sketch)
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.variance(ddof))
+
+    def exceedance_fraction(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.exceed / np.maximum(self.count, 1), np.nan)
+
+    def as_dict(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> dict:
+        def nullable(a: np.ndarray) -> list:
+            a = np.asarray(a, dtype=float)
+            return np.where(np.isfinite(a), a, None).tolist()
+
+        q = self.sketch.quantile(quantiles)
+        return {
+            "count": self.count.tolist(),
+            "mean": nullable(np.where(self.count > 0, self.mean, np.nan)),
+            "std": nullable(self.std()),
+            "min": nullable(self.min),
+            "max": nullable(self.max),
+            "quantiles": {f"p{100.0 * qi:g}": nullable(q[i]) for i, qi in enumerate(quantiles)},
+            "thresholds": self.thresholds.tolist(),
+            "exceedance_fraction": nullable(self.exceedance_fraction()),
+        }
+
+
+class StreamingStats:
+    """
+    Bounded-memory aggregate of many runs: one SignalStats per named signal.
+
+    update() takes one run's {name: array}; partial aggregates built in worker processes
+    are combined with merge(), so memory does not grow with the number of runs. Merging
+    the same partials in the same order gives bit-identical results.
+    """
+
+    def __init__(self, signals: Mapping[str, SignalStats]) -> None:
+        self.signals = dict(signals)
+        self.runs = 0
+
+    def layout(self) -> dict[str, dict]:
+        """
+        Per-signal layouts; send these (not the count arrays) to worker processes.
+        """
+        return {k: v.layout() for k, v in self.signals.items()}
+
+    @classmethod
+    def from_layout(cls, layout: Mapping[str, Mapping]) -> "StreamingStats":
+        return cls({k: SignalStats(**spec) for k, spec in layout.items()})
+
+    def empty_like(self) -> "StreamingStats":
+        return StreamingStats.from_layout(self.layout())
+
+    def update(self, run: Mapping[str, np.ndarray]) -> None:
+        for name, stats in self.signals.items():
+            stats.update(run[name])
+        self.runs += 1
+
+    def merge(self, other: "StreamingStats") -> None:
+        if set(other.signals) != set(self.signals):
+            raise ValueError("Cannot merge StreamingStats with different signals.")
+        for name, stats in self.signals.items():
+            stats.merge(other.signals[name])
+        self.runs += other.runs
+
+    def __getitem__(self, name: str) -> SignalStats:
+        return self.signals[name]
+
+    def as_dict(self, quantiles: Sequence[float] = (0.05, 0.5, 0.95)) -> dict:
+        return {"runs": self.runs, "signals": {k: v.as_dict(quantiles) for k, v in self.signals.items()}}
@@ -6,8 +6,10 @@ import numpy as np
 from scipy.optimize import least_squares
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.compiled import CompiledAircraft, resolve_parameters
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters, qbar
+from adcs_core.dynamics.jacobian import jacobian_full
 from adcs_core.model import xdot_full
 from adcs_core.state.state_definition import ControlIndex, StateIndex
 
@@ -23,9 +25,10 @@ class TrimResult:
     residual_norm: float
     success: bool
     nfev: int
+    njev: int = 0
 
 
-def _compute_level_trim_quasi_guess(V_mps: float, params: AircraftParameters) -> TrimResult:
+def compute_level_trim_quasi_guess(V_mps: float, params: AircraftParameters) -> TrimResult:
     """
     Deterministic quasi-trim guess for level flight at speed V.
     This does not solve a full nonlinear trim NLP.
@@ -80,32 +83,43 @@ def _compute_level_trim_quasi_guess(V_mps: float, params: AircraftParameters) ->
 
 def compute_level_trim(
     V_mps: float,
-    params: AircraftParameters,
+    params: AircraftParameters | CompiledAircraft,
     *,
     limits: ActuatorLimits | None = None,
     residual_tol: float = 1e-6,
     aircraft_category: str = "stable",
+    initial_guess: np.ndarray | None = None,
+    jac: str = "analytic",
+    raise_on_failure: bool = True,
 ) -> TrimResult:
     """
     Nonlinear level-flight trim solve (longitudinal baseline).
 
     Unknowns z = [alpha, theta, elevator, throttle]
     Residual r = [u_dot, w_dot, q_dot, theta - alpha]
+    initial_guess: optional warm start z0 (e.g. a neighbouring trim); defaults to the
+    quasi-trim guess.
+    jac: "analytic" (chain rule through jacobian_full) or "2-point" (scipy finite differences).
+    raise_on_failure: raise RuntimeError when the residual stays above residual_tol;
+    when False the unconverged result is returned with success=False (and its nfev/njev).
     """
-    limits = limits or ActuatorLimits()
+    params, limits = resolve_parameters(params, limits)
     V = float(max(5.0, V_mps))
-    guess = _compute_level_trim_quasi_guess(V, params)
 
-    # z = [alpha, theta, de, throttle]
-    z0 = np.array(
-        [
-            guess.alpha,
-            guess.theta,
-            guess.elevator,
-            guess.throttle,
-        ],
-        dtype=float,
-    )
+    if initial_guess is not None:
+        z0 = np.array(initial_guess, dtype=float).reshape(4)
+    else:
+        guess = compute_level_trim_quasi_guess(V, params)
+        # z = [alpha, theta, de, throttle]
+        z0 = np.array(
+            [
+                guess.alpha,
+                guess.theta,
+                guess.elevator,
+                guess.throttle,
+            ],
+            dtype=float,
+        )
 
     # Dynamic bounds based on aircraft category
     is_relaxed = aircraft_category.lower() in ["relaxed", "fighter", "unstable"]
@@ -141,21 +155,35 @@ def compute_level_trim(
     # Ensure initial guess is within bounds
     z0 = np.clip(z0, bounds_lo, bounds_hi)
 
-    def residual(z: np.ndarray) -> np.ndarray:
-        alpha, theta, de, throttle = [float(v) for v in z]
-        u = V * np.cos(alpha)
-        w = V * np.sin(alpha)
+    if jac not in ("analytic", "2-point"):
+        raise ValueError(f"Unknown trim Jacobian '{jac}'.")
 
+    def state_controls(z: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        alpha, theta, de, throttle = [float(v) for v in z]
         # [x, y, z, u, v, w, phi, theta, psi, p, q, r]
         x = np.zeros(12, dtype=float)
-        x[int(StateIndex.U)] = u
-        x[int(StateIndex.W)] = w
+        x[int(StateIndex.U)] = V * np.cos(alpha)
+        x[int(StateIndex.W)] = V * np.sin(alpha)
         x[int(StateIndex.THETA)] = theta
+        u = np.zeros(4, dtype=float)
+        u[int(ControlIndex.THROTTLE)] = throttle
+        u[int(ControlIndex.ELEVATOR)] = de
+        return x, u
 
+    # nfev counts every residual (xdot_full) evaluation, including scipy's finite-difference
+    # columns (sol.nfev leaves those out); njev counts analytic jacobian_full evaluations.
+    nfev = 0
+    njev = 0
+
+    def residual(z: np.ndarray) -> np.ndarray:
+        nonlocal nfev
+        nfev += 1
+        alpha, theta = float(z[0]), float(z[1])
+        x, u = state_controls(z)
         ctrl = ControlInputs(
-            throttle=throttle,
+            throttle=float(u[int(ControlIndex.THROTTLE)]),
             aileron=0.0,
-            elevator=de,
+            elevator=float(u[int(ControlIndex.ELEVATOR)]),
             rudder=0.0,
         )
         xdot = xdot_full(x, ctrl, params=params, limits=limits)
@@ -171,9 +199,31 @@ def compute_level_trim(
             dtype=float,
         )
 
+    rows = [int(StateIndex.U), int(StateIndex.W), int(StateIndex.Q)]
+
+    def residual_jacobian(z: np.ndarray) -> np.ndarray:
+        # dr/dz = A[rows] @ dx/dz + B[rows] @ du/dz; the last row is d(theta - alpha)/dz.
+        nonlocal njev
+        njev += 1
+        alpha = float(z[0])
+        x, u = state_controls(z)
+        A, B = jacobian_full(x, u, params, limits)
+        dx_dz = np.zeros((12, 4), dtype=float)
+        dx_dz[int(StateIndex.U), 0] = -V * np.sin(alpha)
+        dx_dz[int(StateIndex.W), 0] = V * np.cos(alpha)
+        dx_dz[int(StateIndex.THETA), 1] = 1.0
+        du_dz = np.zeros((4, 4), dtype=float)
+        du_dz[int(ControlIndex.ELEVATOR), 2] = 1.0
+        du_dz[int(ControlIndex.THROTTLE), 3] = 1.0
+        J = np.empty((4, 4), dtype=float)
+        J[:3] = A[rows] @ dx_dz + B[rows] @ du_dz
+        J[3] = [-1.0, 1.0, 0.0, 0.0]
+        return J
+
     sol = least_squares(
         residual,
         x0=z0,
+        jac=residual_jacobian if jac == "analytic" else "2-point",
         bounds=(bounds_lo, bounds_hi),
         xtol=1e-9,
         ftol=1e-9,
@@ -193,7 +243,7 @@ def compute_level_trim(
     u0[int(ControlIndex.ELEVATOR)] = de
     residual_norm = float(np.linalg.norm(sol.fun))
 
-    if residual_norm > residual_tol:
+    if residual_norm > residual_tol and raise_on_failure:
         raise RuntimeError(
             f"Trim solver failed to converge below tolerance: "
             f"residual_norm={residual_norm:.3e}, tol={residual_tol:.1e}"
@@ -207,8 +257,9 @@ def compute_level_trim(
         throttle=throttle,
         elevator=de,
         residual_norm=residual_norm,
-        success=bool(sol.success),
-        nfev=int(sol.nfev),
+        success=bool(sol.success) and residual_norm <= residual_tol,
+        nfev=int(nfev),
+        njev=int(njev),
     )
 
 
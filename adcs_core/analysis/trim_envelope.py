@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Sequence
+
+import numpy as np
+
+from adcs_core.aircraft.database import AircraftModel
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.trim import compute_level_trim, compute_level_trim_quasi_guess
+from adcs_core.environment.atmosphere import ISAParams, isa_atmosphere
+
+_FIELDS = ("alpha", "theta", "elevator", "throttle")
+
+
+@dataclass(frozen=True)
+class TrimEnvelope:
+    """
+    Level-flight trim over an altitude x airspeed grid.
+    Tables are (len(alt_grid), len(V_grid)); entries that failed to converge are NaN.
+    """
+
+    V_grid: np.ndarray
+    alt_grid: np.ndarray
+    rho_kgm3: np.ndarray
+    alpha: np.ndarray
+    theta: np.ndarray
+    elevator: np.ndarray
+    throttle: np.ndarray
+    residual_norm: np.ndarray
+    converged: np.ndarray
+    nfev: np.ndarray
+
+    def as_dict(self) -> dict:
+        return {
+            "V_grid": self.V_grid.tolist(),
+            "alt_grid": self.alt_grid.tolist(),
+            "rho_kgm3": self.rho_kgm3.tolist(),
+            **{name: np.where(self.converged, getattr(self, name), None).tolist() for name in _FIELDS},
+            "residual_norm": self.residual_norm.tolist(),
+            "converged": self.converged.tolist(),
+            "nfev": self.nfev.tolist(),
+        }
+
+
+# Converged neighbour used for continuation: (V, params, z = [alpha, theta, elevator, throttle]).
+_Neighbour = tuple[float, AircraftParameters, np.ndarray]
+
+
+def _quasi_z(V: float, params: AircraftParameters) -> np.ndarray:
+    g = compute_level_trim_quasi_guess(V, params)
+    return np.array([g.alpha, g.theta, g.elevator, g.throttle], dtype=float)
+
+
+def _solve_point(
+    V: float,
+    params: AircraftParameters,
+    limits: ActuatorLimits,
+    category: str,
+    residual_tol: float,
+    neighbour: _Neighbour | None,
+) -> tuple[np.ndarray | None, float, int]:
+    """
+    One trim solve -> (z or None, residual, nfev). The warm start is the neighbour's
+    solution shifted by the change in the quasi-trim guess between the two points, so
+    the V^2/density scaling is predicted and only the model mismatch is carried over.
+    A failed warm start is retried once from the cold guess; nfev counts both attempts.
+    """
+    starts: list[np.ndarray | None] = [None]
+    if neighbour is not None:
+        V_nb, params_nb, z_nb = neighbour
+        starts.insert(0, z_nb + _quasi_z(V, params) - _quasi_z(V_nb, params_nb))
+    nfev = 0
+    for z0 in starts:
+        trim = compute_level_trim(
+            V,
+            params,
+            limits=limits,
+            residual_tol=residual_tol,
+            aircraft_category=category,
+            initial_guess=z0,
+            raise_on_failure=False,
+        )
+        nfev += trim.nfev
+        if trim.residual_norm <= residual_tol:
+            z = np.array([trim.alpha, trim.theta, trim.elevator, trim.throttle], dtype=float)
+            return z, trim.residual_norm, nfev
+    return None, float("nan"), nfev
+
+
+def _solve_row(
+    args: tuple[np.ndarray, AircraftParameters, ActuatorLimits, str, float, tuple[np.ndarray | None, float, int]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sweep one altitude along V from the already solved first point, warm-starting each
+    solve from the last converged neighbour.
+    """
+    V_grid, params, limits, category, residual_tol, first = args
+    n = V_grid.size
+    Z = np.full((n, 4), np.nan, dtype=float)
+    res = np.full(n, np.nan, dtype=float)
+    nfev = np.zeros(n, dtype=int)
+    ok = np.zeros(n, dtype=bool)
+    neighbour: _Neighbour | None = None
+    for j, V in enumerate(V_grid):
+        if j == 0:
+            z, res[j], nfev[j] = first
+        else:
+            z, res[j], nfev[j] = _solve_point(float(V), params, limits, category, residual_tol, neighbour)
+        if z is not None:
+            Z[j], ok[j] = z, True
+            neighbour = (float(V), params, z)
+    return Z, res, nfev, ok
+
+
+def compute_trim_envelope(
+    model: AircraftModel,
+    V_grid: Sequence[float],
+    alt_grid: Sequence[float],
+    *,
+    isa_temp_offset_c: float = 0.0,
+    residual_tol: float = 1e-6,
+    max_workers: int | None = 1,
+) -> TrimEnvelope:
+    """
+    Trim tables over (altitude, airspeed) with solution continuation.
+
+    The first airspeed column is solved serially up the altitude grid (each altitude
+    seeded by the one before); every altitude row is then swept along V_grid, each solve
+    warm-started from its neighbour. Rows are independent chunks: max_workers > 1 spreads
+    them over a process pool, max_workers=None uses one process per CPU, 1 stays serial.
+    Density follows the ISA model, as in the workbench flight condition.
+    """
+    V = np.asarray(V_grid, dtype=float).reshape(-1)
+    alt = np.asarray(alt_grid, dtype=float).reshape(-1)
+    if V.size == 0 or alt.size == 0:
+        raise ValueError("V_grid and alt_grid must be non-empty.")
+    isa = ISAParams(T0=288.15 + float(isa_temp_offset_c))
+    rho = np.array([isa_atmosphere(float(h), params=isa)[2] for h in alt], dtype=float)
+    params_by_alt = [replace(model.params, rho_kgm3=float(r)) for r in rho]
+    category = model.stability_mode
+
+    # First column: continuation in altitude.
+    firsts: list[tuple[np.ndarray | None, float, int]] = []
+    neighbour: _Neighbour | None = None
+    for params in params_by_alt:
+        first = _solve_point(float(V[0]), params, model.limits, category, residual_tol, neighbour)
+        if first[0] is not None:
+            neighbour = (float(V[0]), params, first[0])
+        firsts.append(first)
+
+    tasks = [(V, params, model.limits, category, float(residual_tol), first) for params, first in zip(params_by_alt, firsts)]
+    if max_workers == 1 or len(tasks) == 1:
+        rows = [_solve_row(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            rows = list(pool.map(_solve_row, tasks))
+
+    Z = np.stack([r[0] for r in rows])
+    return TrimEnvelope(
+        V_grid=V,
+        alt_grid=alt,
+        rho_kgm3=rho,
+        alpha=Z[:, :, 0],
+        theta=Z[:, :, 1],
+        elevator=Z[:, :, 2],
+        throttle=Z[:, :, 3],
+        residual_norm=np.stack([r[1] for r in rows]),
+        converged=np.stack([r[3] for r in rows]),
+        nfev=np.stack([r[2] for r in rows]),
+    )
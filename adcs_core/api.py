@@ -3,20 +3,35 @@ from __future__ import annotations
 import numpy as np
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.compiled import parameters_fingerprint
 from adcs_core.aircraft.database import get_aircraft_model
 from adcs_core.aircraft.forces_moments import ActuatorLimits, forces_and_moments_body
-from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.aircraft.parameters import AircraftParameters, StackedParameters, stack_parameters
+from adcs_core.analysis.gain_schedule_table import GainScheduleTable, build_gain_schedule_table
 from adcs_core.analysis.lqr_longitudinal import LongitudinalLqrDesign, design_longitudinal_lqr
 from adcs_core.analysis.lqr_lateral import LateralLqrDesign, design_lateral_lqr, extract_lateral_subsystem
-from adcs_core.analysis.modal_analysis import ModalAnalysisResult, analyze_modal_structure
+from adcs_core.analysis.lqr_sweep import LqrSweepResult, longitudinal_weight_grid, pareto_mask, sweep_lqr_weights
+from adcs_core.analysis.modal_analysis import ModalAnalysisResult, ModalStackResult, analyze_modal_stack, analyze_modal_structure
+from adcs_core.analysis.operating_point_cache import OperatingPoint, OperatingPointCache, default_operating_point_cache
+from adcs_core.analysis.riccati import RiccatiSession
+from adcs_core.analysis.simulation import StateFeedback, simulate
+from adcs_core.analysis.result_store import RESULT_STORE_VERSION, ResultStore, result_key
+from adcs_core.analysis.streaming_stats import QuantileSketch, SignalStats, StreamingStats
 from adcs_core.analysis.trim import TrimResult, compute_level_trim
+from adcs_core.analysis.trim_envelope import TrimEnvelope, compute_trim_envelope
 from adcs_core.control.actuators import ActuatorState
 from adcs_core.control.autopilot import Autopilot, AutopilotTargets
 from adcs_core.control.failure_modes import FailureManager
-from adcs_core.dynamics.integrator import rk4_step
+from adcs_core.dynamics.integrator import Rk4Workspace, rk4_step, rk4_step_inplace
+from adcs_core.dynamics.jacobian import jacobian_full, xdot_full_sparsity
 from adcs_core.dynamics.linearize import linearize
+from adcs_core.dynamics.fast_rhs import FastRhs
 from adcs_core.dynamics.equations import derivatives_6dof, post_step_sanitize, rotation_body_to_inertial
+from adcs_core.ensemble import EnsembleSimulator, EnsembleTrace
+from adcs_core.environment.dryden import DrydenTurbulence, DrydenTurbulenceBank
 from adcs_core.environment.wind import WindModel
+from adcs_core.scenarios.dispersion import Dispersion, StoppingRule, run_dispersion_campaign
+from adcs_core.scenarios.monte_carlo import MonteCarloCampaign, MonteCarloResult, history_stats, run_monte_carlo_campaign
 from adcs_core.model import xdot_full
 from adcs_core.sensors.airspeed import AirspeedSensor
 from adcs_core.sensors.altimeter import Altimeter
@@ -83,4 +98,46 @@ __all__ = [
     "linearize",
     "rk4_step",
     "xdot_full",
+    # Performance, analysis and campaign tooling used by the backend and scripts.
+    "analyze_modal_stack",
+    "build_gain_schedule_table",
+    "compute_trim_envelope",
+    "default_operating_point_cache",
+    "Dispersion",
+    "DrydenTurbulence",
+    "DrydenTurbulenceBank",
+    "EnsembleSimulator",
+    "EnsembleTrace",
+    "FastRhs",
+    "GainScheduleTable",
+    "history_stats",
+    "jacobian_full",
+    "longitudinal_weight_grid",
+    "LqrSweepResult",
+    "ModalStackResult",
+    "MonteCarloCampaign",
+    "MonteCarloResult",
+    "OperatingPoint",
+    "OperatingPointCache",
+    "parameters_fingerprint",
+    "pareto_mask",
+    "QuantileSketch",
+    "result_key",
+    "RESULT_STORE_VERSION",
+    "ResultStore",
+    "RiccatiSession",
+    "rk4_step_inplace",
+    "Rk4Workspace",
+    "run_dispersion_campaign",
+    "run_monte_carlo_campaign",
+    "SignalStats",
+    "simulate",
+    "stack_parameters",
+    "StackedParameters",
+    "StateFeedback",
+    "StoppingRule",
+    "StreamingStats",
+    "sweep_lqr_weights",
+    "TrimEnvelope",
+    "xdot_full_sparsity",
 ]
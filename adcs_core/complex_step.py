@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def as_real_or_complex(a: np.ndarray) -> np.ndarray:
+    """
+    float64 view/copy of `a`, or complex128 when `a` already carries an imaginary part.
+    """
+    a = np.asarray(a)
+    return a.astype(complex, copy=False) if np.iscomplexobj(a) else a.astype(float, copy=False)
+
+
+def cs_arctan2(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    np.arctan2 extended to complex-step inputs: the real part is arctan2 of the real
+    parts, the imaginary part carries the first-order derivative along the imaginary step.
+    """
+    if not (np.iscomplexobj(y) or np.iscomplexobj(x)):
+        return np.arctan2(y, x)
+    xr, yr = np.real(x), np.real(y)
+    return np.arctan2(yr, xr) + 1j * (xr * np.imag(y) - yr * np.imag(x)) / (xr * xr + yr * yr)
+
+
+def cs_maximum(a: np.ndarray, floor: float) -> np.ndarray:
+    """
+    np.maximum(a, floor), comparing on the real part for complex inputs.
+    """
+    if not np.iscomplexobj(a):
+        return np.maximum(a, floor)
+    return np.where(a.real < floor, floor, a)
+
+
+def cs_clip(a: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """
+    np.clip(a, lo, hi), comparing on the real part for complex inputs.
+    """
+    if not np.iscomplexobj(a):
+        return np.clip(a, lo, hi)
+    return np.where(a.real < lo, lo, np.where(a.real > hi, hi, a))
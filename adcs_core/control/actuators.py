@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
-from adcs_core.aircraft.forces_moments import ActuatorLimits, clamp_controls
+from adcs_core.aircraft.forces_moments import ActuatorLimits, clamp_controls, clamp_controls_batch
 
 
 @dataclass
@@ -45,3 +45,30 @@ class ActuatorState:
 
 
 
+
+
+class ActuatorBatch:
+    """
+    ActuatorState for n aircraft: (n, 4) controls ordered as ControlIndex.
+    """
+
+    def __init__(self, n: int, tau_s: float = 0.15, limits: ActuatorLimits = ActuatorLimits()):
+        self.tau_s = tau_s
+        self.limits = limits
+        self._U = np.zeros((int(n), 4), dtype=float)
+
+    def reset(self, U0: np.ndarray) -> None:
+        self._U = clamp_controls_batch(np.broadcast_to(np.asarray(U0, dtype=float), self._U.shape), self.limits)
+
+    @property
+    def U(self) -> np.ndarray:
+        return self._U
+
+    def update(self, U_cmd: np.ndarray, dt: float) -> np.ndarray:
+        U_cmd = clamp_controls_batch(U_cmd, self.limits)
+        if dt <= 0.0 or self.tau_s <= 0.0:
+            self._U = U_cmd
+            return self._U
+        a = float(np.clip(dt / self.tau_s, 0.0, 1.0))
+        self._U = clamp_controls_batch(self._U + a * (U_cmd - self._U), self.limits)
+        return self._U
@@ -6,7 +6,7 @@ from typing import Dict
 import numpy as np
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
-from adcs_core.control.pid import PID
+from adcs_core.control.pid import PID, PIDBatch
 
 
 def wrap_pi(a: float) -> float:
@@ -114,3 +114,35 @@ class Autopilot:
 
 
 
+
+
+class AutopilotBatch:
+    """
+    Autopilot.update for n aircraft at once: sensors map to (n,) arrays, targets are
+    shared, and the result is an (n, 4) control array ordered as ControlIndex.
+    """
+
+    def __init__(self, n: int, gains: AutopilotGains | None = None, limits: AutopilotLimits | None = None):
+        ap = Autopilot(gains, limits)
+        self.gains = ap.gains
+        self.limits = ap.limits
+        self.pid_V = PIDBatch.from_pid(ap.pid_V, n)
+        self.pid_h = PIDBatch.from_pid(ap.pid_h, n)
+        self.pid_psi = PIDBatch.from_pid(ap.pid_psi, n)
+        self.pid_theta = PIDBatch.from_pid(ap.pid_theta, n)
+        self.pid_phi = PIDBatch.from_pid(ap.pid_phi, n)
+        self.pid_r = PIDBatch.from_pid(ap.pid_r, n)
+
+    def reset(self) -> None:
+        for pid in [self.pid_V, self.pid_h, self.pid_psi, self.pid_theta, self.pid_phi, self.pid_r]:
+            pid.reset()
+
+    def update(self, sensors: Dict[str, np.ndarray], targets: AutopilotTargets, dt: float) -> np.ndarray:
+        throttle = self.pid_V.update(sensors["airspeed_mps"], targets.airspeed_mps, dt)
+        theta_cmd = self.pid_h.update(sensors["altitude_m"], targets.altitude_m, dt)
+        elevator = self.pid_theta.update(sensors["theta_rad"], theta_cmd, dt)
+        psi_err = (targets.heading_rad - np.asarray(sensors["heading_rad"], dtype=float) + np.pi) % (2.0 * np.pi) - np.pi
+        bank_cmd = self.pid_psi.update(np.zeros_like(psi_err), psi_err, dt)
+        aileron = self.pid_phi.update(sensors["phi_rad"], bank_cmd, dt)
+        rudder = self.pid_r.update(sensors["r_radps"], 0.0, dt)
+        return np.column_stack([throttle, aileron, elevator, rudder])
@@ -99,14 +99,20 @@ class GainSchedule:
             raise ValueError("gains must be rank-3: (n_speeds, n_u, n_x)")
         if Ktab.shape[0] != speeds.size:
             raise ValueError("speeds/gains length mismatch")
+        if np.any(np.diff(speeds) < 0.0):
+            raise ValueError("speeds_mps must be sorted in ascending order")
 
+        if speeds.size == 1:
+            return Ktab[0].copy()
+        # Blend the two bracketing gain matrices at once (same result as per-element np.interp).
         V = float(np.clip(V_mps, speeds.min(), speeds.max()))
-        n_u, n_x = Ktab.shape[1], Ktab.shape[2]
-        K = np.zeros((n_u, n_x), dtype=float)
-        for i in range(n_u):
-            for j in range(n_x):
-                K[i, j] = np.interp(V, speeds, Ktab[:, i, j])
-        return K
+        i = int(np.clip(np.searchsorted(speeds, V, side="right") - 1, 0, speeds.size - 2))
+        dV = speeds[i + 1] - speeds[i]
+        if dV == 0.0:
+            # Repeated top speed: np.interp takes the last entry there.
+            return Ktab[i + 1].copy()
+        w = (V - speeds[i]) / dV
+        return (1.0 - w) * Ktab[i] + w * Ktab[i + 1]
 
 
 def build_gain_schedule(
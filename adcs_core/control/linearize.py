@@ -1,15 +1,31 @@
 from adcs_core.dynamics.linearize import (
+    FD_SCHEMES,
     LinearizationPoint,
+    color_columns,
+    detect_sparsity,
+    discretize_zoh,
     finite_difference_jacobian,
+    finite_difference_jacobian_batch,
     linearize,
+    linearize_batch,
     select_subsystem,
 )
+from adcs_core.dynamics.jacobian import jacobian_full, linearize_xdot_full, xdot_full_sparsity
 
 __all__ = [
+    "FD_SCHEMES",
     "LinearizationPoint",
+    "color_columns",
+    "detect_sparsity",
+    "discretize_zoh",
     "finite_difference_jacobian",
+    "finite_difference_jacobian_batch",
+    "jacobian_full",
     "linearize",
+    "linearize_batch",
+    "linearize_xdot_full",
     "select_subsystem",
+    "xdot_full_sparsity",
 ]
 
 
@@ -71,3 +71,73 @@ class PID:
         return u
 
 
+
+
+@dataclass
+class PIDBatch:
+    """
+    PID.update for n independent loops sharing gains and limits, evaluated elementwise
+    with the same arithmetic (and anti-windup rule) as the scalar controller.
+    """
+
+    kp: float
+    ki: float
+    kd: float
+    n: int
+    u_min: float = -np.inf
+    u_max: float = np.inf
+
+    integrator_limit: float = np.inf
+    derivative_on_measurement: bool = True
+
+    _integral: np.ndarray | None = None
+    _prev_meas: np.ndarray | None = None
+    _prev_err: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        self.reset()
+
+    @classmethod
+    def from_pid(cls, pid: PID, n: int) -> "PIDBatch":
+        return cls(
+            pid.kp,
+            pid.ki,
+            pid.kd,
+            int(n),
+            u_min=pid.u_min,
+            u_max=pid.u_max,
+            integrator_limit=pid.integrator_limit,
+            derivative_on_measurement=pid.derivative_on_measurement,
+        )
+
+    def reset(self) -> None:
+        self._integral = np.zeros(self.n, dtype=float)
+        self._prev_meas = None
+        self._prev_err = None
+
+    def update(self, measurement: np.ndarray, setpoint: np.ndarray | float, dt: float) -> np.ndarray:
+        measurement = np.asarray(measurement, dtype=float)
+        if dt <= 0.0:
+            return np.clip(self.kp * (setpoint - measurement), self.u_min, self.u_max)
+
+        err = setpoint - measurement
+
+        if self.derivative_on_measurement:
+            d = 0.0 if self._prev_meas is None else -(measurement - self._prev_meas) / dt
+        else:
+            d = 0.0 if self._prev_err is None else (err - self._prev_err) / dt
+
+        integral_new = np.clip(self._integral + err * dt, -self.integrator_limit, self.integrator_limit)
+
+        u_unsat = self.kp * err + self.ki * integral_new + self.kd * d
+        u = np.clip(u_unsat, self.u_min, self.u_max)
+
+        if np.isfinite(self.u_min) or np.isfinite(self.u_max):
+            accept = (u == u_unsat) | ((u >= self.u_max) & (err < 0.0)) | ((u <= self.u_min) & (err > 0.0))
+            self._integral = np.where(accept, integral_new, self._integral)
+        else:
+            self._integral = integral_new
+
+        self._prev_meas = measurement
+        self._prev_err = err
+        return u
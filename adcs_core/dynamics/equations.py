@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.complex_step import as_real_or_complex
 from adcs_core.state import State
 from adcs_core.state.state_definition import ANGLE_INDICES, POSITION_INDICES, RATE_INDICES, StateIndex, VELOCITY_INDICES
 
@@ -58,19 +59,22 @@ def derivatives_6dof(
     params: AircraftParameters,
     forces_b_N: np.ndarray,
     moments_b_Nm: np.ndarray,
+    *,
+    inertia_inv: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     State x = [pos(3), vel_b(3), euler(3), rates_b(3)].
 
     forces_b are applied forces in BODY axes [N].
     moments_b are applied moments in BODY axes [N*m].
+    inertia_inv: precomputed inverse of params.inertia_kgm2 (e.g. CompiledAircraft.inertia_inv).
     """
     s = State.from_vector(x)
 
     m = params.mass_kg
     g = params.g_ms2
     I = params.inertia_kgm2
-    Iinv = np.linalg.inv(I)
+    Iinv = np.linalg.inv(I) if inertia_inv is None else inertia_inv
 
     # --- kinematics: position derivative from body velocity ---
     C_bi = rotation_body_to_inertial(s.phi, s.theta, s.psi)
@@ -101,11 +105,84 @@ def derivatives_6dof(
     return dx
 
 
-def post_step_sanitize(x: np.ndarray) -> np.ndarray:
+def derivatives_6dof_batch(
+    t: float,
+    X: np.ndarray,
+    params: AircraftParameters,
+    forces_b_N: np.ndarray,
+    moments_b_Nm: np.ndarray,
+    *,
+    out: np.ndarray | None = None,
+    inertia_inv: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Vectorized derivatives_6dof for N independent aircraft.
+
+    X: (N, 12) states, forces_b_N/moments_b_Nm: (N, 3) body-axis loads.
+    Returns (N, 12) state derivatives using the same equations as the scalar path,
+    written into `out` when given (must not alias X). Complex inputs are propagated.
+    inertia_inv is as in derivatives_6dof.
+    """
+    X = as_real_or_complex(X)
+    F = as_real_or_complex(forces_b_N)
+    M = as_real_or_complex(moments_b_Nm)
+    dtype = np.result_type(X, F, M)
+
+    u, v, w = X[:, StateIndex.U], X[:, StateIndex.V], X[:, StateIndex.W]
+    phi, theta, psi = X[:, StateIndex.PHI], X[:, StateIndex.THETA], X[:, StateIndex.PSI]
+    p, q, r = X[:, StateIndex.P], X[:, StateIndex.Q], X[:, StateIndex.R]
+
+    m = params.mass_kg
+    g = params.g_ms2
+    I = np.asarray(params.inertia_kgm2, dtype=float)
+    Iinv = np.linalg.inv(I) if inertia_inv is None else inertia_inv
+
+    cphi, sphi = np.cos(phi), np.sin(phi)
+    cth, sth = np.cos(theta), np.sin(theta)
+    cpsi, spsi = np.cos(psi), np.sin(psi)
+
+    dx = np.empty(X.shape, dtype=dtype) if out is None else out
+
+    # --- kinematics: C_bi @ v_b ---
+    dx[:, StateIndex.X] = cth * cpsi * u + (sphi * sth * cpsi - cphi * spsi) * v + (cphi * sth * cpsi + sphi * spsi) * w
+    dx[:, StateIndex.Y] = cth * spsi * u + (sphi * sth * spsi + cphi * cpsi) * v + (cphi * sth * spsi - sphi * cpsi) * w
+    dx[:, StateIndex.Z] = -sth * u + sphi * cth * v + cphi * cth * w
+
+    # --- body translational acceleration: F/m + C_bi^T g_i - omega x v ---
+    dx[:, StateIndex.U] = F[:, 0] / m - g * sth - (q * w - r * v)
+    dx[:, StateIndex.V] = F[:, 1] / m + g * sphi * cth - (r * u - p * w)
+    dx[:, StateIndex.W] = F[:, 2] / m + g * cphi * cth - (p * v - q * u)
+
+    # --- attitude: Euler angle rates (same cos(theta) guard as the scalar path) ---
+    cth_r = np.real(cth)
+    cth_safe = np.where(np.abs(cth_r) < 1e-6, 1e-6 * np.where(cth_r != 0.0, np.sign(cth_r), 1.0), cth)
+    tth = np.tan(theta)
+    dx[:, StateIndex.PHI] = p + sphi * tth * q + cphi * tth * r
+    dx[:, StateIndex.THETA] = cphi * q - sphi * r
+    dx[:, StateIndex.PSI] = (sphi / cth_safe) * q + (cphi / cth_safe) * r
+
+    # --- rotational dynamics: Iinv @ (M - omega x (I @ omega)) ---
+    omega = X[:, RATE_INDICES]
+    h = omega @ I.T if I.ndim == 2 else (I @ omega[:, :, None])[:, :, 0]
+    rhs = np.empty(M.shape, dtype=dtype)
+    rhs[:, 0] = M[:, 0] - (q * h[:, 2] - r * h[:, 1])
+    rhs[:, 1] = M[:, 1] - (r * h[:, 0] - p * h[:, 2])
+    rhs[:, 2] = M[:, 2] - (p * h[:, 1] - q * h[:, 0])
+    dx[:, RATE_INDICES] = rhs @ Iinv.T if Iinv.ndim == 2 else (Iinv @ rhs[:, :, None])[:, :, 0]
+    return dx
+
+
+def post_step_sanitize(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
     """
     Keep Euler angles wrapped for nicer logs and to avoid unbounded growth.
+    Writes into `out` (which may be x itself) when given.
     """
-    y = np.array(x, dtype=float, copy=True)
+    if out is None:
+        y = np.array(x, dtype=float, copy=True)
+    else:
+        y = out
+        if y is not x:
+            y[:] = x
     y[int(StateIndex.PHI)] = _wrap_angle(float(y[int(StateIndex.PHI)]))
     y[int(StateIndex.THETA)] = _wrap_angle(float(y[int(StateIndex.THETA)]))
     y[int(StateIndex.PSI)] = _wrap_angle(float(y[int(StateIndex.PSI)]))
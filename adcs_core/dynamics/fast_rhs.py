@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import numpy as np
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.compiled import CompiledAircraft, compile_aircraft
+from adcs_core.aircraft.forces_moments import ActuatorLimits, clamp_controls
+from adcs_core.aircraft.parameters import AircraftParameters
+
+
+class FastRhs:
+    """
+    Fused single-aircraft dynamics for the real-time loop.
+
+    Evaluates exactly the arithmetic of xdot_full (forces_and_moments_body followed by
+    derivatives_6dof) but reuses preallocated buffers, reads the inertia inverse, reference
+    products and coefficient vectors from a CompiledAircraft and skips State/debug-dict
+    construction. Results are bit-identical to the reference path.
+
+    Controls and wind are held constant across integrator stages: call set_controls() and
+    set_wind() once per step, then pass the instance to rk4_step like any DerivFn.
+    """
+
+    def __init__(
+        self,
+        params: AircraftParameters | CompiledAircraft | None = None,
+        limits: ActuatorLimits | None = None,
+    ) -> None:
+        pack = compile_aircraft(AircraftParameters() if params is None else params, limits)
+        self.params, self.limits = pack.params, pack.limits
+        p = self.params
+
+        self._m = p.mass_kg
+        self._S = p.S_m2
+        self._S_b = pack.S_b
+        self._S_cbar = pack.S_cbar
+        self._half_b = pack.half_b
+        self._half_cbar = pack.half_cbar
+        self._lon = tuple(pack.lon_coeffs.tolist())
+        self._lat = tuple(pack.lat_coeffs.tolist())
+        self._rho = p.rho_kgm3
+        self._max_thrust = p.max_thrust_N
+        self._I = np.asarray(p.inertia_kgm2, dtype=float)
+        self._Iinv = pack.inertia_inv
+        self._g_i = np.array([0.0, 0.0, p.g_ms2], dtype=float)
+
+        self._Ry = np.zeros((3, 3), dtype=float)
+        self._Ry[1, 1] = 1.0
+        self._Rz = np.zeros((3, 3), dtype=float)
+        self._Rz[2, 2] = 1.0
+        self._Rwb = np.empty((3, 3), dtype=float)
+        self._C_bi = np.empty((3, 3), dtype=float)
+        self._T = np.zeros((3, 3), dtype=float)
+        self._T[0, 0] = 1.0
+
+        self._F_wind = np.empty(3, dtype=float)
+        self._F_body = np.empty(3, dtype=float)
+        self._v_b = np.empty(3, dtype=float)
+        self._pqr = np.empty(3, dtype=float)
+        self._vel_i = np.empty(3, dtype=float)
+        self._g_b = np.empty(3, dtype=float)
+        self._w_b = np.empty(3, dtype=float)
+        self._eul_dot = np.empty(3, dtype=float)
+        self._h = np.empty(3, dtype=float)
+        self._rhs = np.empty(3, dtype=float)
+        self._omega_dot = np.empty(3, dtype=float)
+
+        self._wind_ned: np.ndarray | None = None
+        self._wind_body = np.zeros(3, dtype=float)
+        self._has_wind_body = False
+        self.set_controls(ControlInputs())
+
+    def set_controls(self, u: ControlInputs) -> None:
+        c = clamp_controls(u, self.limits)
+        self._throttle = c.throttle
+        self._aileron = c.aileron
+        self._elevator = c.elevator
+        self._rudder = c.rudder
+        self._thrust = self._max_thrust * float(np.clip(c.throttle, 0.0, 1.0))
+
+    def set_wind(self, wind_ned_mps: np.ndarray | None = None, wind_body_mps: np.ndarray | None = None) -> None:
+        """
+        Steady wind in NED (rotated into body each stage) plus an optional body-axis
+        offset such as turbulence. Air-relative velocity is v_b - C_bi^T w_ned - w_body.
+        """
+        self._wind_ned = None if wind_ned_mps is None else np.array(wind_ned_mps, dtype=float).reshape(3)
+        self._has_wind_body = wind_body_mps is not None
+        if wind_body_mps is not None:
+            self._wind_body[:] = np.asarray(wind_body_mps, dtype=float).reshape(3)
+
+    def __call__(self, t: float, x: np.ndarray) -> np.ndarray:
+        return self.evaluate_into(t, x, np.empty(12, dtype=float))
+
+    def evaluate_into(self, t: float, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        u, v, w = float(x[3]), float(x[4]), float(x[5])
+        phi, theta, psi = float(x[6]), float(x[7]), float(x[8])
+        p, q, r = float(x[9]), float(x[10]), float(x[11])
+
+        # --- body->inertial DCM (shared by kinematics, gravity and wind) ---
+        cphi, sphi = np.cos(phi), np.sin(phi)
+        cth, sth = np.cos(theta), np.sin(theta)
+        cpsi, spsi = np.cos(psi), np.sin(psi)
+        C = self._C_bi
+        C[0, 0] = cth * cpsi
+        C[0, 1] = sphi * sth * cpsi - cphi * spsi
+        C[0, 2] = cphi * sth * cpsi + sphi * spsi
+        C[1, 0] = cth * spsi
+        C[1, 1] = sphi * sth * spsi + cphi * cpsi
+        C[1, 2] = cphi * sth * spsi - sphi * cpsi
+        C[2, 0] = -sth
+        C[2, 1] = sphi * cth
+        C[2, 2] = cphi * cth
+
+        # --- air-relative velocity ---
+        ua, va, wa = u, v, w
+        if self._wind_ned is not None:
+            np.matmul(C.T, self._wind_ned, out=self._w_b)
+            ua = ua - float(self._w_b[0])
+            va = va - float(self._w_b[1])
+            wa = wa - float(self._w_b[2])
+        if self._has_wind_body:
+            ua = ua - float(self._wind_body[0])
+            va = va - float(self._wind_body[1])
+            wa = wa - float(self._wind_body[2])
+
+        # --- aerodynamics ---
+        V = float(np.sqrt(ua * ua + va * va + wa * wa))
+        V = max(V, 1e-3)
+        alpha = float(np.arctan2(wa, ua))
+        beta = float(np.arcsin(np.clip(va / V, -0.999, 0.999)))
+
+        CL0, CL_a, _CL_q, CL_de, CD0, CD_k, Cm0, Cm_a, Cm_q, Cm_de = self._lon
+        CY_b, CY_dr, Cl_b, Cl_p, Cl_r, Cl_da, Cl_dr, Cn_b, Cn_p, Cn_r, Cn_da, Cn_dr = self._lat
+        p_hat = p * self._half_b / V
+        q_hat = q * self._half_cbar / V
+        r_hat = r * self._half_b / V
+        de, da, dr = self._elevator, self._aileron, self._rudder
+
+        CL = CL0 + CL_a * alpha + CL_de * de
+        CD = CD0 + CD_k * (CL * CL)
+        CY = CY_b * beta + CY_dr * dr
+        Cm = Cm0 + Cm_a * alpha + Cm_q * q_hat + Cm_de * de
+        Cl = Cl_b * beta + Cl_p * p_hat + Cl_r * r_hat + Cl_da * da + Cl_dr * dr
+        Cn = Cn_b * beta + Cn_p * p_hat + Cn_r * r_hat + Cn_da * da + Cn_dr * dr
+
+        qd = 0.5 * self._rho * V * V
+        qS = qd * self._S
+        Fw = self._F_wind
+        Fw[0] = -(qS * CD)
+        Fw[1] = qS * CY
+        Fw[2] = -(qS * CL)
+
+        ca, sa = np.cos(alpha), np.sin(alpha)
+        cb, sb = np.cos(beta), np.sin(beta)
+        Ry, Rz = self._Ry, self._Rz
+        Ry[0, 0] = ca
+        Ry[0, 2] = -sa
+        Ry[2, 0] = sa
+        Ry[2, 2] = ca
+        Rz[0, 0] = cb
+        Rz[0, 1] = sb
+        Rz[1, 0] = -sb
+        Rz[1, 1] = cb
+        np.matmul(Ry, Rz, out=self._Rwb)
+        F = np.matmul(self._Rwb, Fw, out=self._F_body)
+        F[0] += self._thrust
+        # xdot_full adds a [T, 0, 0] thrust vector; adding +0.0 turns -0.0 into +0.0 the same way.
+        F[1] += 0.0
+        F[2] += 0.0
+
+        Mx = qd * self._S_b * Cl
+        My = qd * self._S_cbar * Cm
+        Mz = qd * self._S_b * Cn
+
+        # --- translational dynamics / kinematics ---
+        v_b = self._v_b
+        v_b[0], v_b[1], v_b[2] = u, v, w
+        vel_i = np.matmul(C, v_b, out=self._vel_i)
+        g_b = np.matmul(C.T, self._g_i, out=self._g_b)
+
+        m = self._m
+        out[0] = vel_i[0]
+        out[1] = vel_i[1]
+        out[2] = vel_i[2]
+        out[3] = (F[0] / m) + g_b[0] - (q * w - r * v)
+        out[4] = (F[1] / m) + g_b[1] - (r * u - p * w)
+        out[5] = (F[2] / m) + g_b[2] - (p * v - q * u)
+
+        # --- attitude kinematics ---
+        cth_e = cth
+        if abs(cth_e) < 1e-6:
+            cth_e = 1e-6 * np.sign(cth_e if cth_e != 0.0 else 1.0)
+        tth = np.tan(theta)
+        T = self._T
+        T[0, 1] = sphi * tth
+        T[0, 2] = cphi * tth
+        T[1, 1] = cphi
+        T[1, 2] = -sphi
+        T[2, 1] = sphi / cth_e
+        T[2, 2] = cphi / cth_e
+        pqr = self._pqr
+        pqr[0], pqr[1], pqr[2] = p, q, r
+        eul_dot = np.matmul(T, pqr, out=self._eul_dot)
+        out[6] = eul_dot[0]
+        out[7] = eul_dot[1]
+        out[8] = eul_dot[2]
+
+        # --- rotational dynamics ---
+        h = np.matmul(self._I, pqr, out=self._h)
+        rhs = self._rhs
+        rhs[0] = Mx - (q * h[2] - r * h[1])
+        rhs[1] = My - (r * h[0] - p * h[2])
+        rhs[2] = Mz - (p * h[1] - q * h[0])
+        omega_dot = np.matmul(self._Iinv, rhs, out=self._omega_dot)
+        out[9] = omega_dot[0]
+        out[10] = omega_dot[1]
+        out[11] = omega_dot[2]
+        return out
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Callable
+from dataclasses import dataclass
+from typing import Callable, Protocol
 
 import numpy as np
 
@@ -8,6 +9,15 @@ import numpy as np
 DerivFn = Callable[[float, np.ndarray], np.ndarray]
 
 
+class DerivIntoFn(Protocol):
+    """
+    Derivative function that writes f(t, x) into `out` (same shape as x) and returns it.
+    x may be a single (12,) state or an (N, 12) stack.
+    """
+
+    def __call__(self, t: float, x: np.ndarray, out: np.ndarray) -> np.ndarray: ...
+
+
 def euler_step(f: DerivFn, t: float, x: np.ndarray, dt: float) -> np.ndarray:
     return x + dt * f(t, x)
 
@@ -20,3 +30,245 @@ def rk4_step(f: DerivFn, t: float, x: np.ndarray, dt: float) -> np.ndarray:
     return x + (dt / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
 
 
+@dataclass
+class Rk4Workspace:
+    """
+    Preallocated stage buffers for rk4_step_inplace; shape matches the state (or state stack).
+    """
+
+    k1: np.ndarray
+    k2: np.ndarray
+    k3: np.ndarray
+    k4: np.ndarray
+    x_stage: np.ndarray
+    acc: np.ndarray
+
+    @classmethod
+    def for_shape(cls, shape: tuple[int, ...] | int) -> "Rk4Workspace":
+        return cls(*(np.empty(shape, dtype=float) for _ in range(6)))
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.k1.shape
+
+
+def rk4_step_inplace(
+    f_into: DerivIntoFn,
+    t: float,
+    x: np.ndarray,
+    dt: float,
+    *,
+    out: np.ndarray,
+    work: Rk4Workspace,
+) -> np.ndarray:
+    """
+    Allocation-free rk4_step. Same operation order, so results are bit-identical.
+    Works unchanged for batched (N, 12) states; `out` may alias `x`.
+    """
+    k1, k2, k3, k4, xs, acc = work.k1, work.k2, work.k3, work.k4, work.x_stage, work.acc
+    half = 0.5 * dt
+
+    f_into(t, x, k1)
+    np.multiply(half, k1, out=xs)
+    np.add(x, xs, out=xs)
+    f_into(t + half, xs, k2)
+    np.multiply(half, k2, out=xs)
+    np.add(x, xs, out=xs)
+    f_into(t + half, xs, k3)
+    np.multiply(dt, k3, out=xs)
+    np.add(x, xs, out=xs)
+    f_into(t + dt, xs, k4)
+
+    np.multiply(2.0, k2, out=acc)
+    np.add(k1, acc, out=acc)
+    np.multiply(2.0, k3, out=xs)
+    np.add(acc, xs, out=acc)
+    np.add(acc, k4, out=acc)
+    np.multiply(dt / 6.0, acc, out=acc)
+    return np.add(x, acc, out=out)
+
+
+# --- Dormand-Prince 5(4) with error control and dense output ---
+# Tableau and 4th-order continuous extension as in Dormand & Prince (1980) / Shampine (1986).
+_DP_C = np.array([0.0, 1.0 / 5.0, 3.0 / 10.0, 4.0 / 5.0, 8.0 / 9.0, 1.0], dtype=float)
+_DP_A = [
+    np.array([], dtype=float),
+    np.array([1.0 / 5.0], dtype=float),
+    np.array([3.0 / 40.0, 9.0 / 40.0], dtype=float),
+    np.array([44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0], dtype=float),
+    np.array([19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0], dtype=float),
+    np.array([9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0], dtype=float),
+]
+_DP_B = np.array([35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0], dtype=float)
+# 5th-order minus embedded 4th-order weights (7th stage is the FSAL derivative).
+_DP_E = np.array(
+    [-71.0 / 57600.0, 0.0, 71.0 / 16695.0, -71.0 / 1920.0, 17253.0 / 339200.0, -22.0 / 525.0, 1.0 / 40.0],
+    dtype=float,
+)
+_DP_P = np.array(
+    [
+        [1.0, -8048581381.0 / 2820520608.0, 8663915743.0 / 2820520608.0, -12715105075.0 / 11282082432.0],
+        [0.0, 0.0, 0.0, 0.0],
+        [0.0, 131558114200.0 / 32700410799.0, -68118460800.0 / 10900136933.0, 87487479700.0 / 32700410799.0],
+        [0.0, -1754552775.0 / 470086768.0, 14199869525.0 / 1410260304.0, -10690763975.0 / 1880347072.0],
+        [0.0, 127303824393.0 / 49829197408.0, -318862633887.0 / 49829197408.0, 701980252875.0 / 199316789632.0],
+        [0.0, -282668133.0 / 205662961.0, 2019193451.0 / 616988883.0, -1453857185.0 / 822651844.0],
+        [0.0, 40617522.0 / 29380423.0, -110615467.0 / 29380423.0, 69997945.0 / 29380423.0],
+    ],
+    dtype=float,
+)
+
+
+@dataclass(frozen=True)
+class OdeSolution:
+    t: np.ndarray
+    x: np.ndarray
+    nfev: int
+    n_accepted: int
+    n_rejected: int
+    success: bool
+    message: str
+
+
+def dopri45_step(
+    f: DerivFn, t: float, x: np.ndarray, dt: float, k1: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One Dormand-Prince step. Returns (x_next, err, K) where K holds the 7 stage
+    derivatives (K[6] = f(t + dt, x_next), reusable as the next k1).
+    """
+    x = np.asarray(x, dtype=float)
+    K = np.empty((7, x.size), dtype=float)
+    K[0] = f(t, x) if k1 is None else k1
+    for s in range(1, 6):
+        K[s] = f(t + _DP_C[s] * dt, x + dt * (_DP_A[s] @ K[:s]))
+    x_next = x + dt * (_DP_B @ K[:6])
+    K[6] = f(t + dt, x_next)
+    err = dt * (_DP_E @ K)
+    return x_next, err, K
+
+
+def _dense_eval(x_old: np.ndarray, K: np.ndarray, dt: float, theta: np.ndarray) -> np.ndarray:
+    Q = K.T @ _DP_P
+    powers = np.cumprod(np.repeat(np.atleast_1d(theta)[:, None], 4, axis=1), axis=1)
+    return x_old[None, :] + dt * (powers @ Q.T)
+
+
+def _initial_step(f0: np.ndarray, f: DerivFn, t0: float, x0: np.ndarray, rtol: float, atol: float) -> float:
+    scale = atol + np.abs(x0) * rtol
+    d0 = float(np.sqrt(np.mean((x0 / scale) ** 2)))
+    d1 = float(np.sqrt(np.mean((f0 / scale) ** 2)))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    f1 = f(t0 + h0, x0 + h0 * f0)
+    d2 = float(np.sqrt(np.mean(((f1 - f0) / scale) ** 2))) / h0
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** 0.2
+    return min(100.0 * h0, h1)
+
+
+def integrate_dopri45(
+    f: DerivFn,
+    t_span: tuple[float, float],
+    x0: np.ndarray,
+    *,
+    t_eval: np.ndarray | None = None,
+    rtol: float = 1e-6,
+    atol: float = 1e-9,
+    first_step: float | None = None,
+    max_step: float = np.inf,
+    max_steps: int = 100000,
+) -> OdeSolution:
+    """
+    Adaptive RK45 (Dormand-Prince) integration of x' = f(t, x) over t_span.
+
+    Samples are returned on t_eval (default: the accepted step times) using the
+    4th-order dense-output interpolant, so the output grid does not constrain the
+    internal step. max_step bounds the step for right-hand sides with kinks
+    (e.g. saturated feedback).
+    """
+    t0, tf = float(t_span[0]), float(t_span[1])
+    if tf <= t0:
+        raise ValueError("t_span must be increasing.")
+    x = np.asarray(x0, dtype=float).copy()
+    if t_eval is not None:
+        t_eval = np.asarray(t_eval, dtype=float)
+        if np.any(np.diff(t_eval) < 0.0) or (t_eval.size and (t_eval[0] < t0 or t_eval[-1] > tf)):
+            raise ValueError("t_eval must be sorted and lie within t_span.")
+
+    k1 = f(t0, x)
+    nfev = 1
+    if first_step is None:
+        h = _initial_step(k1, f, t0, x, rtol, atol)
+        nfev += 1
+    else:
+        h = float(first_step)
+    h = min(h, max_step, tf - t0)
+
+    t = t0
+    ts: list[float] = []
+    xs: list[np.ndarray] = []
+    eval_pos = 0
+    if t_eval is None:
+        ts.append(t)
+        xs.append(x.copy())
+    else:
+        while eval_pos < t_eval.size and t_eval[eval_pos] <= t0:
+            ts.append(float(t_eval[eval_pos]))
+            xs.append(x.copy())
+            eval_pos += 1
+
+    n_acc = 0
+    n_rej = 0
+    success = True
+    message = "Reached end of integration interval."
+    while t < tf:
+        if n_acc + n_rej >= max_steps:
+            success = False
+            message = f"Exceeded max_steps={max_steps}."
+            break
+        h = min(h, max_step, tf - t)
+        x_new, err, K = dopri45_step(f, t, x, h, k1)
+        nfev += 6
+        scale = atol + rtol * np.maximum(np.abs(x), np.abs(x_new))
+        err_norm = float(np.sqrt(np.mean((err / scale) ** 2)))
+        if not np.isfinite(err_norm):
+            err_norm = np.inf
+
+        if err_norm <= 1.0:
+            t_new = tf if (tf - (t + h)) <= 1e-12 * max(1.0, abs(tf)) else t + h
+            if t_eval is None:
+                ts.append(t_new)
+                xs.append(x_new.copy())
+            else:
+                stop = eval_pos
+                while stop < t_eval.size and t_eval[stop] <= t_new:
+                    stop += 1
+                if stop > eval_pos:
+                    theta = (t_eval[eval_pos:stop] - t) / h
+                    dense = _dense_eval(x, K, h, theta)
+                    ts.extend(float(v) for v in t_eval[eval_pos:stop])
+                    xs.extend(dense)
+                    eval_pos = stop
+            t, x, k1 = t_new, x_new, K[6]
+            n_acc += 1
+            factor = 10.0 if err_norm == 0.0 else min(10.0, 0.9 * err_norm ** -0.2)
+        else:
+            n_rej += 1
+            factor = max(0.2, 0.9 * err_norm ** -0.2) if np.isfinite(err_norm) else 0.2
+            if h * factor < 1e-14 * max(1.0, abs(t)):
+                success = False
+                message = "Step size underflow."
+                break
+        h = h * factor
+
+    return OdeSolution(
+        t=np.asarray(ts, dtype=float),
+        x=np.asarray(xs, dtype=float).reshape(len(xs), x.size),
+        nfev=int(nfev),
+        n_accepted=int(n_acc),
+        n_rejected=int(n_rej),
+        success=success,
+        message=message,
+    )
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.compiled import CompiledAircraft, inertia_inverse, resolve_parameters
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.dynamics.linearize import linearize, linearize_batch
+from adcs_core.model import xdot_full, xdot_full_batch
+from adcs_core.state.state_definition import ControlIndex, StateIndex
+
+# Local variable layout for the aero/force sensitivities:
+# [u_air, v_air, w_air, p, q, r, throttle, aileron, elevator, rudder]
+_NZ = 10
+_ZU, _ZV, _ZW, _ZP, _ZQ, _ZR = 0, 1, 2, 3, 4, 5
+_ZTH, _ZDA, _ZDE, _ZDR = 6, 7, 8, 9
+
+
+def _unit(i: int) -> np.ndarray:
+    e = np.zeros(_NZ, dtype=float)
+    e[i] = 1.0
+    return e
+
+
+def _skew(a: np.ndarray) -> np.ndarray:
+    return np.array([[0.0, -a[2], a[1]], [a[2], 0.0, -a[0]], [-a[1], a[0], 0.0]], dtype=float)
+
+
+def _control_vector(u: ControlInputs | np.ndarray) -> np.ndarray:
+    if isinstance(u, ControlInputs):
+        return np.array([u.throttle, u.aileron, u.elevator, u.rudder], dtype=float)
+    return np.asarray(u, dtype=float).reshape(4)
+
+
+def _clamp_with_gate(u_vec: np.ndarray, limits: ActuatorLimits) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    clamp_controls on a ControlIndex vector plus d(clamped)/d(raw) per channel.
+    The gate is 1 inside the closed limit interval and 0 once saturated.
+    """
+    lo = np.array([0.0, -limits.aileron_max_rad, -limits.elevator_max_rad, -limits.rudder_max_rad], dtype=float)
+    hi = np.array([1.0, limits.aileron_max_rad, limits.elevator_max_rad, limits.rudder_max_rad], dtype=float)
+    gate = ((u_vec >= lo) & (u_vec <= hi)).astype(float)
+    return np.clip(u_vec, lo, hi), gate
+
+
+def _aero_forces_moments_jacobian(
+    uvw: np.ndarray,
+    pqr: np.ndarray,
+    ctrl: np.ndarray,
+    params: AircraftParameters | CompiledAircraft,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    d(F_body)/dz and d(M_body)/dz, each (3, 10), for the aero model plus thrust, where
+    z = [uvw_air, pqr, clamped controls]. Mirrors compute_aero_forces_moments_body.
+    """
+    P = params
+    u, v, w = (float(c) for c in uvw)
+    p, q, r = (float(c) for c in pqr)
+    da, de, dr = float(ctrl[ControlIndex.AILERON]), float(ctrl[ControlIndex.ELEVATOR]), float(ctrl[ControlIndex.RUDDER])
+
+    V_raw = float(np.sqrt(u * u + v * v + w * w))
+    V = max(V_raw, 1e-3)
+    dV = np.zeros(_NZ, dtype=float)
+    if V_raw > 1e-3:
+        dV[_ZU], dV[_ZV], dV[_ZW] = u / V, v / V, w / V
+
+    alpha = float(np.arctan2(w, u))
+    dalpha = np.zeros(_NZ, dtype=float)
+    uw2 = u * u + w * w
+    if uw2 > 0.0:
+        dalpha[_ZU], dalpha[_ZW] = -w / uw2, u / uw2
+
+    s_raw = v / V
+    s = float(np.clip(s_raw, -0.999, 0.999))
+    beta = float(np.arcsin(s))
+    dbeta = np.zeros(_NZ, dtype=float)
+    if abs(s_raw) < 0.999:
+        # s = v / V with V itself a function of (u, v, w)
+        ds = -s_raw / V * dV
+        ds[_ZV] += 1.0 / V
+        dbeta = ds / np.sqrt(1.0 - s * s)
+
+    def hat(rate: float, idx: int, length: float) -> Tuple[float, np.ndarray]:
+        val = rate * length / (2.0 * V)
+        d = -val / V * dV
+        d[idx] += length / (2.0 * V)
+        return val, d
+
+    p_hat, dp_hat = hat(p, _ZP, P.b_m)
+    q_hat, dq_hat = hat(q, _ZQ, P.cbar_m)
+    r_hat, dr_hat = hat(r, _ZR, P.b_m)
+    e_da, e_de, e_dr = _unit(_ZDA), _unit(_ZDE), _unit(_ZDR)
+
+    CL = P.CL0 + P.CL_alpha_per_rad * alpha + P.CL_de_per_rad * de
+    dCL = P.CL_alpha_per_rad * dalpha + P.CL_de_per_rad * e_de
+    CD = P.CD0 + P.CD_k * (CL * CL)
+    dCD = 2.0 * P.CD_k * CL * dCL
+    CY = P.CY_beta_per_rad * beta + P.CY_dr_per_rad * dr
+    dCY = P.CY_beta_per_rad * dbeta + P.CY_dr_per_rad * e_dr
+    Cm = P.Cm0 + P.Cm_alpha_per_rad * alpha + P.Cm_q_per_rad * q_hat + P.Cm_de_per_rad * de
+    dCm = P.Cm_alpha_per_rad * dalpha + P.Cm_q_per_rad * dq_hat + P.Cm_de_per_rad * e_de
+    Cl = P.Cl_beta_per_rad * beta + P.Cl_p * p_hat + P.Cl_r * r_hat + P.Cl_da_per_rad * da + P.Cl_dr_per_rad * dr
+    dCl = P.Cl_beta_per_rad * dbeta + P.Cl_p * dp_hat + P.Cl_r * dr_hat + P.Cl_da_per_rad * e_da + P.Cl_dr_per_rad * e_dr
+    Cn = P.Cn_beta_per_rad * beta + P.Cn_p * p_hat + P.Cn_r * r_hat + P.Cn_da_per_rad * da + P.Cn_dr_per_rad * dr
+    dCn = P.Cn_beta_per_rad * dbeta + P.Cn_p * dp_hat + P.Cn_r * dr_hat + P.Cn_da_per_rad * e_da + P.Cn_dr_per_rad * e_dr
+
+    qS = 0.5 * P.rho_kgm3 * V * V * P.S_m2
+    dqS = P.rho_kgm3 * V * P.S_m2 * dV
+    L, dL = qS * CL, dqS * CL + qS * dCL
+    D, dD = qS * CD, dqS * CD + qS * dCD
+    Y, dY = qS * CY, dqS * CY + qS * dCY
+
+    ca, sa = np.cos(alpha), np.sin(alpha)
+    cb, sb = np.cos(beta), np.sin(beta)
+    dca, dsa = -sa * dalpha, ca * dalpha
+    dcb, dsb = -sb * dbeta, cb * dbeta
+
+    dF = np.empty((3, _NZ), dtype=float)
+    # F_body = wind_to_body(alpha, beta) @ [-D, Y, -L]
+    dF[0] = -(dca * cb + ca * dcb) * D - ca * cb * dD + (dca * sb + ca * dsb) * Y + ca * sb * dY + dsa * L + sa * dL
+    dF[1] = dsb * D + sb * dD + dcb * Y + cb * dY
+    dF[2] = -(dsa * cb + sa * dcb) * D - sa * cb * dD + (dsa * sb + sa * dsb) * Y + sa * sb * dY - dca * L - ca * dL
+    dF[0, _ZTH] += P.max_thrust_N
+
+    dM = np.empty((3, _NZ), dtype=float)
+    dM[0] = P.b_m * (dqS * Cl + qS * dCl)
+    dM[1] = P.cbar_m * (dqS * Cm + qS * dCm)
+    dM[2] = P.b_m * (dqS * Cn + qS * dCn)
+    return dF, dM
+
+
+def jacobian_full(
+    x: np.ndarray,
+    u: ControlInputs | np.ndarray,
+    params: AircraftParameters | CompiledAircraft | None = None,
+    limits: ActuatorLimits | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form (A, B) = (d xdot/dx, d xdot/du) of xdot_full at (x, u), no wind.
+
+    u is a ControlInputs or a (4,) vector ordered as ControlIndex. Saturated control
+    channels get a zero column in B, matching the clamp in forces_and_moments_body.
+    """
+    Iinv = None if params is None else inertia_inverse(params)
+    params, limits = resolve_parameters(params, limits)
+    x = np.asarray(x, dtype=float).reshape(12)
+    u_raw = _control_vector(u)
+    ctrl, gate = _clamp_with_gate(u_raw, limits)
+
+    uu, vv, ww = x[StateIndex.U], x[StateIndex.V], x[StateIndex.W]
+    phi, theta, psi = x[StateIndex.PHI], x[StateIndex.THETA], x[StateIndex.PSI]
+    p, q, r = x[StateIndex.P], x[StateIndex.Q], x[StateIndex.R]
+    v_b = np.array([uu, vv, ww], dtype=float)
+    omega = np.array([p, q, r], dtype=float)
+
+    dF, dM = _aero_forces_moments_jacobian(v_b, omega, ctrl, params)
+
+    m = params.mass_kg
+    g = params.g_ms2
+    I = np.asarray(params.inertia_kgm2, dtype=float)
+    Iinv = inertia_inverse(params) if Iinv is None else Iinv
+
+    cphi, sphi = np.cos(phi), np.sin(phi)
+    cth, sth = np.cos(theta), np.sin(theta)
+    cpsi, spsi = np.cos(psi), np.sin(psi)
+
+    A = np.zeros((12, 12), dtype=float)
+    B = np.zeros((12, 4), dtype=float)
+    pos = slice(StateIndex.X, StateIndex.Z + 1)
+    vel = slice(StateIndex.U, StateIndex.W + 1)
+    ang = slice(StateIndex.PHI, StateIndex.PSI + 1)
+    rate = slice(StateIndex.P, StateIndex.R + 1)
+
+    # --- kinematics: C_bi(phi, theta, psi) @ v_b ---
+    C = np.array(
+        [
+            [cth * cpsi, sphi * sth * cpsi - cphi * spsi, cphi * sth * cpsi + sphi * spsi],
+            [cth * spsi, sphi * sth * spsi + cphi * cpsi, cphi * sth * spsi - sphi * cpsi],
+            [-sth, sphi * cth, cphi * cth],
+        ],
+        dtype=float,
+    )
+    dC_dphi = np.array(
+        [
+            [0.0, cphi * sth * cpsi + sphi * spsi, -sphi * sth * cpsi + cphi * spsi],
+            [0.0, cphi * sth * spsi - sphi * cpsi, -sphi * sth * spsi - cphi * cpsi],
+            [0.0, cphi * cth, -sphi * cth],
+        ],
+        dtype=float,
+    )
+    dC_dtheta = np.array(
+        [
+            [-sth * cpsi, sphi * cth * cpsi, cphi * cth * cpsi],
+            [-sth * spsi, sphi * cth * spsi, cphi * cth * spsi],
+            [-cth, -sphi * sth, -cphi * sth],
+        ],
+        dtype=float,
+    )
+    dC_dpsi = np.array(
+        [
+            [-cth * spsi, -sphi * sth * spsi - cphi * cpsi, -cphi * sth * spsi + sphi * cpsi],
+            [cth * cpsi, sphi * sth * cpsi - cphi * spsi, cphi * sth * cpsi + sphi * spsi],
+            [0.0, 0.0, 0.0],
+        ],
+        dtype=float,
+    )
+    A[pos, vel] = C
+    A[pos, StateIndex.PHI] = dC_dphi @ v_b
+    A[pos, StateIndex.THETA] = dC_dtheta @ v_b
+    A[pos, StateIndex.PSI] = dC_dpsi @ v_b
+
+    # --- translational: F/m + C_bi^T g_i - omega x v_b ---
+    A[vel, vel] = dF[:, _ZU:_ZW + 1] / m - _skew(omega)
+    A[vel, rate] = dF[:, _ZP:_ZR + 1] / m + _skew(v_b)
+    A[StateIndex.V, StateIndex.PHI] = g * cphi * cth
+    A[StateIndex.W, StateIndex.PHI] = -g * sphi * cth
+    A[StateIndex.U, StateIndex.THETA] = -g * cth
+    A[StateIndex.V, StateIndex.THETA] = -g * sphi * sth
+    A[StateIndex.W, StateIndex.THETA] = -g * cphi * sth
+    B[vel] = dF[:, _ZTH:] / m * gate
+
+    # --- attitude: Euler rates T(phi, theta) @ omega (same cos(theta) guard) ---
+    guarded = abs(cth) < 1e-6
+    cth_e = 1e-6 * np.sign(cth if cth != 0.0 else 1.0) if guarded else cth
+    tth = np.tan(theta)
+    sec2 = 1.0 + tth * tth
+    A[ang, rate] = np.array(
+        [
+            [1.0, sphi * tth, cphi * tth],
+            [0.0, cphi, -sphi],
+            [0.0, sphi / cth_e, cphi / cth_e],
+        ],
+        dtype=float,
+    )
+    A[StateIndex.PHI, StateIndex.PHI] = (cphi * q - sphi * r) * tth
+    A[StateIndex.THETA, StateIndex.PHI] = -sphi * q - cphi * r
+    A[StateIndex.PSI, StateIndex.PHI] = (cphi * q - sphi * r) / cth_e
+    A[StateIndex.PHI, StateIndex.THETA] = (sphi * q + cphi * r) * sec2
+    A[StateIndex.PSI, StateIndex.THETA] = 0.0 if guarded else (sphi * q + cphi * r) * sth / (cth * cth)
+
+    # --- rotational: Iinv (M - omega x I omega) ---
+    h = I @ omega
+    d_gyro = _skew(omega) @ I - _skew(h)
+    A[rate, vel] = Iinv @ dM[:, _ZU:_ZW + 1]
+    A[rate, rate] = Iinv @ (dM[:, _ZP:_ZR + 1] - d_gyro)
+    B[rate] = Iinv @ dM[:, _ZTH:] * gate
+    return A, B
+
+
+@lru_cache(maxsize=1)
+def xdot_full_sparsity() -> np.ndarray:
+    """
+    Structural nonzero pattern (12, 16) of [A | B] for xdot_full, valid for any aircraft.
+
+    Evaluated once from jacobian_full at a generic state with every aero coefficient
+    nonzero and a fully coupled inertia tensor, so zero entries are zero by construction
+    (position columns, absent aero couplings) rather than by accident of the point.
+    """
+    params = replace(
+        AircraftParameters(),
+        inertia_kgm2=np.array([[1300.0, -40.0, -90.0], [-40.0, 1800.0, -25.0], [-90.0, -25.0, 2700.0]]),
+    )
+    x = np.array([10.0, -20.0, -1000.0, 50.0, 3.0, 4.0, 0.2, 0.1, 0.7, 0.05, 0.04, 0.03])
+    u = np.array([0.5, 0.02, -0.03, 0.01])
+    A, B = jacobian_full(x, u, params, ActuatorLimits())
+    pattern = np.hstack((A, B)) != 0.0
+    pattern.setflags(write=False)
+    return pattern
+
+
+def linearize_xdot_full(
+    x0: np.ndarray,
+    u0: np.ndarray,
+    params: AircraftParameters | CompiledAircraft | None = None,
+    limits: ActuatorLimits | None = None,
+    *,
+    method: str = "fd",
+    scheme: str = "central",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (A, B) of xdot_full at (x0, u0). method: "fd" (scalar central differences), "batch"
+    (one stacked xdot_full_batch call, scheme "central"/"forward"/"complex") or "analytic"
+    (jacobian_full). Both FD methods group columns by xdot_full_sparsity.
+    """
+    params, limits = resolve_parameters(params, limits)
+    if method == "analytic":
+        return jacobian_full(x0, u0, params, limits)
+    if method == "batch":
+        return linearize_batch(
+            lambda X, U: xdot_full_batch(X, U, params=params, limits=limits),
+            x0,
+            u0,
+            scheme=scheme,
+            sparsity=xdot_full_sparsity(),
+        )
+    if method != "fd":
+        raise ValueError(f"Unknown linearization method '{method}'.")
+
+    def f(x: np.ndarray, u_vec: np.ndarray) -> np.ndarray:
+        ctrl = ControlInputs(
+            throttle=float(u_vec[0]),
+            aileron=float(u_vec[1]),
+            elevator=float(u_vec[2]),
+            rudder=float(u_vec[3]),
+        )
+        return xdot_full(x, ctrl, params=params, limits=limits)
+
+    return linearize(f, x0, u0, sparsity=xdot_full_sparsity())
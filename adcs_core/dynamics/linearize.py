@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Callable, Sequence, Tuple
 
 import numpy as np
+from scipy.linalg import expm
 
 
 @dataclass(frozen=True)
@@ -18,27 +19,109 @@ class LinearizationPoint:
     u0: np.ndarray
 
 
+def color_columns(sparsity: np.ndarray) -> np.ndarray:
+    """
+    Curtis-Powell-Reed column grouping for a (p, n) boolean sparsity pattern.
+    Greedy colouring: two columns share a group only if they have no nonzero row in
+    common, so one perturbation recovers every column of the group. Returns (n,) group
+    ids; structurally empty columns get -1 and are never evaluated.
+    """
+    S = np.asarray(sparsity, dtype=bool)
+    colors = np.full(S.shape[1], -1, dtype=int)
+    used_rows: list[np.ndarray] = []
+    for j in range(S.shape[1]):
+        col = S[:, j]
+        if not col.any():
+            continue
+        for g, rows in enumerate(used_rows):
+            if not np.any(rows & col):
+                rows |= col
+                colors[j] = g
+                break
+        else:
+            used_rows.append(col.copy())
+            colors[j] = len(used_rows) - 1
+    return colors
+
+
+def detect_sparsity(
+    f: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    *,
+    n_probes: int = 3,
+    scale: float = 0.1,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Numerical sparsity pattern (p, n) of df/dx: union of the nonzeros of central-difference
+    Jacobians at random points around x0. Probing off x0 avoids accidental zeros (e.g. at
+    wings-level trim); the result is meant to be computed once and reused.
+    """
+    x0 = np.asarray(x0, dtype=float).reshape(-1)
+    rng = np.random.default_rng(seed)
+    pattern = None
+    for _ in range(int(n_probes)):
+        x = x0 + float(scale) * (np.abs(x0) + 1.0) * rng.standard_normal(x0.size)
+        nz = finite_difference_jacobian(f, x) != 0.0
+        pattern = nz if pattern is None else (pattern | nz)
+    return pattern
+
+
+def _grouped_steps(sparsity: np.ndarray, h: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    S = np.asarray(sparsity, dtype=bool)
+    if S.ndim != 2 or S.shape[1] != h.size:
+        raise ValueError(f"Sparsity pattern must have {h.size} columns, got shape {S.shape}.")
+    colors = color_columns(S)
+    steps = np.zeros((int(colors.max()) + 1, h.size), dtype=float)
+    active = colors >= 0
+    steps[colors[active], np.flatnonzero(active)] = h[active]
+    return S, colors, steps
+
+
+def _scatter_groups(S: np.ndarray, colors: np.ndarray, h: np.ndarray, dY: np.ndarray) -> np.ndarray:
+    # dY[g] is the directional difference for group g; column j owns rows S[:, j].
+    J = np.zeros(S.shape, dtype=float)
+    active = colors >= 0
+    J[:, active] = np.where(S[:, active], dY[colors[active]].T / h[active], 0.0)
+    return J
+
+
 def finite_difference_jacobian(
     f: Callable[[np.ndarray], np.ndarray],
     x0: np.ndarray,
-    eps: float = 1e-5,
+    eps: float | np.ndarray = 1e-5,
+    *,
+    sparsity: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Central finite-difference Jacobian of f at x0.
     f: R^n -> R^p
+    eps may be a scalar or per-column (n,). With a (p, n) sparsity pattern the columns are
+    grouped (color_columns) and each group costs one +/- evaluation pair.
     Returns J: (p, n)
     """
     x0 = np.asarray(x0, dtype=float).reshape(-1)
+    if sparsity is not None:
+        h = np.broadcast_to(np.asarray(eps, dtype=float), x0.shape)
+        S, colors, steps = _grouped_steps(sparsity, h)
+        dY = np.empty((steps.shape[0], S.shape[0]), dtype=float)
+        for g, dx in enumerate(steps):
+            yp = np.asarray(f(x0 + dx), dtype=float).reshape(-1)
+            ym = np.asarray(f(x0 - dx), dtype=float).reshape(-1)
+            dY[g] = 0.5 * (yp - ym)
+        return _scatter_groups(S, colors, h, dY)
+
     y0 = np.asarray(f(x0), dtype=float).reshape(-1)
     n = x0.size
     p = y0.size
     J = np.zeros((p, n), dtype=float)
+    eps_cols = np.broadcast_to(np.asarray(eps, dtype=float), (n,))
     for i in range(n):
         dx = np.zeros(n)
-        dx[i] = eps
+        dx[i] = eps_cols[i]
         yp = np.asarray(f(x0 + dx), dtype=float).reshape(-1)
         ym = np.asarray(f(x0 - dx), dtype=float).reshape(-1)
-        J[:, i] = (yp - ym) / (2.0 * eps)
+        J[:, i] = (yp - ym) / (2.0 * eps_cols[i])
     return J
 
 
@@ -49,19 +132,114 @@ def linearize(
     *,
     eps_x: float = 1e-5,
     eps_u: float = 1e-5,
+    sparsity: np.ndarray | None = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
     Linearize nonlinear dynamics xdot = f(x,u) about (x0,u0).
+    sparsity: optional (n, n + m) pattern of [A | B]; state and input columns are then
+    grouped jointly so independent columns share evaluations.
     Returns (A,B).
     """
     x0 = np.asarray(x0, dtype=float).reshape(-1)
     u0 = np.asarray(u0, dtype=float).reshape(-1)
 
+    if sparsity is not None:
+        n = x0.size
+        eps = np.concatenate((np.full(n, eps_x, dtype=float), np.full(u0.size, eps_u, dtype=float)))
+        J = finite_difference_jacobian(
+            lambda z: f(z[:n], z[n:]), np.concatenate((x0, u0)), eps=eps, sparsity=sparsity
+        )
+        return J[:, :n], J[:, n:]
+
     A = finite_difference_jacobian(lambda x: f(x, u0), x0, eps=eps_x)
     B = finite_difference_jacobian(lambda u: f(x0, u), u0, eps=eps_u)
     return A, B
 
 
+# Default step per scheme: central/forward are real perturbations, "complex" is the
+# imaginary step of the complex-step derivative (no subtraction, so it can be tiny).
+FD_SCHEMES = {"central": 1e-5, "forward": 1e-6, "complex": 1e-20}
+
+
+def finite_difference_jacobian_batch(
+    f_batch: Callable[[np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    *,
+    eps: float | np.ndarray | None = None,
+    scheme: str = "central",
+    sparsity: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Finite-difference Jacobian of f at x0 from ONE call on a stack of perturbed points.
+    f_batch: (k, n) -> (k, p), evaluated row-wise.
+    scheme: "central" (2n rows), "forward" (n + 1 rows) or "complex" (n rows, complex-step;
+    f_batch must propagate complex inputs). eps may be a scalar or per-column (n,).
+    With a (p, n) sparsity pattern, n above becomes the number of column groups.
+    Returns J: (p, n)
+    """
+    if scheme not in FD_SCHEMES:
+        raise ValueError(f"Unknown finite-difference scheme '{scheme}'.")
+    x0 = np.asarray(x0, dtype=float).reshape(-1)
+    n = x0.size
+    h = np.broadcast_to(np.asarray(FD_SCHEMES[scheme] if eps is None else eps, dtype=float), (n,))
+    if sparsity is None:
+        steps = np.diag(h)
+    else:
+        S, colors, steps = _grouped_steps(sparsity, h)
+    k = steps.shape[0]
+
+    if scheme == "central":
+        Y = np.asarray(f_batch(np.concatenate((x0 + steps, x0 - steps))), dtype=float)
+        dY = 0.5 * (Y[:k] - Y[k:])
+    elif scheme == "forward":
+        Y = np.asarray(f_batch(np.concatenate((x0[None, :], x0 + steps))), dtype=float)
+        dY = Y[1:] - Y[0]
+    else:
+        dY = np.imag(np.asarray(f_batch(x0 + 1j * steps)))
+
+    if sparsity is None:
+        return (dY / h[:, None]).T
+    return _scatter_groups(S, colors, h, dY)
+
+
+def linearize_batch(
+    f_batch: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x0: np.ndarray,
+    u0: np.ndarray,
+    *,
+    eps_x: float | None = None,
+    eps_u: float | None = None,
+    scheme: str = "central",
+    sparsity: np.ndarray | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched counterpart of linearize: state and input perturbations are stacked and
+    evaluated in a single f_batch(X[k, n], U[k, m]) -> (k, n) call (e.g. xdot_full_batch).
+    sparsity: optional (n, n + m) pattern of [A | B] used to group columns.
+    Returns (A,B).
+    """
+    if scheme not in FD_SCHEMES:
+        raise ValueError(f"Unknown finite-difference scheme '{scheme}'.")
+    x0 = np.asarray(x0, dtype=float).reshape(-1)
+    u0 = np.asarray(u0, dtype=float).reshape(-1)
+    n = x0.size
+    default = FD_SCHEMES[scheme]
+    eps = np.concatenate(
+        (
+            np.full(n, default if eps_x is None else eps_x, dtype=float),
+            np.full(u0.size, default if eps_u is None else eps_u, dtype=float),
+        )
+    )
+    J = finite_difference_jacobian_batch(
+        lambda Z: f_batch(Z[:, :n], Z[:, n:]),
+        np.concatenate((x0, u0)),
+        eps=eps,
+        scheme=scheme,
+        sparsity=sparsity,
+    )
+    return J[:, :n], J[:, n:]
+
+
 def select_subsystem(
     A: np.ndarray,
     B: np.ndarray,
@@ -79,3 +257,17 @@ def select_subsystem(
     A_sub = A[np.ix_(state_idx, state_idx)]
     B_sub = B[np.ix_(state_idx, input_idx)]
     return A_sub, B_sub
+
+
+def discretize_zoh(A: np.ndarray, B: np.ndarray, dt: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exact zero-order-hold discretization x[k+1] = Ad x[k] + Bd u[k] via one matrix exponential.
+    """
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    n, m = A.shape[0], B.shape[1]
+    M = np.zeros((n + m, n + m), dtype=float)
+    M[:n, :n] = A
+    M[:n, n:] = B
+    E = expm(M * float(dt))
+    return E[:n, :n], E[:n, n:]
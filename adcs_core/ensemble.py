@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Sequence
+
+import numpy as np
+
+from adcs_core.aircraft.forces_moments import ActuatorLimits
+from adcs_core.aircraft.parameters import AircraftParameters, StackedParameters, stack_parameters
+from adcs_core.control.actuators import ActuatorBatch
+from adcs_core.control.autopilot import AutopilotBatch, AutopilotTargets
+from adcs_core.control.failure_modes import FailureManager
+from adcs_core.dynamics.integrator import Rk4Workspace, rk4_step_inplace
+from adcs_core.environment.dryden import BlockNormals, shaping_filter_step
+from adcs_core.environment.wind import WindModel, dryden_like_axes, wind_sample
+from adcs_core.model import xdot_full_batch
+from adcs_core.scenarios.scenario_runner import ScenarioEvent, ScenarioRunner
+from adcs_core.sensors.airspeed import AirspeedSensor
+from adcs_core.sensors.altimeter import Altimeter
+from adcs_core.sensors.common import SampleHold, ScalarSensorBase, sensor_sample
+from adcs_core.sensors.compass import Compass
+from adcs_core.sensors.imu import IMU, IMU_CHANNELS, imu_sample, specific_force
+from adcs_core.seeding import DRYDEN_LIKE_SEED_OFFSETS, SENSOR_SEED_OFFSETS, SeedLike, derive_seed
+from adcs_core.simulator import apply_scenario_event, default_initial_state
+from adcs_core.state.state_definition import StateIndex
+
+
+def _offset_seeds(seeds: Sequence[SeedLike], offset: int) -> list[SeedLike]:
+    return [derive_seed(s, offset) for s in seeds]
+
+
+class _ScalarSensorBank:
+    """
+    ScalarSensorBase.read for N members: shared sample schedule and delay line, per-member
+    bias and noise streams.
+    """
+
+    def __init__(self, template: ScalarSensorBase, seeds: Sequence[SeedLike], *, wrap: bool = False) -> None:
+        self.noise = template.noise
+        self._wrap = wrap
+        self._z = BlockNormals(seeds)
+        n = len(seeds)
+        self._bias = np.full(n, float(self.noise.bias0))
+        self._hold: SampleHold[np.ndarray] = SampleHold(template.sample, np.zeros(n, dtype=float))
+
+    def read(self, t: float, true_value: np.ndarray, dt: float) -> np.ndarray:
+        if self._hold.due(t):
+            meas, self._bias = sensor_sample(self.noise, self._bias, true_value, dt, self._z.take)
+            self._hold.push(t, meas)
+        out = self._hold.output(t)
+        return (out + np.pi) % (2.0 * np.pi) - np.pi if self._wrap else out
+
+
+class _ImuBank:
+    """
+    IMU.read for N members (gyro and specific-force channels, same draw order).
+    """
+
+    def __init__(self, template: IMU, seeds: Sequence[SeedLike]) -> None:
+        self.gyro_noise = template.gyro_noise
+        self.accel_noise = template.accel_noise
+        self._z = BlockNormals(seeds)
+        n = len(seeds)
+        self._gyro_bias = np.full((n, 3), float(self.gyro_noise.bias0))
+        self._accel_bias = np.full((n, 3), float(self.accel_noise.bias0))
+        self._hold: SampleHold[np.ndarray] = SampleHold(template.sample)
+        self._prev_vb = np.zeros((n, 3), dtype=float)
+
+    def read(self, t: float, pqr: np.ndarray, v_b: np.ndarray, g_b: np.ndarray, dt: float) -> Dict[str, np.ndarray]:
+        if self._hold.due(t):
+            f_b = specific_force(pqr, v_b, self._prev_vb, g_b, dt)
+            gyro, accel, self._gyro_bias, self._accel_bias = imu_sample(
+                self.gyro_noise, self.accel_noise, self._gyro_bias, self._accel_bias, pqr, f_b, dt, self._z.take
+            )
+            self._hold.push(t, np.concatenate([gyro, accel], axis=1))
+            self._prev_vb = np.array(v_b, dtype=float)
+
+        out = self._hold.output(t)
+        if out is None:
+            out = np.concatenate([pqr, np.zeros_like(pqr)], axis=1)
+        return {name: out[:, i] for i, name in enumerate(IMU_CHANNELS)}
+
+
+class _WindBank:
+    """
+    WindModel (Dryden-like shaping filters + white gust) for N members.
+    """
+
+    def __init__(self, template: WindModel, steady_ned_mps: np.ndarray, seeds: Sequence[SeedLike]) -> None:
+        if not template.use_dryden_like:
+            raise ValueError("EnsembleSimulator supports the Dryden-like WindModel only.")
+        self.steady = steady_ned_mps
+        self.gust_std = template.gust_std_mps
+        self._sigma, self._tau = dryden_like_axes(template.turb_std_mps, template.turb_tau_s)
+        # One stream per (member, axis), member-major, as DrydenLikeTurbulence seeds its axes.
+        self._filters = BlockNormals([derive_seed(s, k) for s in seeds for k in DRYDEN_LIKE_SEED_OFFSETS])
+        self._active = np.tile(self._tau > 0.0, len(seeds))
+        self._gust = BlockNormals(seeds)
+        self._turb = np.zeros_like(steady_ned_mps)
+
+    def step(self, dt: float) -> np.ndarray:
+        if dt > 0.0 and np.any(self._active):
+            axes = self._tau > 0.0
+            a = np.clip(dt / self._tau[axes], 0.0, 1.0)
+            w = self._filters.take(1, None if np.all(axes) else self._active)[:, 0].reshape(-1, int(np.sum(axes)))
+            self._turb[:, axes] = shaping_filter_step(self._turb[:, axes], a, self._sigma[axes], w)
+        return wind_sample(self.steady, self._turb, self.gust_std, self._gust.take)
+
+
+def _ned_to_body(X: np.ndarray, w_ned: np.ndarray) -> np.ndarray:
+    """
+    C_bi^T w_ned for each member (the rotation used by rotation_body_to_inertial).
+    """
+    phi, theta, psi = X[:, int(StateIndex.PHI)], X[:, int(StateIndex.THETA)], X[:, int(StateIndex.PSI)]
+    cphi, sphi = np.cos(phi), np.sin(phi)
+    cth, sth = np.cos(theta), np.sin(theta)
+    cpsi, spsi = np.cos(psi), np.sin(psi)
+    wn, we, wd = w_ned[:, 0], w_ned[:, 1], w_ned[:, 2]
+    out = np.empty_like(w_ned)
+    out[:, 0] = cth * cpsi * wn + cth * spsi * we - sth * wd
+    out[:, 1] = (sphi * sth * cpsi - cphi * spsi) * wn + (sphi * sth * spsi + cphi * cpsi) * we + sphi * cth * wd
+    out[:, 2] = (cphi * sth * cpsi + sphi * spsi) * wn + (cphi * sth * spsi - sphi * cpsi) * we + cphi * cth * wd
+    return out
+
+
+@dataclass(frozen=True)
+class EnsembleTrace:
+    """
+    Lockstep ensemble run: t (n_steps + 1,), x (n_steps + 1, N, 12), u (n_steps + 1, N, 4),
+    wind_ned_mps (n_steps + 1, N, 3); member i matches SimTrace of its own simulator run.
+    """
+
+    t: np.ndarray
+    x: np.ndarray
+    u: np.ndarray
+    wind_ned_mps: np.ndarray
+
+
+class EnsembleSimulator:
+    """
+    N closed-loop aircraft advanced in lockstep, with simulator.simulate_closed_loop semantics per member.
+
+    Member i uses seeds[i] exactly as simulator.simulate_closed_loop(seed=seeds[i]) does (wind, Dryden-like
+    turbulence, gusts, each sensor), so with equal inputs its trajectory matches the single
+    run up to floating-point summation order in the batched dynamics. params may be one
+    AircraftParameters, one per member (dispersions) or a StackedParameters; x0 and
+    wind_ned_mps may be shared or (N, ...). Targets, events and failures are shared by the
+    ensemble. Every step runs one vectorized pass over all members (sensors, autopilot,
+    actuators, batched RK4).
+    """
+
+    def __init__(
+        self,
+        n_members: int,
+        *,
+        targets: AutopilotTargets = AutopilotTargets(),
+        autopilot_enabled: bool = True,
+        actuator_tau: float = 0.15,
+        seeds: Sequence[SeedLike] | None = None,
+        params: AircraftParameters | StackedParameters | Sequence[AircraftParameters] | None = None,
+        x0: np.ndarray | None = None,
+        wind_ned_mps: np.ndarray | Sequence[float] = (0.0, 0.0, 0.0),
+        events: Sequence[ScenarioEvent] = (),
+    ) -> None:
+        n = int(n_members)
+        if n < 1:
+            raise ValueError("n_members must be >= 1")
+        seeds = [None] * n if seeds is None else [s if s is None or isinstance(s, np.random.SeedSequence) else int(s) for s in seeds]
+        if len(seeds) != n:
+            raise ValueError(f"Expected {n} seeds, got {len(seeds)}.")
+        if params is None:
+            params = AircraftParameters()
+        elif not isinstance(params, (AircraftParameters, StackedParameters)):
+            params = stack_parameters(params)
+        if isinstance(params, StackedParameters) and params.n_members != n:
+            raise ValueError(f"Expected {n} parameter sets, got {params.n_members}.")
+
+        self.n = n
+        self.params = params
+        self.limits = ActuatorLimits()
+        self.targets = targets
+        self.autopilot_enabled = bool(autopilot_enabled)
+        self.t = 0.0
+        x_init = default_initial_state().as_vector() if x0 is None else np.asarray(x0, dtype=float)
+        self.X = np.array(np.broadcast_to(x_init, (n, 12)), dtype=float)
+
+        self.autopilot = AutopilotBatch(n)
+        self.actuators = ActuatorBatch(n, tau_s=actuator_tau, limits=self.limits)
+        self.actuators.reset(np.array([0.5, 0.0, 0.0, 0.0]))
+        self.failures = FailureManager()
+        self._frozen: Dict[str, np.ndarray] = {}
+        self._scenario = ScenarioRunner(list(events))
+        self.U_cmd = np.tile(np.array([0.5, 0.0, 0.0, 0.0]), (n, 1))
+
+        steady = np.array(np.broadcast_to(np.asarray(wind_ned_mps, dtype=float), (n, 3)), dtype=float)
+        self.wind = _WindBank(WindModel(), steady, seeds)
+        self.altimeter = _ScalarSensorBank(Altimeter(), _offset_seeds(seeds, SENSOR_SEED_OFFSETS["altimeter"]))
+        self.airspeed_sensor = _ScalarSensorBank(AirspeedSensor(), _offset_seeds(seeds, SENSOR_SEED_OFFSETS["airspeed"]))
+        self.compass = _ScalarSensorBank(Compass(), _offset_seeds(seeds, SENSOR_SEED_OFFSETS["compass"]), wrap=True)
+        self.imu = _ImuBank(IMU(), _offset_seeds(seeds, SENSOR_SEED_OFFSETS["imu"]))
+
+        self._work = Rk4Workspace.for_shape((n, 12))
+        self._U = self.actuators.U
+        self._w_ned = np.zeros((n, 3), dtype=float)
+
+    def _apply_event(self, evt: ScenarioEvent) -> None:
+        self.targets = apply_scenario_event(evt, self.failures, self.targets)
+
+    def _apply_sensor_failures(self, meas: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        FailureManager.apply_sensors with a per-member frozen-value cache (NaN = none yet).
+        """
+        sens = self.failures.sens
+        out = {}
+        for k, v in meas.items():
+            b = (sens.bias_spike or {}).get(k)
+            if b is not None:
+                v = np.where(np.isfinite(v), v + b, v)
+            cache = self._frozen.setdefault(k, np.full(self.n, np.nan))
+            if (sens.dropout or {}).get(k, False):
+                out[k] = np.full(self.n, np.nan)
+                continue
+            finite = np.isfinite(v)
+            if (sens.freeze or {}).get(k, False):
+                fresh = np.isnan(cache)
+                out[k] = np.where(fresh, np.where(finite, v, np.nan), cache)
+                self._frozen[k] = np.where(fresh & finite, v, cache)
+            else:
+                out[k] = v
+                self._frozen[k] = np.where(finite, v, cache)
+        return out
+
+    def _apply_actuator_failures(self, U: np.ndarray) -> np.ndarray:
+        act = self.failures.act
+        U = np.array(U, dtype=float)
+        U[:, 0] = np.clip(U[:, 0] * float(act.throttle_scale), 0.0, 1.0)
+        if act.throttle_stuck is not None:
+            U[:, 0] = float(np.clip(act.throttle_stuck, 0.0, 1.0))
+        for col, stuck in ((1, act.aileron_stuck_rad), (2, act.elevator_stuck_rad), (3, act.rudder_stuck_rad)):
+            if stuck is not None:
+                U[:, col] = float(stuck)
+        return U
+
+    def _deriv_into(self, t: float, X: np.ndarray, out: np.ndarray) -> np.ndarray:
+        # Controls and NED wind are held over the RK4 stages; the wind is re-rotated per stage.
+        uvw_air = X[:, int(StateIndex.U) : int(StateIndex.W) + 1] - _ned_to_body(X, self._w_ned)
+        return xdot_full_batch(X, self._U, params=self.params, limits=self.limits, uvw_air_mps=uvw_air, out=out)
+
+    def step(self, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every member by dt. Returns (U, w_ned) applied over the step, both (N, ...).
+        """
+        if dt <= 0.0:
+            raise ValueError("dt must be > 0")
+        t, X = self.t, self.X
+        self._scenario.step(t, self._apply_event)
+        self.failures.step(t)
+
+        w_ned = self.wind.step(dt)
+        v_b = X[:, int(StateIndex.U) : int(StateIndex.W) + 1]
+        v_air = v_b - _ned_to_body(X, w_ned)
+        phi, theta = X[:, int(StateIndex.PHI)], X[:, int(StateIndex.THETA)]
+        g = np.asarray(self.params.g_ms2, dtype=float).reshape(-1, 1)
+        g_b = g * np.column_stack([-np.sin(theta), np.sin(phi) * np.cos(theta), np.cos(phi) * np.cos(theta)])
+
+        meas = {
+            "altitude_m": self.altimeter.read(t, -X[:, int(StateIndex.Z)], dt),
+            "airspeed_mps": self.airspeed_sensor.read(t, np.sqrt(np.sum(v_air * v_air, axis=1)), dt),
+            "heading_rad": self.compass.read(t, X[:, int(StateIndex.PSI)], dt),
+            "phi_rad": phi.copy(),
+            "theta_rad": theta.copy(),
+        }
+        meas.update(self.imu.read(t, X[:, int(StateIndex.P) :], v_b.copy(), g_b, dt))
+        meas = self._apply_sensor_failures(meas)
+
+        if self.autopilot_enabled:
+            self.U_cmd = self.autopilot.update(meas, self.targets, dt)
+        self.U_cmd = self._apply_actuator_failures(self.U_cmd)
+        U = self.actuators.update(self.U_cmd, dt)
+
+        self._U, self._w_ned = U, w_ned
+        rk4_step_inplace(self._deriv_into, t, X, dt, out=X, work=self._work)
+        for idx in (StateIndex.PHI, StateIndex.THETA, StateIndex.PSI):
+            X[:, int(idx)] = (X[:, int(idx)] + np.pi) % (2.0 * np.pi) - np.pi
+        self.t = t + dt
+        return U, w_ned
+
+    def run(self, tfinal: float, dt: float) -> EnsembleTrace:
+        """
+        ceil(tfinal / dt) + 1 steps from the current time, logged row for row like
+        simulator.simulate_closed_loop: the state at the start of each step with the controls and
+        wind applied over it.
+        """
+        steps = int(np.ceil(tfinal / dt))
+        t_hist = np.empty(steps + 1, dtype=float)
+        x_hist = np.empty((steps + 1, self.n, 12), dtype=float)
+        u_hist = np.empty((steps + 1, self.n, 4), dtype=float)
+        w_hist = np.empty((steps + 1, self.n, 3), dtype=float)
+        for k in range(steps + 1):
+            t_hist[k] = self.t
+            x_hist[k] = self.X
+            u_hist[k], w_hist[k] = self.step(dt)
+        return EnsembleTrace(t=t_hist, x=x_hist, u=u_hist, wind_ned_mps=w_hist)
@@ -1,8 +1,69 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Sequence
 
 import numpy as np
+from scipy.signal import lfilter
+
+from adcs_core.seeding import DRYDEN_LIKE_SEED_OFFSETS, SeedLike, derive_seed
+
+FT_PER_M = 3.28084
+
+
+class BlockNormals:
+    """
+    Standard normals from one generator per stream, drawn in preallocated blocks. Bulk
+    draws continue the same sequence as one-at-a-time rng.normal(0, 1) calls, so every
+    stream reproduces the scalar object seeded the same way while amortizing the calls.
+    """
+
+    def __init__(self, seeds: Sequence[SeedLike], block: int = 1024) -> None:
+        self._rngs = [np.random.default_rng(s) for s in seeds]
+        self._block = max(1, int(block))
+        self._buf = np.empty((len(self._rngs), self._block), dtype=float)
+        self._pos = np.full(len(self._rngs), self._block, dtype=np.int64)
+        # All streams at the same buffer position: take() can return a plain slice.
+        self._aligned = True
+
+    def _refill(self, rows: np.ndarray, width: int) -> None:
+        # Unused values move to the front, so every stream continues its sequence.
+        buf = self._buf if width == self._buf.shape[1] else np.empty((len(self._rngs), width), dtype=float)
+        for r in rows:
+            rest = self._buf[r, self._pos[r] :]
+            buf[r, : rest.size] = rest
+            buf[r, rest.size :] = self._rngs[r].standard_normal(width - rest.size)
+            self._pos[r] = 0
+        self._buf = buf
+
+    def take(self, k: int, rows: np.ndarray | None = None) -> np.ndarray:
+        """
+        Next k normals of every stream, (n_streams, k), or only of the streams selected by
+        rows (indices or a boolean mask), (len(rows), k); other streams do not advance.
+        """
+        k = int(k)
+        width = self._buf.shape[1]
+        if rows is None and self._aligned:
+            p = int(self._pos[0]) if self._pos.size else 0
+            if p + k > width:
+                self._refill(np.arange(len(self._rngs)), max(k, self._block))
+                p = 0
+            self._pos += k
+            return self._buf[:, p : p + k]
+
+        idx = np.arange(len(self._rngs)) if rows is None else np.asarray(rows)
+        if idx.dtype == bool:
+            idx = np.flatnonzero(idx)
+        if k > width:
+            self._refill(np.arange(len(self._rngs)), max(k, self._block))
+        else:
+            stale = idx[self._pos[idx] + k > width]
+            if stale.size:
+                self._refill(stale, width)
+        pos = self._pos[idx]
+        self._pos[idx] = pos + k
+        self._aligned = bool(np.all(self._pos == self._pos[0]))
+        return self._buf[idx[:, None], pos[:, None] + np.arange(k)]
 
 
 @dataclass
@@ -18,7 +79,7 @@ class FirstOrderShapingFilter:
 
     sigma: float
     tau_s: float
-    seed: int | None = None
+    seed: SeedLike = None
 
     _rng: np.random.Generator = field(init=False)
     _x: float = field(init=False, default=0.0)
@@ -35,6 +96,14 @@ class FirstOrderShapingFilter:
         return self._x
 
 
+def shaping_filter_step(x: np.ndarray, a: np.ndarray, sigma: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """
+    One first-order shaping-filter update (1 - a) x + a sigma w with standard normals w;
+    broadcasts over axes and ensemble members.
+    """
+    return (1.0 - a) * x + a * (sigma * w)
+
+
 @dataclass
 class DrydenLikeTurbulence:
     """
@@ -44,6 +113,10 @@ class DrydenLikeTurbulence:
     Parameterization:
       sigma_*: intensity [m/s]
       tau_*: correlation time [s]
+
+    First-order shaping filter per axis, x <- (1 - a) x + a sigma w with a = dt / tau, all
+    three axes updated together. Each axis keeps its own noise stream (derive_seed(seed, k)
+    for k in DRYDEN_LIKE_SEED_OFFSETS), drawn in blocks.
     """
 
     sigma_n: float = 1.0
@@ -52,20 +125,75 @@ class DrydenLikeTurbulence:
     tau_n_s: float = 3.0
     tau_e_s: float = 3.0
     tau_d_s: float = 2.0
-    seed: int | None = None
+    seed: SeedLike = None
 
-    _fn: FirstOrderShapingFilter = field(init=False)
-    _fe: FirstOrderShapingFilter = field(init=False)
-    _fd: FirstOrderShapingFilter = field(init=False)
+    _noise: BlockNormals = field(init=False)
+    _x: np.ndarray = field(init=False)
+    _dt: float | None = field(init=False, default=None)
+    _a: np.ndarray = field(init=False)
 
     def __post_init__(self) -> None:
-        base = 0 if self.seed is None else int(self.seed)
-        self._fn = FirstOrderShapingFilter(self.sigma_n, self.tau_n_s, seed=None if self.seed is None else base + 10)
-        self._fe = FirstOrderShapingFilter(self.sigma_e, self.tau_e_s, seed=None if self.seed is None else base + 11)
-        self._fd = FirstOrderShapingFilter(self.sigma_d, self.tau_d_s, seed=None if self.seed is None else base + 12)
+        self._noise = BlockNormals([derive_seed(self.seed, k) for k in DRYDEN_LIKE_SEED_OFFSETS])
+        self._sigma = np.array([self.sigma_n, self.sigma_e, self.sigma_d], dtype=float)
+        self._tau = np.array([self.tau_n_s, self.tau_e_s, self.tau_d_s], dtype=float)
+        self._active = self._tau > 0.0
+        self._all_active = bool(np.all(self._active))
+        self._x = np.zeros(3, dtype=float)
+
+    def _gain(self, dt: float) -> np.ndarray:
+        if dt != self._dt:
+            self._a = np.clip(dt / np.where(self._active, self._tau, 1.0), 0.0, 1.0)
+            self._dt = dt
+        return self._a
 
     def step(self, dt: float) -> np.ndarray:
-        return np.array([self._fn.step(dt), self._fe.step(dt), self._fd.step(dt)], dtype=float)
+        if dt <= 0.0:
+            return self._x.copy()
+        if self._all_active:
+            a = self._gain(dt)
+            self._x = shaping_filter_step(self._x, a, self._sigma, self._noise.take(1)[:, 0])
+        elif np.any(self._active):
+            a = self._gain(dt)[self._active]
+            w = self._noise.take(1, self._active)[:, 0]
+            self._x[self._active] = shaping_filter_step(self._x[self._active], a, self._sigma[self._active], w)
+        return self._x.copy()
+
+    def series(self, n_steps: int, dt: float) -> np.ndarray:
+        """
+        The next n_steps outputs of step(dt) at once, (n_steps, 3), via scipy.signal.lfilter
+        on one noise block per axis (equal to stepping up to round-off); for offline runs.
+        """
+        out = np.tile(self._x, (int(n_steps), 1))
+        if dt <= 0.0 or n_steps <= 0 or not np.any(self._active):
+            return out
+        a = self._gain(dt)
+        w = self._noise.take(int(n_steps), self._active)
+        for i, k in enumerate(np.flatnonzero(self._active)):
+            out[:, k] = lfilter([a[k] * self._sigma[k]], [1.0, a[k] - 1.0], w[i], zi=[(1.0 - a[k]) * self._x[k]])[0]
+        self._x = out[-1].copy()
+        return out
+
+
+def dryden_coefficients(dt: float, h_m: np.ndarray, V_mps: np.ndarray, intensity: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Discrete MIL-HDBK-1797 low-altitude Dryden coefficients for x <- a x + b w (feet units),
+    each (..., 3) for axes (u, v, w): a = exp(-dt V / L), b = sigma sqrt(1 - a^2).
+    """
+    # MIL-HDBK-1797 formulas use feet.
+    h_ft = np.maximum(np.asarray(h_m, dtype=float) * FT_PER_M, 10.0)
+    V_fps = np.asarray(V_mps, dtype=float) * FT_PER_M
+
+    # Intensity scaling: map 0-1 to 0-30 knots (W20)
+    W20_fps = intensity * 30.0 * 1.68781
+    sigma_w = 0.1 * W20_fps * np.ones_like(h_ft)
+    L_w = h_ft
+    L_u = h_ft / (0.177 + 0.000823 * h_ft) ** 1.2
+    sigma_u = sigma_w / (0.177 + 0.000823 * h_ft) ** 0.4
+
+    scales = np.stack([L_u, L_u, L_w], axis=-1)
+    sigmas = np.stack([sigma_u, sigma_u, sigma_w], axis=-1)
+    a = np.exp(-dt / (scales / V_fps[..., None]))
+    return a, sigmas * np.sqrt(1.0 - a**2)
 
 
 @dataclass
@@ -77,20 +205,41 @@ class DrydenTurbulence:
     The model depends on:
       - altitude (h)
       - airspeed (V)
+
+    Filter coefficients are cached and only recomputed once altitude or airspeed move by
+    more than h_tol_m / V_tol_mps (or dt / intensity change); zero tolerances recompute
+    every step (matching the per-step formulas to round-off). Noise is drawn in blocks
+    from one stream.
     """
 
     intensity: float = 0.1  # 0 to 1 scaling
-    seed: int | None = None
+    seed: SeedLike = None
+    h_tol_m: float = 1.0
+    V_tol_mps: float = 0.1
 
-    _rng: np.random.Generator = field(init=False)
+    _noise: BlockNormals = field(init=False)
     _states: np.ndarray = field(init=False, default_factory=lambda: np.zeros(3))
+    _cache: tuple[float, float, float, float, np.ndarray, np.ndarray] | None = field(init=False, default=None)
     last_output: np.ndarray = field(init=False, default_factory=lambda: np.zeros(3))
 
     def __post_init__(self) -> None:
-        self._rng = np.random.default_rng(self.seed)
+        self._noise = BlockNormals([self.seed])
         self._states = np.zeros(3, dtype=float)
         self.last_output = np.zeros(3, dtype=float)
 
+    def _coefficients(self, dt: float, h_m: float, V_mps: float) -> tuple[np.ndarray, np.ndarray]:
+        c = self._cache
+        if (
+            c is None
+            or c[0] != dt
+            or c[1] != self.intensity
+            or abs(h_m - c[2]) > self.h_tol_m
+            or abs(V_mps - c[3]) > self.V_tol_mps
+        ):
+            a, b = dryden_coefficients(dt, h_m, V_mps, self.intensity)
+            c = self._cache = (dt, self.intensity, h_m, V_mps, a, b)
+        return c[4], c[5]
+
     def step(self, dt: float, h_m: float, V_mps: float) -> np.ndarray:
         """
         Advance turbulence state. Returns (ug, vg, wg) in [m/s].
@@ -99,42 +248,88 @@ class DrydenTurbulence:
             self.last_output = np.zeros(3)
             return self.last_output
 
-        # 1. Coordinate & Unit Conversion
-        # MIL-HDBK-1797 formulas use feet.
-        h_ft = max(h_m * 3.28084, 10.0)
-        V_fps = V_mps * 3.28084
-
-        # 2. Parameters (Low Altitude Model h < 1000 ft)
-        # Intensity scaling: map 0-1 to 0-30 knots (W20)
-        W20_fps = self.intensity * 30.0 * 1.68781  # 30 knots in fps
-
-        # Vertical intensity
-        sigma_w = 0.1 * W20_fps
-        # Vertical scale length
-        L_w = h_ft
-
-        # Lateral/Longitudinal scale lengths
-        L_u = h_ft / (0.177 + 0.000823 * h_ft) ** 1.2
-        L_v = L_u
+        a, b = self._coefficients(dt, h_m, V_mps)
+        self._states = a * self._states + b * self._noise.take(3)[0]
+        self.last_output = self._states / FT_PER_M
+        return self.last_output
 
-        # Lateral/Longitudinal intensities
-        sigma_u = sigma_w / (0.177 + 0.000823 * h_ft) ** 0.4
-        sigma_v = sigma_u
+    def series(self, n_steps: int, dt: float, h_m: float, V_mps: float) -> np.ndarray:
+        """
+        The next n_steps outputs of step at fixed altitude and airspeed, (n_steps, 3) in
+        [m/s], generated with scipy.signal.lfilter from one noise block (offline runs).
+        """
+        n = int(n_steps)
+        if dt <= 0.0 or V_mps < 1.0 or self.intensity <= 0.0 or n <= 0:
+            self.last_output = np.zeros(3)
+            return np.zeros((max(n, 0), 3))
 
-        # 3. Discrete Filtering
-        # General form: x_{k+1} = a*x_k + sigma*sqrt(1 - a^2)*w_k
-        # tau = L / V
-        # a = exp(-dt/tau) = exp(-dt * V / L)
+        a, b = self._coefficients(dt, h_m, V_mps)
+        w = self._noise.take(3 * n)[0].reshape(n, 3)
+        out = np.empty((n, 3))
+        for k in range(3):
+            out[:, k] = lfilter([b[k]], [1.0, -a[k]], w[:, k], zi=[a[k] * self._states[k]])[0]
+        self._states = out[-1].copy()
+        self.last_output = self._states / FT_PER_M
+        return out / FT_PER_M
 
-        scales = np.array([L_u, L_v, L_w])
-        sigmas = np.array([sigma_u, sigma_v, sigma_w])
 
-        for i in range(3):
-            tau = scales[i] / V_fps
-            a = float(np.exp(-dt / tau))
-            w = float(self._rng.normal(0.0, 1.0))
-            self._states[i] = a * self._states[i] + sigmas[i] * np.sqrt(1.0 - a**2) * w
+class DrydenTurbulenceBank:
+    """
+    DrydenTurbulence for N members at once: step takes per-member altitude and airspeed
+    and returns (N, 3). Coefficients are cached per member with the same tolerances, and
+    member i draws from its own block stream, so it matches DrydenTurbulence(seed=seeds[i])
+    to round-off.
+    """
 
-        # Convert back to m/s
-        self.last_output = self._states / 3.28084
+    def __init__(
+        self,
+        n_members: int,
+        *,
+        intensity: float = 0.1,
+        seeds: Sequence[SeedLike] | None = None,
+        h_tol_m: float = 1.0,
+        V_tol_mps: float = 0.1,
+        block: int = 1024,
+    ) -> None:
+        n = int(n_members)
+        seeds = [None] * n if seeds is None else list(seeds)
+        if len(seeds) != n:
+            raise ValueError("seeds must have one entry per member.")
+        self.intensity = float(intensity)
+        self.h_tol_m = float(h_tol_m)
+        self.V_tol_mps = float(V_tol_mps)
+        self._noise = BlockNormals(seeds, block)
+        self._states = np.zeros((n, 3), dtype=float)
+        self._a = np.zeros((n, 3), dtype=float)
+        self._b = np.zeros((n, 3), dtype=float)
+        self._h = np.full(n, np.nan)
+        self._V = np.full(n, np.nan)
+        self._key: tuple[float, float] | None = None
+        self.last_output = np.zeros((n, 3), dtype=float)
+
+    def step(self, dt: float, h_m: np.ndarray, V_mps: np.ndarray) -> np.ndarray:
+        n = self._states.shape[0]
+        h = np.broadcast_to(np.asarray(h_m, dtype=float), (n,))
+        V = np.broadcast_to(np.asarray(V_mps, dtype=float), (n,))
+        self.last_output = np.zeros((n, 3))
+        if dt <= 0.0 or self.intensity <= 0.0:
+            return self.last_output
+        active = V >= 1.0
+
+        if self._key != (dt, self.intensity):
+            self._h[:] = np.nan
+            self._key = (dt, self.intensity)
+        # NaN cache entries compare False, so fresh members are always recomputed.
+        stale = active & ~((np.abs(h - self._h) <= self.h_tol_m) & (np.abs(V - self._V) <= self.V_tol_mps))
+        if np.any(stale):
+            self._a[stale], self._b[stale] = dryden_coefficients(dt, h[stale], V[stale], self.intensity)
+            self._h[stale], self._V[stale] = h[stale], V[stale]
+
+        if np.all(active):
+            self._states = self._a * self._states + self._b * self._noise.take(3)
+            self.last_output = self._states / FT_PER_M
+        elif np.any(active):
+            w = self._noise.take(3, active)
+            self._states[active] = self._a[active] * self._states[active] + self._b[active] * w
+            self.last_output[active] = self._states[active] / FT_PER_M
         return self.last_output
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 import numpy as np
 
 from adcs_core.environment.dryden import DrydenLikeTurbulence
+from adcs_core.seeding import SeedLike
+
+
+def dryden_like_axes(turb_std_mps: float, turb_tau_s: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (sigma, tau) of the north/east/down shaping filters WindModel derives from its
+    turbulence intensity and correlation time.
+    """
+    sigma = np.array([turb_std_mps, turb_std_mps, 0.7 * turb_std_mps], dtype=float)
+    tau = np.array([turb_tau_s, turb_tau_s, max(0.5 * turb_tau_s, 0.5)], dtype=float)
+    return sigma, tau
+
+
+def wind_sample(
+    steady_ned_mps: np.ndarray, turb_ned_mps: np.ndarray, gust_std_mps: float, draw: Callable[[int], np.ndarray]
+) -> np.ndarray:
+    """
+    Steady + turbulence + white gust, for (3,) or per-member (N, 3) winds. draw(3) returns
+    the next three standard normals ((3,) or (N, 3)) and is only called when gusts are on.
+    """
+    wind = steady_ned_mps + turb_ned_mps
+    if gust_std_mps > 0.0:
+        wind = wind + gust_std_mps * draw(3)
+    return wind
 
 
 @dataclass
@@ -19,7 +44,7 @@ class WindModel:
     turb_std_mps: float = 0.8
     turb_tau_s: float = 3.0
     use_dryden_like: bool = True
-    seed: int | None = None
+    seed: SeedLike = None
 
     _rng: np.random.Generator = field(init=False)
     _turb: np.ndarray = field(init=False, default_factory=lambda: np.zeros(3))
@@ -30,13 +55,14 @@ class WindModel:
         self.steady_ned_mps = np.asarray(self.steady_ned_mps, dtype=float).reshape(3)
         self._turb = np.zeros(3, dtype=float)
         if self.use_dryden_like:
+            sigma, tau = dryden_like_axes(self.turb_std_mps, self.turb_tau_s)
             self._dryden = DrydenLikeTurbulence(
-                sigma_n=self.turb_std_mps,
-                sigma_e=self.turb_std_mps,
-                sigma_d=0.7 * self.turb_std_mps,
-                tau_n_s=self.turb_tau_s,
-                tau_e_s=self.turb_tau_s,
-                tau_d_s=max(0.5 * self.turb_tau_s, 0.5),
+                sigma_n=float(sigma[0]),
+                sigma_e=float(sigma[1]),
+                sigma_d=float(sigma[2]),
+                tau_n_s=float(tau[0]),
+                tau_e_s=float(tau[1]),
+                tau_d_s=float(tau[2]),
                 seed=self.seed,
             )
 
@@ -52,8 +78,7 @@ class WindModel:
             else:
                 self._turb = np.zeros(3)
 
-        gust = self._rng.normal(0.0, self.gust_std_mps, size=3) if self.gust_std_mps > 0.0 else np.zeros(3)
-        return self.steady_ned_mps + self._turb + gust
+        return wind_sample(self.steady_ned_mps, self._turb, self.gust_std_mps, self._rng.standard_normal)
 
 
 
@@ -3,9 +3,11 @@ from __future__ import annotations
 import numpy as np
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
-from adcs_core.aircraft.forces_moments import ActuatorLimits, forces_and_moments_body
-from adcs_core.aircraft.parameters import AircraftParameters
-from adcs_core.dynamics.equations import derivatives_6dof
+from adcs_core.aircraft.compiled import CompiledAircraft, inertia_inverse, resolve_parameters
+from adcs_core.aircraft.forces_moments import ActuatorLimits, forces_and_moments_body, forces_and_moments_body_batch
+from adcs_core.aircraft.parameters import AircraftParameters, StackedParameters
+from adcs_core.complex_step import as_real_or_complex
+from adcs_core.dynamics.equations import derivatives_6dof, derivatives_6dof_batch
 from adcs_core.state import State
 
 
@@ -13,7 +15,7 @@ def xdot_full(
     x: np.ndarray,
     u: ControlInputs,
     *,
-    params: AircraftParameters | None = None,
+    params: AircraftParameters | CompiledAircraft | None = None,
     limits: ActuatorLimits | None = None,
     uvw_air_mps: np.ndarray | None = None,
 ) -> np.ndarray:
@@ -21,12 +23,37 @@ def xdot_full(
     Deterministic continuous-time dynamics for linearization/design tools.
     Wind should be handled by passing uvw_air_mps explicitly; otherwise uses state uvw.
     """
-    params = params or AircraftParameters()
-    limits = limits or ActuatorLimits()
+    Iinv = inertia_inverse(params) if isinstance(params, CompiledAircraft) else None
+    params, limits = resolve_parameters(params, limits)
     s = State.from_vector(x)
     uvw_air = np.array([s.u, s.v, s.w], dtype=float) if uvw_air_mps is None else np.asarray(uvw_air_mps, dtype=float).reshape(3)
     F, M, _ = forces_and_moments_body(s, u, params, limits, uvw_air_mps=uvw_air)
-    return derivatives_6dof(0.0, x, params, F, M)
+    return derivatives_6dof(0.0, x, params, F, M, inertia_inv=Iinv)
 
 
+def xdot_full_batch(
+    X: np.ndarray,
+    U: np.ndarray,
+    *,
+    params: AircraftParameters | CompiledAircraft | StackedParameters | None = None,
+    limits: ActuatorLimits | None = None,
+    uvw_air_mps: np.ndarray | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Batched xdot_full for N independent aircraft in one vectorized pass.
 
+    X: (N, 12) states, U: (N, 4) control vectors ordered as ControlIndex,
+    uvw_air_mps: optional (N, 3) air-relative body velocity; params may be a
+    StackedParameters with per-member values. Returns (N, 12),
+    written into `out` when given. Complex X/U are supported for complex-step
+    differentiation.
+    """
+    pack = params if isinstance(params, CompiledAircraft) else None
+    params, limits = resolve_parameters(params, limits)
+    X = np.atleast_2d(as_real_or_complex(X))
+    U = np.atleast_2d(as_real_or_complex(U))
+    if U.shape[0] == 1 and X.shape[0] > 1:
+        U = np.broadcast_to(U, (X.shape[0], U.shape[1]))
+    F, M = forces_and_moments_body_batch(X, U, params, limits, uvw_air_mps=uvw_air_mps, pack=pack)
+    return derivatives_6dof_batch(0.0, X, params, F, M, out=out, inertia_inv=None if pack is None else pack.inertia_inv)
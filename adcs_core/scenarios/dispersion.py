@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Sequence
+
+import numpy as np
+from scipy import stats as sps
+from scipy.stats import qmc
+
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.streaming_stats import StreamingStats
+from adcs_core.environment.wind import WindModel
+from adcs_core.scenarios.monte_carlo import (
+    HistoryFn,
+    MetricFn,
+    MonteCarloCampaign,
+    MonteCarloResult,
+    _run_sample,
+    ordered_imap,
+    trace_histories,
+    trace_metrics,
+)
+from adcs_core.seeding import derive_seed
+
+# Scalar AircraftParameters fields; array-valued ones (inertia_kgm2) cannot be dispersed.
+_PARAM_FIELDS = frozenset(f.name for f in fields(AircraftParameters) if f.type in ("float", float))
+_RUN_FIELDS = (
+    "wind_n_mps",
+    "wind_e_mps",
+    "wind_d_mps",
+    "initial_airspeed_offset_mps",
+    "turb_std_mps",
+    "sensor_noise_scale",
+)
+
+
+@dataclass(frozen=True)
+class Dispersion:
+    """
+    One dispersed quantity: a scalar AircraftParameters field or one of wind_n_mps, wind_e_mps,
+    wind_d_mps, initial_airspeed_offset_mps, turb_std_mps, sensor_noise_scale.
+
+    A unit sample u maps to the offset spread * (2u - 1) ("uniform") or spread * Phi^-1(u)
+    ("normal"), added to the nominal value, or scaling it by (1 + offset) when relative.
+    """
+
+    name: str
+    spread: float
+    distribution: str = "uniform"
+    relative: bool = False
+
+
+@dataclass(frozen=True)
+class StoppingRule:
+    """
+    Stop a campaign once the confidence interval of one statistic of one metric has a
+    half-width of at most tolerance.
+
+    statistic is "mean" (Student t interval; a NaN or infinite metric raises ValueError,
+    since no number of further runs could bound the mean) or a quantile level in (0, 1)
+    (distribution-free order-statistic interval; NaN metrics count as +inf). Both treat
+    runs as independent, which is conservative for scrambled Sobol or LHS samples.
+    """
+
+    metric: str
+    tolerance: float
+    statistic: str | float = 0.95
+    confidence: float = 0.95
+
+    def interval(self, values: np.ndarray) -> tuple[float, float, float]:
+        """
+        (estimate, lower, upper); the bounds are infinite while there are too few runs.
+        """
+        v = np.asarray(values, dtype=float)
+        n = v.size
+        if self.statistic == "mean":
+            bad = int(np.count_nonzero(~np.isfinite(v)))
+            if bad:
+                raise ValueError(
+                    f"{bad} run(s) have a non-finite '{self.metric}'; its mean cannot converge "
+                    "(use a quantile statistic, which counts NaN as +inf)."
+                )
+            if n < 2:
+                return float(np.mean(v)) if n else float("nan"), -np.inf, np.inf
+            half = float(sps.t.ppf(0.5 + 0.5 * self.confidence, n - 1) * np.std(v, ddof=1) / np.sqrt(n))
+            est = float(np.mean(v))
+            return est, est - half, est + half
+
+        q = float(self.statistic)
+        v = np.sort(np.where(np.isnan(v), np.inf, v))
+        est = float(v[min(n - 1, max(0, int(np.ceil(n * q)) - 1))])
+        s = float(sps.norm.ppf(0.5 + 0.5 * self.confidence)) * np.sqrt(n * q * (1.0 - q))
+        lo, hi = int(np.floor(n * q - s)), int(np.ceil(n * q + s))
+        if lo < 1 or hi > n:
+            return est, -np.inf, np.inf
+        return est, float(v[lo - 1]), float(v[hi - 1])
+
+    def converged(self, values: np.ndarray) -> bool:
+        _, lo, hi = self.interval(values)
+        return bool(0.5 * (hi - lo) <= self.tolerance)
+
+
+def _check_names(dispersions: Sequence[Dispersion]) -> tuple[str, ...]:
+    names = tuple(d.name for d in dispersions)
+    for name in names:
+        if name not in _PARAM_FIELDS and name not in _RUN_FIELDS:
+            if any(f.name == name for f in fields(AircraftParameters)):
+                raise ValueError(f"Dispersion '{name}' is not a scalar parameter.")
+            raise ValueError(f"Unknown dispersion '{name}'.")
+    if len(set(names)) != len(names):
+        raise ValueError("Dispersion names must be unique.")
+    return names
+
+
+def _nominal(campaign: MonteCarloCampaign, name: str) -> float:
+    if name in _PARAM_FIELDS:
+        return float(getattr(campaign.params or AircraftParameters(), name))
+    if name.startswith("wind_"):
+        return float(campaign.wind_ned_mps["ned".index(name[5])])
+    return {"initial_airspeed_offset_mps": 0.0, "turb_std_mps": WindModel.turb_std_mps, "sensor_noise_scale": 1.0}[name]
+
+
+def _unit_sampler(method: str, d: int, seed: np.random.SeedSequence) -> Callable[[int], np.ndarray]:
+    rng = np.random.default_rng(seed)
+    if method == "sobol":
+        engine = qmc.Sobol(d, scramble=True, seed=rng)
+        return engine.random
+    if method == "lhs":
+        # Every batch is its own Latin hypercube, so stratification holds per batch.
+        engine = qmc.LatinHypercube(d, seed=rng)
+        return engine.random
+    if method == "random":
+        return lambda n: rng.random((n, d))
+    raise ValueError(f"Unknown sampling method '{method}'.")
+
+
+def dispersion_values(
+    campaign: MonteCarloCampaign,
+    dispersions: Sequence[Dispersion],
+    unit: np.ndarray,
+) -> np.ndarray:
+    """
+    Map unit samples (n, len(dispersions)) to dispersed values around the campaign's nominals.
+    """
+    _check_names(dispersions)
+    u = np.clip(np.asarray(unit, dtype=float), 1e-12, 1.0 - 1e-12)
+    out = np.empty_like(u)
+    for j, disp in enumerate(dispersions):
+        if disp.distribution == "uniform":
+            offset = disp.spread * (2.0 * u[:, j] - 1.0)
+        elif disp.distribution == "normal":
+            offset = disp.spread * sps.norm.ppf(u[:, j])
+        else:
+            raise ValueError(f"Unknown dispersion distribution '{disp.distribution}'.")
+        nominal = _nominal(campaign, disp.name)
+        out[:, j] = nominal * (1.0 + offset) if disp.relative else nominal + offset
+    return out
+
+
+def _run_dispersed_chunk(
+    args: tuple[MonteCarloCampaign, tuple[str, ...], np.ndarray, list[np.random.SeedSequence], MetricFn, dict | None, HistoryFn],
+) -> tuple[list[dict[str, float]], StreamingStats | None]:
+    campaign, names, values, sim_seeds, metric_fn, layout, history_fn = args
+    stats = None if layout is None else StreamingStats.from_layout(layout)
+    base = campaign.params or AircraftParameters()
+    rows = []
+    for row_values, sim_seed in zip(values, sim_seeds):
+        v = dict(zip(names, (float(x) for x in row_values)))
+        overrides = {k: x for k, x in v.items() if k in _PARAM_FIELDS}
+        wind = tuple(v.get(f"wind_{c}_mps", float(w)) for c, w in zip("ned", campaign.wind_ned_mps))
+        metrics = _run_sample(
+            campaign,
+            sim_seed,
+            (wind[0], wind[1], wind[2]),
+            v.get("initial_airspeed_offset_mps", 0.0),
+            metric_fn,
+            stats,
+            history_fn,
+            params=replace(base, **overrides) if overrides else base,
+            turb_std_mps=v.get("turb_std_mps"),
+            sensor_noise_scale=v.get("sensor_noise_scale", 1.0),
+        )
+        rows.append({**v, **metrics})
+    return rows, stats
+
+
+def run_dispersion_campaign(
+    campaign: MonteCarloCampaign,
+    dispersions: Sequence[Dispersion],
+    *,
+    sampler: str = "sobol",
+    seed: int = 0,
+    batch_size: int = 64,
+    max_runs: int = 4096,
+    stop: StoppingRule | None = None,
+    max_workers: int | None = 1,
+    chunk_size: int = 16,
+    metric_fn: MetricFn = trace_metrics,
+    stats: StreamingStats | None = None,
+    history_fn: HistoryFn = trace_histories,
+) -> tuple[MonteCarloResult, list[dict[str, float]]]:
+    """
+    Closed-loop campaign over explicit dispersions sampled with scrambled Sobol ("sobol"),
+    Latin hypercube ("lhs") or i.i.d. uniform ("random") points.
+
+    The campaign's nominal wind, params and events apply; its steady_wind_sigma_mps and
+    initial_airspeed_sigma_mps are not used (disperse wind_*_mps instead). Runs are done
+    in batches of batch_size (for "sobol" the first batch, min(batch_size, max_runs), must
+    be a power of two to keep the points balanced; ValueError otherwise), split into chunks of
+    chunk_size over a process pool when max_workers != 1. With stop, the campaign ends
+    after the first batch at which stop.converged holds, or at max_runs; otherwise exactly
+    max_runs are run. Every sample and its simulation seed depend only on (seed, run
+    index), so results do not depend on max_workers.
+
+    Returns the result (metrics include the dispersed values) and, per batch, the running
+    stop interval {"runs", "estimate", "lower", "upper"} (empty without stop).
+    """
+    if not dispersions:
+        raise ValueError("At least one dispersion is required.")
+    names = _check_names(dispersions)
+    batch_size, max_runs, chunk_size = max(1, int(batch_size)), max(1, int(max_runs)), max(1, int(chunk_size))
+    first = min(batch_size, max_runs)
+    if sampler == "sobol" and first & (first - 1):
+        raise ValueError(
+            f"Sobol sampling needs a power-of-two first batch; batch_size={batch_size}, "
+            f"max_runs={max_runs} give {first} (use 'lhs' or 'random' for other sizes)."
+        )
+
+    sample_seq, run_seq = np.random.SeedSequence(int(seed)).spawn(2)
+    draw = _unit_sampler(sampler, len(names), sample_seq)
+    workers = (os.cpu_count() or 1) if max_workers is None else max(1, int(max_workers))
+    merged = None if stats is None else stats.empty_like()
+    layout = None if stats is None else stats.layout()
+    rows: list[dict[str, float]] = []
+    history: list[dict[str, float]] = []
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while len(rows) < max_runs:
+            n = min(batch_size, max_runs - len(rows))
+            values = dispersion_values(campaign, dispersions, draw(n))
+            sim_seeds = [derive_seed(run_seq, i) for i in range(len(rows), len(rows) + n)]
+            tasks = [
+                (campaign, names, values[lo : lo + chunk_size], sim_seeds[lo : lo + chunk_size], metric_fn, layout, history_fn)
+                for lo in range(0, n, chunk_size)
+            ]
+            if pool is None or len(tasks) == 1:
+                chunks = map(_run_dispersed_chunk, tasks)
+            else:
+                chunks = ordered_imap(pool, _run_dispersed_chunk, tasks, 2 * workers)
+            for chunk_rows, partial in chunks:
+                rows.extend(chunk_rows)
+                if merged is not None:
+                    merged.merge(partial)
+            if stop is not None:
+                observed = np.array([row[stop.metric] for row in rows], dtype=float)
+                est, lo, hi = stop.interval(observed)
+                history.append({"runs": len(rows), "estimate": est, "lower": lo, "upper": hi})
+                if stop.converged(observed):
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    metrics = {k: np.array([row[k] for row in rows], dtype=float) for k in rows[0]}
+    return MonteCarloResult(seed=int(seed), runs=len(rows), metrics=metrics, stats=merged), history
+
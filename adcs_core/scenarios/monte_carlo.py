@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import itertools
+import os
+import pickle
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
+
+import numpy as np
+
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.result_store import result_key
+from adcs_core.analysis.streaming_stats import SignalStats, StreamingStats
+from adcs_core.control.autopilot import AutopilotTargets, wrap_pi
+from adcs_core.control.failure_modes import FailureManager
+from adcs_core.scenarios.scenario_runner import ScenarioEvent, ScenarioRunner
+from adcs_core.simulator import SimTrace, apply_scenario_event, default_initial_state, simulate_closed_loop
+from adcs_core.state.state_definition import StateIndex
+
+
+@dataclass(frozen=True)
+class MonteCarloCampaign:
+    """
+    Closed-loop robustness campaign: the simulator.run setup plus per-run dispersions.
+
+    Each run draws a steady NED wind from N(wind_ned_mps, steady_wind_sigma_mps) and
+    an initial airspeed offset from N(0, initial_airspeed_sigma_mps); turbulence, gusts
+    and sensor noise get their own seeds. events (targets changes, failures) apply to
+    every run. params defaults to AircraftParameters().
+    """
+
+    tfinal: float = 20.0
+    dt: float = 0.02
+    targets: AutopilotTargets = field(default_factory=AutopilotTargets)
+    autopilot_enabled: bool = True
+    actuator_tau: float = 0.15
+    wind_ned_mps: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    steady_wind_sigma_mps: tuple[float, float, float] = (1.5, 1.5, 0.0)
+    initial_airspeed_sigma_mps: float = 0.0
+    events: tuple[ScenarioEvent, ...] = ()
+    params: AircraftParameters | None = None
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """
+    Per-run metrics as arrays (length runs, in run order) and the seed that reproduces them.
+    stats holds the streamed time-history statistics when the campaign was run with them.
+    """
+
+    seed: int
+    runs: int
+    metrics: dict[str, np.ndarray]
+    stats: StreamingStats | None = None
+
+    def as_records(self) -> list[dict[str, float]]:
+        names = list(self.metrics)
+        return [{"run": i, **{k: float(self.metrics[k][i]) for k in names}} for i in range(self.runs)]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            k: {
+                "mean": float(np.nanmean(v)),
+                "std": float(np.nanstd(v)),
+                "p95": float(np.nanpercentile(v, 95.0)),
+                "max": float(np.nanmax(v)),
+            }
+            for k, v in self.metrics.items()
+            if np.any(np.isfinite(v))
+        }
+
+
+def trace_metrics(trace: SimTrace, targets: AutopilotTargets) -> dict[str, float]:
+    """
+    Default per-run metrics: tracking errors against the (final) targets and attitude peaks.
+    """
+    x = trace.x
+    finite = bool(np.all(np.isfinite(x)))
+    alt_err = -x[:, int(StateIndex.Z)] - targets.altitude_m
+    V = np.linalg.norm(x[:, int(StateIndex.U) : int(StateIndex.W) + 1], axis=1)
+    V_err = V - targets.airspeed_mps
+    theta = x[:, int(StateIndex.THETA)]
+    return {
+        "diverged": float(not finite),
+        "alt_err_rms_m": float(np.sqrt(np.mean(alt_err**2))),
+        "alt_err_max_m": float(np.max(np.abs(alt_err))),
+        "airspeed_err_rms_mps": float(np.sqrt(np.mean(V_err**2))),
+        "heading_err_final_rad": abs(wrap_pi(float(x[-1, int(StateIndex.PSI)]) - targets.heading_rad)) if finite else float("nan"),
+        "phi_max_rad": float(np.max(np.abs(x[:, int(StateIndex.PHI)]))),
+        "theta_rms_rad": float(np.sqrt(np.mean(theta**2))),
+        "theta_max_rad": float(np.max(np.abs(theta))),
+    }
+
+
+def trace_histories(trace: SimTrace, targets: AutopilotTargets) -> dict[str, np.ndarray]:
+    """
+    Default per-run time histories for streamed statistics (one value per logged step).
+    """
+    x = trace.x
+    V = np.linalg.norm(x[:, int(StateIndex.U) : int(StateIndex.W) + 1], axis=1)
+    return {
+        "alt_err_m": -x[:, int(StateIndex.Z)] - targets.altitude_m,
+        "airspeed_err_mps": V - targets.airspeed_mps,
+        "phi_rad": x[:, int(StateIndex.PHI)],
+        "theta_rad": x[:, int(StateIndex.THETA)],
+    }
+
+
+def history_stats(
+    campaign: MonteCarloCampaign,
+    thresholds: dict[str, Sequence[float]] | None = None,
+    **sketch_options: float,
+) -> StreamingStats:
+    """
+    Empty StreamingStats for the trace_histories signals of campaign (one element per
+    logged step), with optional exceedance thresholds per signal.
+    """
+    n = int(np.ceil(campaign.tfinal / campaign.dt)) + 1
+    thresholds = thresholds or {}
+    names = ("alt_err_m", "airspeed_err_mps", "phi_rad", "theta_rad")
+    return StreamingStats({k: SignalStats(n, thresholds=thresholds.get(k, ()), **sketch_options) for k in names})
+
+
+def final_targets(targets: AutopilotTargets, events: Sequence[ScenarioEvent], t_end: float) -> AutopilotTargets:
+    """
+    Targets in force at t_end: events are replayed in ScenarioRunner order, as simulate_closed_loop
+    applies them; events after t_end never took effect.
+    """
+    runner = ScenarioRunner(list(events))
+    failures = FailureManager()
+
+    def apply(evt: ScenarioEvent) -> None:
+        nonlocal targets
+        targets = apply_scenario_event(evt, failures, targets)
+
+    runner.step(t_end, apply)
+    return targets
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+MetricFn = Callable[[SimTrace, AutopilotTargets], dict[str, float]]
+HistoryFn = Callable[[SimTrace, AutopilotTargets], dict[str, np.ndarray]]
+
+
+def _run_sample(
+    campaign: MonteCarloCampaign,
+    sim_seed: np.random.SeedSequence,
+    wind: tuple[float, float, float],
+    dV: float,
+    metric_fn: MetricFn,
+    stats: StreamingStats | None,
+    history_fn: HistoryFn,
+    *,
+    params: AircraftParameters | None = None,
+    turb_std_mps: float | None = None,
+    sensor_noise_scale: float = 1.0,
+) -> dict[str, float]:
+    x0 = default_initial_state().as_vector()
+    x0[int(StateIndex.U)] += dV
+    trace = simulate_closed_loop(
+        campaign.tfinal,
+        campaign.dt,
+        campaign.autopilot_enabled,
+        campaign.targets,
+        campaign.actuator_tau,
+        seed=sim_seed,
+        wind_ned_mps=wind,
+        events=campaign.events,
+        x0=x0,
+        params=campaign.params if params is None else params,
+        turb_std_mps=turb_std_mps,
+        sensor_noise_scale=sensor_noise_scale,
+    )
+    targets = final_targets(campaign.targets, campaign.events, float(trace.t[-1]))
+    if stats is not None:
+        stats.update(history_fn(trace, targets))
+    return metric_fn(trace, targets)
+
+
+def _run_one(
+    campaign: MonteCarloCampaign,
+    seq: np.random.SeedSequence,
+    metric_fn: MetricFn,
+    stats: StreamingStats | None,
+    history_fn: HistoryFn,
+) -> dict[str, float]:
+    # Dispersions and simulation noise come from independent children of the run's seed.
+    draw_seq, sim_seq = seq.spawn(2)
+    rng = np.random.default_rng(draw_seq)
+    wind = np.asarray(campaign.wind_ned_mps, dtype=float) + rng.normal(0.0, 1.0, 3) * np.asarray(
+        campaign.steady_wind_sigma_mps, dtype=float
+    )
+    dV = float(rng.normal(0.0, campaign.initial_airspeed_sigma_mps))
+    wind_ned = (float(wind[0]), float(wind[1]), float(wind[2]))
+    return {
+        "wind_n_mps": wind_ned[0],
+        "wind_e_mps": wind_ned[1],
+        "wind_d_mps": wind_ned[2],
+        "initial_airspeed_offset_mps": dV,
+        **_run_sample(campaign, sim_seq, wind_ned, dV, metric_fn, stats, history_fn),
+    }
+
+
+def _run_chunk(
+    args: tuple[MonteCarloCampaign, list[np.random.SeedSequence], MetricFn, dict | None, HistoryFn],
+) -> tuple[list[dict[str, float]], StreamingStats | None]:
+    # Each chunk streams into its own partial aggregate, built here from the small layout
+    # spec; the caller merges partials in order as they arrive.
+    campaign, seqs, metric_fn, layout, history_fn = args
+    stats = None if layout is None else StreamingStats.from_layout(layout)
+    return [_run_one(campaign, seq, metric_fn, stats, history_fn) for seq in seqs], stats
+
+
+@dataclass
+class _Checkpoint:
+    # Completed prefix of a campaign: chunks [0, next_chunk) with their rows in run order
+    # and their stats merged in chunk order, exactly as an uninterrupted run folds them.
+    key: str
+    chunk_size: int
+    next_chunk: int
+    rows: list[dict[str, float]]
+    stats: StreamingStats | None
+
+
+def _campaign_key(
+    campaign: MonteCarloCampaign,
+    runs: int,
+    seed: int,
+    metric_fn: MetricFn,
+    stats: StreamingStats | None,
+    history_fn: HistoryFn,
+) -> str:
+    layout = None
+    if stats is not None:
+        layout = repr(
+            [
+                (k, v.shape, v.thresholds.tolist(), v.sketch.relative_accuracy, v.sketch.min_value, v.sketch.max_value)
+                for k, v in stats.signals.items()
+            ]
+        )
+        layout += f"{history_fn.__module__}.{history_fn.__qualname__}"
+    return result_key(
+        "monte_carlo_campaign",
+        repr(campaign),
+        int(runs),
+        int(seed),
+        f"{metric_fn.__module__}.{metric_fn.__qualname__}",
+        layout,
+    )
+
+
+def _load_checkpoint(path: Path, key: str) -> _Checkpoint | None:
+    try:
+        with open(path, "rb") as fh:
+            ckpt = pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as exc:
+        raise RuntimeError(f"Unreadable Monte Carlo checkpoint '{path}'.") from exc
+    if not isinstance(ckpt, _Checkpoint) or ckpt.key != key:
+        raise ValueError(f"Checkpoint '{path}' belongs to a different campaign, seed or run count.")
+    return ckpt
+
+
+def _save_checkpoint(path: Path, ckpt: _Checkpoint) -> None:
+    # Atomic replace: a crash mid-write leaves the previous checkpoint intact.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(ckpt, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def ordered_imap(pool: Executor, fn: Callable[[T], R], tasks: Iterable[T], window: int) -> Iterator[R]:
+    """
+    pool.map that keeps at most window tasks in flight and yields results in task order,
+    so finished partial aggregates never pile up behind a slow chunk.
+    """
+    it = iter(tasks)
+    pending = deque(pool.submit(fn, task) for task in itertools.islice(it, max(1, int(window))))
+    while pending:
+        result = pending.popleft().result()
+        for task in itertools.islice(it, 1):
+            pending.append(pool.submit(fn, task))
+        yield result
+
+
+def run_monte_carlo_campaign(
+    campaign: MonteCarloCampaign,
+    runs: int,
+    *,
+    seed: int = 0,
+    max_workers: int | None = 1,
+    chunk_size: int | None = None,
+    metric_fn: MetricFn = trace_metrics,
+    stats: StreamingStats | None = None,
+    history_fn: HistoryFn = trace_histories,
+    checkpoint_path: str | Path | None = None,
+    checkpoint_every: int = 8,
+) -> MonteCarloResult:
+    """
+    Full nonlinear closed-loop runs, spread over a process pool when max_workers != 1
+    (None uses one process per CPU).
+
+    Run i is seeded by SeedSequence(seed).spawn(runs)[i], so results are bit-identical
+    for any worker count or chunk size. Runs are scheduled in chunks (default: about
+    four per worker) so workers stay busy without per-run dispatch overhead. metric_fn
+    must be picklable (a module-level function) when a pool is used.
+
+    With stats (an empty StreamingStats, e.g. from history_stats), each run's
+    history_fn time histories are streamed into per-chunk aggregates that are merged in
+    chunk order; histories are never kept, so memory does not grow with runs.
+
+    With checkpoint_path, the completed prefix of chunks (metric rows and merged stats)
+    is written atomically every checkpoint_every chunks, on completion and when the run
+    is interrupted. Rerunning the same campaign, runs, seed and functions resumes after
+    the last saved chunk, reusing the saved chunk size, and gives results identical to an
+    uninterrupted run. A checkpoint from a different campaign raises ValueError.
+    """
+    runs = int(runs)
+    if runs < 1:
+        raise ValueError("runs must be >= 1")
+    seqs = np.random.SeedSequence(int(seed)).spawn(runs)
+    workers = (os.cpu_count() or 1) if max_workers is None else max(1, int(max_workers))
+
+    path = None if checkpoint_path is None else Path(checkpoint_path)
+    key = "" if path is None else _campaign_key(campaign, runs, seed, metric_fn, stats, history_fn)
+    ckpt = None if path is None else _load_checkpoint(path, key)
+    if ckpt is not None:
+        if chunk_size is not None and int(chunk_size) != ckpt.chunk_size:
+            raise ValueError(f"Checkpoint '{path}' was written with chunk_size={ckpt.chunk_size}.")
+        chunk_size = ckpt.chunk_size
+    elif chunk_size is None:
+        chunk_size = max(1, min(64, -(-runs // (4 * workers))))
+    chunk_size = int(chunk_size)
+    if ckpt is None:
+        ckpt = _Checkpoint(key, chunk_size, 0, [], None if stats is None else stats.empty_like())
+
+    layout = None if stats is None else stats.layout()
+    tasks = [
+        (campaign, seqs[lo : lo + chunk_size], metric_fn, layout, history_fn)
+        for lo in range(ckpt.next_chunk * chunk_size, runs, chunk_size)
+    ]
+
+    def fold(chunks: Iterable[tuple[list[dict[str, float]], StreamingStats | None]]) -> None:
+        saved = ckpt.next_chunk
+        try:
+            for chunk_rows, partial in chunks:
+                ckpt.rows.extend(chunk_rows)
+                if ckpt.stats is not None:
+                    ckpt.stats.merge(partial)
+                ckpt.next_chunk += 1
+                if path is not None and ckpt.next_chunk - saved >= max(1, int(checkpoint_every)):
+                    _save_checkpoint(path, ckpt)
+                    saved = ckpt.next_chunk
+        finally:
+            if path is not None and ckpt.next_chunk > saved:
+                _save_checkpoint(path, ckpt)
+
+    if workers == 1 or len(tasks) <= 1:
+        fold(_run_chunk(task) for task in tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                fold(ordered_imap(pool, _run_chunk, tasks, 2 * workers))
+            except BaseException:
+                # Do not wait for queued chunks; the checkpoint already holds the prefix.
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    rows = ckpt.rows
+    metrics = {k: np.array([row[k] for row in rows], dtype=float) for k in rows[0]}
+    return MonteCarloResult(seed=int(seed), runs=runs, metrics=metrics, stats=ckpt.stats)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Union
+
+import numpy as np
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+# Sub-stream offsets of one simulation seed, shared by simulator.simulate_closed_loop and the ensemble.
+# The wind gusts use the seed itself.
+SENSOR_SEED_OFFSETS = {"altimeter": 1, "airspeed": 2, "compass": 3, "imu": 4}
+DRYDEN_LIKE_SEED_OFFSETS = (10, 11, 12)
+
+
+def derive_seed(seed: SeedLike, offset: int) -> SeedLike:
+    """
+    Seed of sub-stream offset (sensor, wind or turbulence channel) of a run seeded by seed.
+
+    int seeds keep the historical seed + offset convention, so integer-seeded runs are
+    unchanged; a SeedSequence gives its child with spawn index offset, independent of the
+    children of any other spawned sequence (unlike nearby integers); None stays None.
+    The child is built directly, so the parent's spawn counter is not touched.
+    """
+    if seed is None:
+        return None
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(seed.entropy, spawn_key=tuple(seed.spawn_key) + (int(offset),), pool_size=seed.pool_size)
+    return int(seed) + int(offset)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Deque, Generic, Optional, TypeVar
+from typing import Callable, Deque, Generic, Optional, TypeVar
 
 from collections import deque
 
 import numpy as np
 
+from adcs_core.seeding import SeedLike
+
 T = TypeVar("T")
 
 
@@ -43,46 +45,81 @@ class DelayLine(Generic[T]):
         return out
 
 
+class SampleHold(Generic[T]):
+    """
+    Sample schedule, transport delay and output hold of a sensor: due(t) tells whether a
+    new sample is taken at t, push() queues it, output(t) returns the latest delayed
+    sample (held between updates; `last` until the first one arrives). Values may be
+    scalars or per-member arrays.
+    """
+
+    def __init__(self, sample: SampleConfig, last: Optional[T] = None) -> None:
+        self.sample = sample
+        self.last = last
+        self._t_next = 0.0
+        self._delay: DelayLine[T] = DelayLine(sample.delay_s)
+
+    def due(self, t: float) -> bool:
+        return t + 1e-12 >= self._t_next
+
+    def push(self, t: float, value: T) -> None:
+        self._delay.push(t, value)
+        self._t_next = t + (1.0 / max(self.sample.rate_hz, 1e-3))
+
+    def output(self, t: float) -> Optional[T]:
+        delayed = self._delay.pop_available(t)
+        if delayed is not None:
+            self.last = delayed
+        return self.last
+
+
+def sensor_sample(
+    noise: NoiseConfig,
+    bias: float | np.ndarray,
+    true_value: float | np.ndarray,
+    dt: float,
+    draw: Callable[[int], np.ndarray],
+) -> tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    One noisy sample -> (measurement, new bias): bias random walk, then true value + bias +
+    white noise. draw(k) returns the next k standard normals of one sensor, (k,), or of
+    N members, (N, k); the bias step is drawn before the white noise.
+    """
+    rw = noise.bias_rw_std > 0.0 and dt > 0.0
+    white = noise.std > 0.0
+    z = draw(int(rw) + int(white))
+    if rw:
+        bias = bias + noise.bias_rw_std * np.sqrt(dt) * z[..., 0]
+    meas = true_value + bias
+    if white:
+        meas = meas + noise.std * z[..., -1]
+    return meas, bias
+
+
 @dataclass
 class ScalarSensorBase:
     noise: NoiseConfig = field(default_factory=NoiseConfig)
     sample: SampleConfig = field(default_factory=SampleConfig)
-    seed: int | None = None
+    seed: SeedLike = None
 
     _rng: np.random.Generator = field(init=False)
     _bias: float = field(init=False, default=0.0)
-    _t_next: float = field(init=False, default=0.0)
-    _delay: DelayLine[float] = field(init=False)
-    _last_out: float = field(init=False, default=0.0)
+    _hold: SampleHold[float] = field(init=False)
 
     def __post_init__(self) -> None:
         self._rng = np.random.default_rng(self.seed)
         self._bias = float(self.noise.bias0)
-        self._t_next = 0.0
-        self._delay = DelayLine[float](self.sample.delay_s)
-
-    def _update_bias(self, dt: float) -> None:
-        if self.noise.bias_rw_std > 0.0 and dt > 0.0:
-            self._bias += float(self._rng.normal(0.0, self.noise.bias_rw_std * np.sqrt(dt)))
-
-    def _sample(self, true_value: float, dt: float) -> float:
-        self._update_bias(dt)
-        n = float(self._rng.normal(0.0, self.noise.std)) if self.noise.std > 0.0 else 0.0
-        return float(true_value + self._bias + n)
+        self._hold = SampleHold(self.sample, 0.0)
 
     def read(self, t: float, true_value: float, dt: float) -> float:
         """
         Rate-limited sampling + delay line. Holds last output between updates.
         """
-        if t + 1e-12 >= self._t_next:
-            meas = self._sample(true_value, dt)
-            self._delay.push(t, meas)
-            self._t_next = t + (1.0 / max(self.sample.rate_hz, 1e-3))
-
-        delayed = self._delay.pop_available(t)
-        if delayed is not None:
-            self._last_out = float(delayed)
-        return self._last_out
+        if self._hold.due(t):
+            meas, bias = sensor_sample(self.noise, self._bias, true_value, dt, self._rng.standard_normal)
+            self._bias = float(bias)
+            self._hold.push(t, float(meas))
+        return float(self._hold.output(t))
 
 
 
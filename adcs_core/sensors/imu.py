@@ -1,10 +1,64 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 import numpy as np
 
-from adcs_core.sensors.common import DelayLine, NoiseConfig, SampleConfig
+from adcs_core.sensors.common import NoiseConfig, SampleConfig, SampleHold
+from adcs_core.seeding import SeedLike
+
+IMU_CHANNELS = ("p_radps", "q_radps", "r_radps", "ax_ms2", "ay_ms2", "az_ms2")
+
+
+def specific_force(
+    pqr_radps: np.ndarray, uvw_mps: np.ndarray, prev_uvw_mps: np.ndarray, g_b_ms2: np.ndarray, dt: float
+) -> np.ndarray:
+    """
+    Body specific force a_b - g_b, with a_b = v_dot + omega x v from the finite difference
+    of body velocity; (3,) or per-member (N, 3) inputs.
+    """
+    v_dot = (uvw_mps - prev_uvw_mps) / dt if dt > 0.0 else np.zeros_like(uvw_mps)
+    return v_dot + np.cross(pqr_radps, uvw_mps) - g_b_ms2
+
+
+def imu_sample(
+    gyro_noise: NoiseConfig,
+    accel_noise: NoiseConfig,
+    gyro_bias: np.ndarray,
+    accel_bias: np.ndarray,
+    pqr_radps: np.ndarray,
+    specific_force_ms2: np.ndarray,
+    dt: float,
+    draw: Callable[[int], np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One IMU sample -> (gyro, accel, gyro_bias, accel_bias) for (3,) or per-member (N, 3)
+    inputs. draw(k) returns the next k standard normals ((k,) or (N, k)); three are used per
+    active step in the order gyro bias walk, accel bias walk, gyro noise, accel noise.
+    """
+    steps = (
+        (gyro_noise.bias_rw_std > 0.0 and dt > 0.0, gyro_noise.bias_rw_std * np.sqrt(dt)),
+        (accel_noise.bias_rw_std > 0.0 and dt > 0.0, accel_noise.bias_rw_std * np.sqrt(dt)),
+        (gyro_noise.std > 0.0, gyro_noise.std),
+        (accel_noise.std > 0.0, accel_noise.std),
+    )
+    z = draw(3 * sum(active for active, _ in steps))
+    draws, i = [], 0
+    for active, scale in steps:
+        draws.append(scale * z[..., i : i + 3] if active else None)
+        i += 3 * int(active)
+    if draws[0] is not None:
+        gyro_bias = gyro_bias + draws[0]
+    if draws[1] is not None:
+        accel_bias = accel_bias + draws[1]
+    gyro = pqr_radps + gyro_bias
+    accel = specific_force_ms2 + accel_bias
+    if draws[2] is not None:
+        gyro = gyro + draws[2]
+    if draws[3] is not None:
+        accel = accel + draws[3]
+    return gyro, accel, gyro_bias, accel_bias
 
 
 @dataclass
@@ -23,29 +77,21 @@ class IMU:
     gyro_noise: NoiseConfig = field(default_factory=lambda: NoiseConfig(std=0.002, bias0=0.0, bias_rw_std=0.0003))
     accel_noise: NoiseConfig = field(default_factory=lambda: NoiseConfig(std=0.05, bias0=0.0, bias_rw_std=0.01))
     sample: SampleConfig = field(default_factory=lambda: SampleConfig(rate_hz=100.0, delay_s=0.02))
-    seed: int | None = None
+    seed: SeedLike = None
 
     _rng: np.random.Generator = field(init=False)
-    _t_next: float = field(init=False, default=0.0)
     _gyro_bias: np.ndarray = field(init=False)
     _accel_bias: np.ndarray = field(init=False)
-    _delay: DelayLine[dict] = field(init=False)
-    _last_out: dict = field(init=False, default_factory=dict)
+    _hold: SampleHold[dict] = field(init=False)
 
     _prev_vb: np.ndarray = field(init=False, default_factory=lambda: np.zeros(3))
     _prev_omega: np.ndarray = field(init=False, default_factory=lambda: np.zeros(3))
 
     def __post_init__(self) -> None:
         self._rng = np.random.default_rng(self.seed)
-        self._t_next = 0.0
         self._gyro_bias = np.full(3, float(self.gyro_noise.bias0), dtype=float)
         self._accel_bias = np.full(3, float(self.accel_noise.bias0), dtype=float)
-        self._delay = DelayLine[dict](self.sample.delay_s)
-
-    def _bias_rw(self, bias: np.ndarray, cfg: NoiseConfig, dt: float) -> np.ndarray:
-        if cfg.bias_rw_std > 0.0 and dt > 0.0:
-            return bias + self._rng.normal(0.0, cfg.bias_rw_std * np.sqrt(dt), size=3)
-        return bias
+        self._hold = SampleHold(self.sample)
 
     def read(
         self,
@@ -59,60 +105,21 @@ class IMU:
         """
         Provide current body rates pqr and body velocities uvw, plus gravity expressed in body axes g_b.
         """
-        if t + 1e-12 >= self._t_next:
+        if self._hold.due(t):
             omega = np.asarray(pqr_radps, dtype=float).reshape(3)
             v_b = np.asarray(uvw_mps, dtype=float).reshape(3)
-
-            if dt > 0.0:
-                v_dot = (v_b - self._prev_vb) / dt
-            else:
-                v_dot = np.zeros(3)
-
-            # body acceleration a_b = v_dot + omega x v
-            a_b = v_dot + np.cross(omega, v_b)
-            specific_force = a_b - np.asarray(g_b_ms2, dtype=float).reshape(3)
-
-            self._gyro_bias = self._bias_rw(self._gyro_bias, self.gyro_noise, dt)
-            self._accel_bias = self._bias_rw(self._accel_bias, self.accel_noise, dt)
-
-            gyro_meas = omega + self._gyro_bias
-            accel_meas = specific_force + self._accel_bias
-
-            if self.gyro_noise.std > 0.0:
-                gyro_meas = gyro_meas + self._rng.normal(0.0, self.gyro_noise.std, size=3)
-            if self.accel_noise.std > 0.0:
-                accel_meas = accel_meas + self._rng.normal(0.0, self.accel_noise.std, size=3)
-
-            out = {
-                "p_radps": float(gyro_meas[0]),
-                "q_radps": float(gyro_meas[1]),
-                "r_radps": float(gyro_meas[2]),
-                "ax_ms2": float(accel_meas[0]),
-                "ay_ms2": float(accel_meas[1]),
-                "az_ms2": float(accel_meas[2]),
-            }
-            self._delay.push(t, out)
-            self._t_next = t + (1.0 / max(self.sample.rate_hz, 1e-3))
+            f_b = specific_force(omega, v_b, self._prev_vb, np.asarray(g_b_ms2, dtype=float).reshape(3), dt)
+            gyro_meas, accel_meas, self._gyro_bias, self._accel_bias = imu_sample(
+                self.gyro_noise, self.accel_noise, self._gyro_bias, self._accel_bias, omega, f_b, dt, self._rng.standard_normal
+            )
+            self._hold.push(t, dict(zip(IMU_CHANNELS, (float(v) for v in (*gyro_meas, *accel_meas)))))
 
             self._prev_vb = v_b
             self._prev_omega = omega
 
-        delayed = self._delay.pop_available(t)
-        if delayed is not None:
-            self._last_out = delayed
-
-        # ensure keys exist
-        if not self._last_out:
-            self._last_out = {
-                "p_radps": float(pqr_radps[0]),
-                "q_radps": float(pqr_radps[1]),
-                "r_radps": float(pqr_radps[2]),
-                "ax_ms2": 0.0,
-                "ay_ms2": 0.0,
-                "az_ms2": 0.0,
-            }
-        return dict(self._last_out)
-
-
-
-
+        out = self._hold.output(t)
+        if out is None:
+            # ensure keys exist before the first delayed sample
+            out = dict(zip(IMU_CHANNELS, (float(pqr_radps[0]), float(pqr_radps[1]), float(pqr_radps[2]), 0.0, 0.0, 0.0)))
+            self._hold.last = out
+        return dict(out)
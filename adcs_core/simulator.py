@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import argparse
 import os
-from dataclasses import asdict
-from typing import Dict, Tuple
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Sequence, Tuple
 
 import numpy as np
 
@@ -13,15 +13,19 @@ from adcs_core.aircraft.parameters import AircraftParameters
 from adcs_core.control.failure_modes import FailureManager
 from adcs_core.control.actuators import ActuatorState
 from adcs_core.control.autopilot import Autopilot, AutopilotTargets
-from adcs_core.dynamics.equations import derivatives_6dof, post_step_sanitize, rotation_body_to_inertial
-from adcs_core.dynamics.integrator import rk4_step
+from adcs_core.dynamics.equations import post_step_sanitize, rotation_body_to_inertial
+from adcs_core.dynamics.fast_rhs import FastRhs
+from adcs_core.dynamics.integrator import Rk4Workspace, rk4_step_inplace
 from adcs_core.state import State, airspeed
 from adcs_core.environment.wind import WindModel
 from adcs_core.sensors.airspeed import AirspeedSensor
 from adcs_core.sensors.altimeter import Altimeter
+from adcs_core.sensors.common import NoiseConfig
 from adcs_core.sensors.compass import Compass
 from adcs_core.sensors.imu import IMU
 from adcs_core.logger.logger import CsvLogger, default_log_path
+from adcs_core.scenarios.scenario_runner import ScenarioEvent, ScenarioRunner
+from adcs_core.seeding import SENSOR_SEED_OFFSETS, SeedLike, derive_seed
 
 
 def truth_from_state(s: State) -> Dict[str, float]:
@@ -45,20 +49,83 @@ def default_initial_state() -> State:
     return State(x=0.0, y=0.0, z=-1000.0, u=35.0, v=0.0, w=0.0, phi=0.0, theta=0.0, psi=0.0, p=0.0, q=0.0, r=0.0)
 
 
-def run(
+@dataclass(frozen=True)
+class SimTrace:
+    """
+    In-memory closed-loop run: one row per logged step (t, truth state, applied controls
+    [throttle, aileron, elevator, rudder], NED wind).
+    """
+
+    t: np.ndarray
+    x: np.ndarray
+    u: np.ndarray
+    wind_ned_mps: np.ndarray
+
+
+def apply_scenario_event(evt: ScenarioEvent, failures: FailureManager, targets: AutopilotTargets) -> AutopilotTargets:
+    """
+    Apply a declarative event (picklable, unlike FailureManager.schedule callables) and
+    return the autopilot targets in force afterwards.
+
+    "targets": payload fields of AutopilotTargets to change; the others keep their values.
+    "actuator_failure": payload fields of ActuatorFailures (e.g. elevator_stuck_rad).
+    "sensor_dropout" / "sensor_freeze": {"signal": name, "active": bool}.
+    "sensor_bias": {"signal": name, "bias": value}.
+    """
+    payload = dict(evt.payload)
+    if evt.name == "targets":
+        return replace(targets, **payload)
+    if evt.name == "actuator_failure":
+        for name, value in payload.items():
+            if not hasattr(failures.act, name):
+                raise ValueError(f"Unknown actuator failure field '{name}'.")
+            setattr(failures.act, name, value)
+    elif evt.name == "sensor_dropout":
+        failures.sens.dropout[str(payload["signal"])] = bool(payload.get("active", True))
+    elif evt.name == "sensor_freeze":
+        failures.sens.freeze[str(payload["signal"])] = bool(payload.get("active", True))
+    elif evt.name == "sensor_bias":
+        failures.sens.bias_spike[str(payload["signal"])] = float(payload["bias"])
+    else:
+        raise ValueError(f"Unknown scenario event '{evt.name}'.")
+    return targets
+
+
+def _scaled_noise(noise: NoiseConfig, scale: float) -> NoiseConfig:
+    return replace(noise, std=noise.std * float(scale), bias_rw_std=noise.bias_rw_std * float(scale))
+
+
+def simulate_closed_loop(
     tfinal: float,
     dt: float,
     autopilot_enabled: bool,
     targets: AutopilotTargets,
     actuator_tau: float,
-    seed: int | None = None,
+    seed: SeedLike = None,
     wind_ned_mps: tuple[float, float, float] = (0.0, 0.0, 0.0),
-) -> Tuple[str, int]:
-    params = AircraftParameters()
+    *,
+    events: Sequence[ScenarioEvent] = (),
+    x0: np.ndarray | None = None,
+    params: AircraftParameters | None = None,
+    turb_std_mps: float | None = None,
+    sensor_noise_scale: float = 1.0,
+    on_step: Callable[[Dict[str, float]], None] | None = None,
+) -> SimTrace:
+    """
+    Closed-loop run (wind, sensors, failures, autopilot, actuators) kept in memory.
+    on_step receives the canonical log row of every step (as written by run); rows and
+    force/moment debug terms are only built when it is given. turb_std_mps overrides the
+    WindModel turbulence intensity and sensor_noise_scale multiplies every sensor's white
+    noise and bias random walk (both for dispersion campaigns). The wind, turbulence and
+    sensor streams are seeded with derive_seed(seed, k); pass a spawned SeedSequence
+    rather than an int when runs must be statistically independent.
+    """
+    params = AircraftParameters() if params is None else params
     limits = ActuatorLimits()
+    rhs = FastRhs(params, limits)
+    rk4_work = Rk4Workspace.for_shape(12)
 
-    s = default_initial_state()
-    x = s.as_vector()
+    x = default_initial_state().as_vector() if x0 is None else np.array(x0, dtype=float).reshape(12)
     t = 0.0
 
     ap = Autopilot()
@@ -68,76 +135,88 @@ def run(
     # Example scheduled failures (disabled by default; uncomment to use in scripted runs)
     # failures.schedule(15.0, lambda: setattr(failures.act, "elevator_stuck_rad", np.deg2rad(10.0)))
     # failures.schedule(20.0, lambda: failures.sens.dropout.__setitem__("altitude_m", True))
+    scenario = ScenarioRunner(list(events))
+
+    def apply_event(evt: ScenarioEvent) -> None:
+        nonlocal targets
+        targets = apply_scenario_event(evt, failures, targets)
 
     # Phase 3: sensors + environment
-    wind = WindModel(steady_ned_mps=np.array(wind_ned_mps, dtype=float), seed=seed)
-    altimeter = Altimeter(seed=None if seed is None else seed + 1)
-    airspeed_sensor = AirspeedSensor(seed=None if seed is None else seed + 2)
-    compass = Compass(seed=None if seed is None else seed + 3)
-    imu = IMU(seed=None if seed is None else seed + 4)
+    turb = {} if turb_std_mps is None else {"turb_std_mps": float(turb_std_mps)}
+    wind = WindModel(steady_ned_mps=np.array(wind_ned_mps, dtype=float), seed=seed, **turb)
+    altimeter = Altimeter(seed=derive_seed(seed, SENSOR_SEED_OFFSETS["altimeter"]))
+    airspeed_sensor = AirspeedSensor(seed=derive_seed(seed, SENSOR_SEED_OFFSETS["airspeed"]))
+    compass = Compass(seed=derive_seed(seed, SENSOR_SEED_OFFSETS["compass"]))
+    imu = IMU(seed=derive_seed(seed, SENSOR_SEED_OFFSETS["imu"]))
+    if sensor_noise_scale != 1.0:
+        for sensor in (altimeter, airspeed_sensor, compass):
+            sensor.noise = _scaled_noise(sensor.noise, sensor_noise_scale)
+        imu.gyro_noise = _scaled_noise(imu.gyro_noise, sensor_noise_scale)
+        imu.accel_noise = _scaled_noise(imu.accel_noise, sensor_noise_scale)
 
     u_cmd = ControlInputs(throttle=0.5)
 
-    out_path = default_log_path("sim", "csv", "logs")
-    logger = CsvLogger(out_path)
     steps = int(np.ceil(tfinal / dt))
-
-    try:
-        for _k in range(steps + 1):
-            s = State.from_vector(x)
-            truth = truth_from_state(s)
-
-            failures.step(t)
-
-            # wind step (NED inertial), convert to body for air-relative velocity
-            w_ned = wind.step(dt)
-            C_bi = rotation_body_to_inertial(s.phi, s.theta, s.psi)
-            w_body = C_bi.T @ w_ned
-            v_b = np.array([s.u, s.v, s.w], dtype=float)
-            v_air_b = v_b - w_body
-
-            # gravity in body for IMU (NED: +g in down)
-            g_i = np.array([0.0, 0.0, params.g_ms2], dtype=float)
-            g_b = C_bi.T @ g_i
-
-            # sensor reads (noisy, rate-limited, delayed)
-            meas = {
-                "altitude_m": altimeter.read(t, -float(s.z), dt),
-                "airspeed_mps": airspeed_sensor.read(t, float(np.linalg.norm(v_air_b)), dt),
-                "heading_rad": compass.read(t, float(s.psi), dt),
-                "phi_rad": float(s.phi),
-                "theta_rad": float(s.theta),
-            }
-            meas.update(
-                imu.read(
-                    t,
-                    pqr_radps=np.array([s.p, s.q, s.r], dtype=float),
-                    uvw_mps=v_b,
-                    g_b_ms2=g_b,
-                    dt=dt,
-                )
+    t_hist = np.empty(steps + 1, dtype=float)
+    x_hist = np.empty((steps + 1, 12), dtype=float)
+    u_hist = np.empty((steps + 1, 4), dtype=float)
+    w_hist = np.empty((steps + 1, 3), dtype=float)
+
+    for k in range(steps + 1):
+        s = State.from_vector(x)
+
+        scenario.step(t, apply_event)
+        failures.step(t)
+
+        # wind step (NED inertial), convert to body for air-relative velocity
+        w_ned = wind.step(dt)
+        C_bi = rotation_body_to_inertial(s.phi, s.theta, s.psi)
+        w_body = C_bi.T @ w_ned
+        v_b = np.array([s.u, s.v, s.w], dtype=float)
+        v_air_b = v_b - w_body
+
+        # gravity in body for IMU (NED: +g in down)
+        g_i = np.array([0.0, 0.0, params.g_ms2], dtype=float)
+        g_b = C_bi.T @ g_i
+
+        # sensor reads (noisy, rate-limited, delayed)
+        meas = {
+            "altitude_m": altimeter.read(t, -float(s.z), dt),
+            "airspeed_mps": airspeed_sensor.read(t, float(np.linalg.norm(v_air_b)), dt),
+            "heading_rad": compass.read(t, float(s.psi), dt),
+            "phi_rad": float(s.phi),
+            "theta_rad": float(s.theta),
+        }
+        meas.update(
+            imu.read(
+                t,
+                pqr_radps=np.array([s.p, s.q, s.r], dtype=float),
+                uvw_mps=v_b,
+                g_b_ms2=g_b,
+                dt=dt,
             )
-            meas = failures.apply_sensors(meas)
+        )
+        meas = failures.apply_sensors(meas)
 
-            ap_debug = {}
-            if autopilot_enabled:
-                u_cmd, ap_debug = ap.update(meas, targets, dt)
+        ap_debug = {}
+        if autopilot_enabled:
+            u_cmd, ap_debug = ap.update(meas, targets, dt)
 
-            u_cmd = failures.apply_actuator(u_cmd)
-            u = act.update(u_cmd, dt)
+        u_cmd = failures.apply_actuator(u_cmd)
+        u = act.update(u_cmd, dt)
 
-            _, _, fm_debug = forces_and_moments_body(s, u, params, limits, uvw_air_mps=v_air_b)
+        # Hold wind constant over RK4 substeps for determinism
+        rhs.set_controls(u)
+        rhs.set_wind(w_ned)
 
-            def f_dyn(ti: float, xi: np.ndarray) -> np.ndarray:
-                si = State.from_vector(xi)
-                # Hold wind constant over RK4 substeps for determinism
-                C_bi_i = rotation_body_to_inertial(si.phi, si.theta, si.psi)
-                w_body_i = C_bi_i.T @ w_ned
-                v_b_i = np.array([si.u, si.v, si.w], dtype=float)
-                v_air_b_i = v_b_i - w_body_i
-                F, M, _ = forces_and_moments_body(si, u, params, limits, uvw_air_mps=v_air_b_i)
-                return derivatives_6dof(ti, xi, params, F, M)
+        t_hist[k] = t
+        x_hist[k] = x
+        u_hist[k] = (u.throttle, u.aileron, u.elevator, u.rudder)
+        w_hist[k] = w_ned
 
+        if on_step is not None:
+            truth = truth_from_state(s)
+            _, _, fm_debug = forces_and_moments_body(s, u, params, limits, uvw_air_mps=v_air_b)
             # canonical log fields (truth/meas/control)
             row = {
                 "t": t,
@@ -166,17 +245,35 @@ def run(
             # keep detailed debug for deep dives (stable schema via prefix)
             row.update({f"ap_{kk}": vv for kk, vv in ap_debug.items()})
             row.update({f"fm_{kk}": vv for kk, vv in fm_debug.items()})
+            on_step(row)
 
-            logger.log(row)
+        # integrate
+        x = rk4_step_inplace(rhs.evaluate_into, t, x, dt, out=x, work=rk4_work)
+        post_step_sanitize(x, out=x)
+        t += dt
 
-            # integrate
-            x = rk4_step(f_dyn, t, x, dt)
-            x = post_step_sanitize(x)
-            t += dt
+    return SimTrace(t=t_hist, x=x_hist, u=u_hist, wind_ned_mps=w_hist)
+
+
+def run(
+    tfinal: float,
+    dt: float,
+    autopilot_enabled: bool,
+    targets: AutopilotTargets,
+    actuator_tau: float,
+    seed: SeedLike = None,
+    wind_ned_mps: tuple[float, float, float] = (0.0, 0.0, 0.0),
+) -> Tuple[str, int]:
+    out_path = default_log_path("sim", "csv", "logs")
+    logger = CsvLogger(out_path)
+    try:
+        trace = simulate_closed_loop(
+            tfinal, dt, autopilot_enabled, targets, actuator_tau, seed=seed, wind_ned_mps=wind_ned_mps, on_step=logger.log
+        )
     finally:
         logger.close()
 
-    return out_path, steps
+    return out_path, trace.t.size - 1
 
 
 def main() -> None:
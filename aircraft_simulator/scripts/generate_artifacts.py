@@ -18,19 +18,28 @@ if _ROOT not in sys.path:
 from adcs_core.api import (  # noqa: E402
     ControlIndex,
     ControlInputs,
+    ResultStore,
+    StateFeedback,
     StateIndex,
     analyze_modal_structure,
     compute_level_trim,
     design_longitudinal_lqr,
     get_aircraft_model,
     linearize,
-    rk4_step,
+    result_key,
+    simulate,
     xdot_full,
 )
 
 
-def _linearize_at_trim(aircraft_id: str, speed_mps: float) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, object]:
+def _linearize_at_trim(
+    aircraft_id: str, speed_mps: float, store: ResultStore | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, object]:
     model = get_aircraft_model(aircraft_id)
+    if store is not None:
+        key = result_key("artifacts_linearization", model.params, model.limits, speed_mps)
+        A, B, x0, u0 = store.get_or_compute(key, lambda: _linearize_at_trim(aircraft_id, speed_mps)[:4])
+        return A, B, x0, u0, model
     trim = compute_level_trim(speed_mps, model.params, limits=model.limits)
 
     def f(x: np.ndarray, u_vec: np.ndarray) -> np.ndarray:
@@ -66,7 +75,7 @@ def _simulate_response(
     dt_s: float,
     alpha_perturb_deg: float,
 ) -> dict[str, np.ndarray]:
-    t = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s)
+    n_steps = np.arange(0.0, tfinal_s + 0.5 * dt_s, dt_s).size - 1
     x = _apply_alpha_perturbation(x_trim, alpha_perturb_deg=alpha_perturb_deg)
 
     idx_lon = np.array(
@@ -78,61 +87,24 @@ def _simulate_response(
         ],
         dtype=int,
     )
-
-    x_hist = np.zeros((t.size, 12), dtype=float)
-    err_hist = np.zeros(t.size, dtype=float)
-    de_hist = np.zeros(t.size, dtype=float)
-    thr_hist = np.zeros(t.size, dtype=float)
-
-    def f_dyn(tt: float, xx: np.ndarray) -> np.ndarray:
-        if K is None:
-            de = float(u_trim[int(ControlIndex.ELEVATOR)])
-            thr = float(u_trim[int(ControlIndex.THROTTLE)])
-        else:
-            x_sub = xx[idx_lon]
-            x_ref = x_trim[idx_lon]
-            du = -K @ (x_sub - x_ref)
-            de = float(
-                np.clip(
-                    u_trim[int(ControlIndex.ELEVATOR)] + float(du[0]),
-                    -model.limits.elevator_max_rad,
-                    model.limits.elevator_max_rad,
-                )
-            )
-            thr = float(np.clip(u_trim[int(ControlIndex.THROTTLE)] + float(du[1]), 0.0, 1.0))
-
-        ctrl = ControlInputs(throttle=thr, aileron=0.0, elevator=de, rudder=0.0)
-        return xdot_full(xx, ctrl, params=model.params, limits=model.limits)
-
-    for i, tt in enumerate(t):
-        x_hist[i] = x
-        err_hist[i] = float(np.linalg.norm(x[idx_lon] - x_trim[idx_lon]))
-        if K is None:
-            de_hist[i] = float(u_trim[int(ControlIndex.ELEVATOR)])
-            thr_hist[i] = float(u_trim[int(ControlIndex.THROTTLE)])
-        else:
-            x_sub = x[idx_lon]
-            x_ref = x_trim[idx_lon]
-            du = -K @ (x_sub - x_ref)
-            de_hist[i] = float(
-                np.clip(
-                    u_trim[int(ControlIndex.ELEVATOR)] + float(du[0]),
-                    -model.limits.elevator_max_rad,
-                    model.limits.elevator_max_rad,
-                )
-            )
-            thr_hist[i] = float(np.clip(u_trim[int(ControlIndex.THROTTLE)] + float(du[1]), 0.0, 1.0))
-
-        if i < t.size - 1:
-            x = rk4_step(f_dyn, float(tt), x, dt_s)
-
-    return {
-        "t": t,
-        "x": x_hist,
-        "err": err_hist,
-        "de": de_hist,
-        "thr": thr_hist,
-    }
+    idx_u = [int(ControlIndex.ELEVATOR), int(ControlIndex.THROTTLE)]
+
+    controller = StateFeedback(x_ref=x_trim, u_ref=u_trim, K=K, state_idx=idx_lon, input_idx=idx_u, limits=model.limits)
+    sim = simulate(
+        x,
+        controller,
+        dt_s,
+        n_steps,
+        params=model.params,
+        limits=model.limits,
+        record={
+            "x": "state",
+            "err": lambda X, _U: np.linalg.norm(X[:, idx_lon] - x_trim[idx_lon], axis=1),
+            "de": lambda _X, U: U[:, int(ControlIndex.ELEVATOR)],
+            "thr": lambda _X, U: U[:, int(ControlIndex.THROTTLE)],
+        },
+    )
+    return {"t": sim.t, **sim.channels}
 
 
 def main() -> None:
@@ -143,11 +115,13 @@ def main() -> None:
     parser.add_argument("--tfinal-s", type=float, default=8.0)
     parser.add_argument("--dt-s", type=float, default=0.01)
     parser.add_argument("--alpha-perturb-deg", type=float, default=0.5)
+    parser.add_argument("--result-store", default="off", help="Directory to reuse trim/linearization results in (default: off).")
     args = parser.parse_args()
 
     os.makedirs(args.outdir, exist_ok=True)
 
-    A, B, x_trim, u_trim, model = _linearize_at_trim(args.aircraft_id, args.speed_mps)
+    store = None if args.result_store.lower() == "off" else ResultStore(args.result_store)
+    A, B, x_trim, u_trim, model = _linearize_at_trim(args.aircraft_id, args.speed_mps, store)
     eig_open = np.linalg.eigvals(A)
     modal = analyze_modal_structure(A)
     lqr_design = design_longitudinal_lqr(A, B)
@@ -5,6 +5,7 @@ from pathlib import Path
 
 
 FORBIDDEN_IMPORTS: dict[str, tuple[str, ...]] = {
+    "adcs_core.aircraft": ("adcs_core.analysis", "adcs_core.control", "adcs_core.dynamics"),
     "adcs_core.analysis": ("adcs_core.control",),
     "adcs_core.control": ("adcs_core.analysis",),
     "adcs_core.dynamics": ("adcs_core.analysis", "adcs_core.control"),
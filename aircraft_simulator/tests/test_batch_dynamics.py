@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.aircraft.forces_moments import forces_and_moments_body, forces_and_moments_body_batch
+from adcs_core.model import xdot_full, xdot_full_batch
+from adcs_core.state import State
+
+
+def _random_batch(n: int, seed: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    X = np.zeros((n, 12), dtype=float)
+    X[:, 0:3] = rng.normal(0.0, 100.0, size=(n, 3))
+    X[:, 3] = rng.uniform(20.0, 180.0, size=n)
+    X[:, 4:6] = rng.normal(0.0, 5.0, size=(n, 2))
+    X[:, 6:9] = rng.uniform(-0.8, 0.8, size=(n, 3))
+    X[:, 9:12] = rng.normal(0.0, 0.3, size=(n, 3))
+    # Deliberately exceed actuator limits on some rows to exercise the clamp.
+    U = np.column_stack(
+        [
+            rng.uniform(-0.2, 1.2, size=n),
+            rng.uniform(-0.5, 0.5, size=n),
+            rng.uniform(-0.6, 0.6, size=n),
+            rng.uniform(-0.7, 0.7, size=n),
+        ]
+    )
+    uvw_air = X[:, 3:6] - rng.normal(0.0, 3.0, size=(n, 3))
+    return X, U, uvw_air
+
+
+def _ctrl(u_vec: np.ndarray) -> ControlInputs:
+    return ControlInputs(throttle=float(u_vec[0]), aileron=float(u_vec[1]), elevator=float(u_vec[2]), rudder=float(u_vec[3]))
+
+
+@pytest.mark.parametrize("aircraft_id", ["cessna_172r", "f16_research"])
+def test_batched_xdot_matches_scalar_path(aircraft_id: str) -> None:
+    model = get_aircraft_model(aircraft_id)
+    X, U, uvw_air = _random_batch(64, seed=3)
+
+    for air in (None, uvw_air):
+        batch = xdot_full_batch(X, U, params=model.params, limits=model.limits, uvw_air_mps=air)
+        scalar = np.array(
+            [
+                xdot_full(
+                    X[i],
+                    _ctrl(U[i]),
+                    params=model.params,
+                    limits=model.limits,
+                    uvw_air_mps=None if air is None else air[i],
+                )
+                for i in range(X.shape[0])
+            ]
+        )
+        assert batch.shape == (64, 12)
+        assert np.allclose(batch, scalar, rtol=1e-12, atol=1e-9)
+
+
+def test_batched_forces_match_scalar_path() -> None:
+    model = get_aircraft_model("cessna_172r")
+    X, U, uvw_air = _random_batch(16, seed=11)
+    F, M = forces_and_moments_body_batch(X, U, model.params, model.limits, uvw_air_mps=uvw_air)
+    for i in range(X.shape[0]):
+        Fi, Mi, _ = forces_and_moments_body(State.from_vector(X[i]), _ctrl(U[i]), model.params, model.limits, uvw_air_mps=uvw_air[i])
+        assert np.allclose(F[i], Fi, rtol=1e-12, atol=1e-8)
+        assert np.allclose(M[i], Mi, rtol=1e-12, atol=1e-8)
+
+
+def test_batched_xdot_broadcasts_single_control_row() -> None:
+    X, U, _ = _random_batch(8, seed=5)
+    out = xdot_full_batch(X, U[:1])
+    ref = xdot_full_batch(X, np.repeat(U[:1], 8, axis=0))
+    assert np.array_equal(out, ref)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pickle
+from dataclasses import replace
+
+import numpy as np
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.compiled import compile_aircraft, parameters_fingerprint
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.dynamics.fast_rhs import FastRhs
+from adcs_core.model import xdot_full, xdot_full_batch
+
+
+def test_compiled_pack_is_accepted_by_entry_points() -> None:
+    model = get_aircraft_model("cessna_172r")
+    pack = compile_aircraft(model)
+
+    assert pack.params is model.params and pack.limits == model.limits
+    assert np.allclose(pack.inertia_inv @ model.params.inertia_kgm2, np.eye(3))
+    assert not hasattr(pack, "CL0")
+
+    x = np.zeros(12)
+    x[3], x[5], x[9], x[11] = 40.0, 2.0, 0.1, -0.05
+    u = ControlInputs(throttle=0.6, aileron=0.02, elevator=-0.05, rudder=0.01)
+    ref = xdot_full(x, u, params=model.params, limits=model.limits)
+    assert np.array_equal(xdot_full(x, u, params=pack), ref)
+    assert np.array_equal(FastRhs(pack)._Iinv, pack.inertia_inv)
+
+    trim_ref = compute_level_trim(45.0, model.params, limits=model.limits)
+    trim_pack = compute_level_trim(45.0, pack)
+    assert np.array_equal(trim_ref.x0, trim_pack.x0)
+    assert np.array_equal(trim_ref.u0, trim_pack.u0)
+
+
+def test_pack_constants_feed_batch_path_bit_identically() -> None:
+    model = get_aircraft_model("f16_research")
+    pack = compile_aircraft(model)
+    p = model.params
+
+    assert pack.S_b == p.S_m2 * p.b_m and pack.half_cbar == 0.5 * p.cbar_m
+    assert pack.lon_coeffs.flags.c_contiguous and not pack.lon_coeffs.flags.writeable
+    assert pack.lat_coeffs[0] == p.CY_beta_per_rad
+
+    rng = np.random.default_rng(3)
+    X = np.zeros((6, 12))
+    X[:, 3] = 150.0 + rng.standard_normal(6)
+    X[:, 4:6] = rng.standard_normal((6, 2))
+    X[:, 9:12] = 0.1 * rng.standard_normal((6, 3))
+    U = np.column_stack([rng.uniform(0.2, 0.8, 6), 0.05 * rng.standard_normal((6, 3))])
+    ref = xdot_full_batch(X, U, params=p, limits=model.limits)
+    assert np.array_equal(xdot_full_batch(X, U, params=pack), ref)
+
+
+def test_fingerprint_is_stable_and_content_sensitive() -> None:
+    model = get_aircraft_model("f16_research")
+    a = compile_aircraft(model)
+    b = pickle.loads(pickle.dumps(a))
+
+    assert a.fingerprint == b.fingerprint == parameters_fingerprint(model.params, model.limits)
+    assert a == b and hash(a) == hash(b)
+    assert compile_aircraft(a) is a
+
+    heavier = compile_aircraft(replace(model.params, mass_kg=model.params.mass_kg + 1e-9), model.limits)
+    assert heavier.fingerprint != a.fingerprint
+    narrower = compile_aircraft(model.params, replace(model.limits, elevator_max_rad=0.1))
+    assert narrower.fingerprint != a.fingerprint
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.parameters import AircraftParameters
+from adcs_core.analysis.monte_carlo import run_monte_carlo
+from adcs_core.scenarios.dispersion import Dispersion, StoppingRule, dispersion_values, run_dispersion_campaign
+from adcs_core.scenarios.monte_carlo import MonteCarloCampaign
+
+
+def test_dispersion_mapping_and_quantile_interval() -> None:
+    campaign = MonteCarloCampaign(wind_ned_mps=(2.0, 0.0, 0.0))
+    dispersions = [Dispersion("mass_kg", 0.1, relative=True), Dispersion("wind_n_mps", 1.0, "normal")]
+    values = dispersion_values(campaign, dispersions, np.array([[0.0, 0.5], [1.0, 0.841344746]]))
+    mass = AircraftParameters().mass_kg
+    assert np.allclose(values[:, 0], [0.9 * mass, 1.1 * mass])
+    assert np.allclose(values[:, 1], [2.0, 3.0], atol=1e-6)
+
+    rule = StoppingRule("x", tolerance=0.1, statistic=0.95)
+    est, lo, hi = rule.interval(np.random.default_rng(0).standard_normal(20))
+    assert np.isinf(hi - lo) and np.isfinite(est)
+    samples = np.random.default_rng(0).standard_normal(20000)
+    est, lo, hi = rule.interval(samples)
+    assert lo < 1.645 < hi and abs(est - 1.645) < 0.05 and rule.converged(samples)
+    assert StoppingRule("x", tolerance=0.02, statistic="mean").converged(samples)
+
+
+def test_dispersion_campaign_stops_adaptively_and_is_worker_independent() -> None:
+    campaign = MonteCarloCampaign(tfinal=1.0)
+    dispersions = [Dispersion("mass_kg", 0.1, relative=True), Dispersion("sensor_noise_scale", 0.5)]
+    stop = StoppingRule("theta_max_rad", tolerance=1.0, statistic="mean")
+    result, history = run_dispersion_campaign(campaign, dispersions, seed=2, batch_size=4, max_runs=64, stop=stop)
+    assert result.runs == 4 and len(history) == 1 and history[0]["runs"] == 4
+    assert history[0]["upper"] - history[0]["lower"] <= 2.0
+
+    serial, _ = run_dispersion_campaign(campaign, dispersions, sampler="lhs", seed=2, batch_size=4, max_runs=6)
+    pooled, none = run_dispersion_campaign(
+        campaign, dispersions, sampler="lhs", seed=2, batch_size=4, max_runs=6, max_workers=2, chunk_size=1
+    )
+    assert serial.runs == 6 and none == []
+    for name, values in serial.metrics.items():
+        assert np.array_equal(values, pooled.metrics[name], equal_nan=True)
+    assert np.unique(serial.metrics["mass_kg"]).size == 6
+
+
+def test_non_finite_means_and_array_fields_fail_loudly() -> None:
+    with pytest.raises(ValueError, match="non-finite"):
+        StoppingRule("x", tolerance=0.1, statistic="mean").interval(np.array([1.0, np.nan, 2.0]))
+    est, lo, hi = StoppingRule("x", tolerance=0.1, statistic=0.5).interval(np.array([1.0, np.nan, 2.0]))
+    assert est == 2.0
+
+    campaign = MonteCarloCampaign(tfinal=1.0)
+    with pytest.raises(ValueError, match="not a scalar"):
+        run_dispersion_campaign(campaign, [Dispersion("inertia_kgm2", 0.1, relative=True)], max_runs=1)
+    with pytest.raises(ValueError, match="not a scalar"):
+        dispersion_values(campaign, [Dispersion("inertia_kgm2", 0.1)], np.full((1, 1), 0.5))
+
+    def sim_fn(wind: float) -> tuple[np.ndarray, np.ndarray]:
+        return np.arange(3.0), np.full((3, 4), 0.01 * wind)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        results = run_monte_carlo(sim_fn, seed=1, sampler="sobol")
+    assert len(results) == 20
+
+    with pytest.raises(ValueError, match="power-of-two"):
+        run_dispersion_campaign(campaign, [Dispersion("mass_kg", 1.0)], batch_size=48)
+    with pytest.raises(ValueError, match="power-of-two"):
+        run_dispersion_campaign(campaign, [Dispersion("mass_kg", 1.0)], max_runs=6)
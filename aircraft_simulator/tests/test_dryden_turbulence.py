@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+
+from adcs_core.environment.dryden import (
+    BlockNormals,
+    DrydenLikeTurbulence,
+    FirstOrderShapingFilter,
+    DrydenTurbulence,
+    DrydenTurbulenceBank,
+)
+
+
+def test_block_normals_and_lfilter_series_match_scalar_stepping() -> None:
+    blocks = BlockNormals([1, 2], block=4)
+    scalar = [np.random.default_rng(1), np.random.default_rng(2)]
+    for k, rows, idx in [(3, None, [0, 1]), (2, [1], [1]), (5, None, [0, 1]), (1, np.array([True, False]), [0])]:
+        expected = np.array([[scalar[i].normal(0.0, 1.0) for _ in range(k)] for i in idx])
+        assert np.array_equal(blocks.take(k, rows), expected)
+
+    stepped, batch = DrydenLikeTurbulence(seed=4), DrydenLikeTurbulence(seed=4)
+    ref = np.array([stepped.step(0.02) for _ in range(400)])
+    series = batch.series(400, 0.02)
+    assert np.allclose(series, ref, rtol=0.0, atol=1e-12)
+    assert np.allclose(batch.step(0.02), stepped.step(0.02), rtol=0.0, atol=1e-12)
+
+
+def test_dryden_bank_matches_cached_single_models() -> None:
+    seeds = [3, 4, 5]
+    bank = DrydenTurbulenceBank(3, intensity=0.4, seeds=seeds)
+    singles = [DrydenTurbulence(intensity=0.4, seed=s) for s in seeds]
+    for k in range(300):
+        h = np.array([150.0, 300.0, 600.0]) + 0.05 * k
+        V = np.array([35.0, 0.5 if k < 100 else 40.0, 50.0]) + 0.01 * k
+        out = bank.step(0.01, h, V)
+        ref = np.array([s.step(0.01, h[i], V[i]) for i, s in enumerate(singles)])
+        assert np.allclose(out, ref, rtol=0.0, atol=1e-12)
+    assert np.any(out[1] != 0.0)
+
+    exact, cached = DrydenTurbulence(intensity=0.4, seed=9, h_tol_m=0.0, V_tol_mps=0.0), DrydenTurbulence(intensity=0.4, seed=9)
+    a = np.array([exact.step(0.01, 300.0 + 0.01 * k, 40.0).copy() for k in range(200)])
+    b = np.array([cached.step(0.01, 300.0 + 0.01 * k, 40.0).copy() for k in range(200)])
+    assert np.max(np.abs(a - b)) < 1e-2 * np.max(np.abs(a))
+    offline = DrydenTurbulence(intensity=0.4, seed=9).series(200, 0.01, 300.0, 40.0)
+    held = DrydenTurbulence(intensity=0.4, seed=9)
+    assert np.allclose(offline, [held.step(0.01, 300.0, 40.0) for _ in range(200)], rtol=0.0, atol=1e-12)
+
+
+def test_first_order_shaping_filter_is_constructible_and_seeded() -> None:
+    a, b = FirstOrderShapingFilter(1.0, 2.0, seed=1), FirstOrderShapingFilter(1.0, 2.0, seed=1)
+    xs = [a.step(0.1) for _ in range(50)]
+    assert xs == [b.step(0.1) for _ in range(50)]
+    assert np.std(xs) > 0.0 and a.step(0.0) == xs[-1]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.compiled import compile_aircraft, parameters_fingerprint
+from adcs_core.aircraft.parameters import AircraftParameters, StackedParameters
+from adcs_core.control.autopilot import AutopilotTargets
+from adcs_core.ensemble import EnsembleSimulator, stack_parameters
+from adcs_core.scenarios.scenario_runner import ScenarioEvent
+from adcs_core.simulator import simulate_closed_loop
+
+
+def test_ensemble_members_reproduce_single_runs() -> None:
+    targets = AutopilotTargets(airspeed_mps=35.0, altitude_m=1050.0, heading_rad=0.3)
+    events = (
+        ScenarioEvent(1.0, "sensor_freeze", {"signal": "altitude_m"}),
+        ScenarioEvent(2.0, "actuator_failure", {"rudder_stuck_rad": 0.05}),
+    )
+    seeds = [13, 21]
+    winds = np.array([[1.0, -0.5, 0.0], [0.0, 2.0, 0.3]])
+    params = [AircraftParameters(), replace(AircraftParameters(), mass_kg=1250.0, CL_alpha_per_rad=5.2)]
+    ens = EnsembleSimulator(2, targets=targets, seeds=seeds, params=params, wind_ned_mps=winds, events=events)
+    trace = ens.run(4.0, 0.02)
+    assert trace.x.shape == (201, 2, 12)
+
+    for i, seed in enumerate(seeds):
+        ref = simulate_closed_loop(
+            4.0, 0.02, True, targets, 0.15, seed=seed, wind_ned_mps=tuple(winds[i]), events=events, params=params[i]
+        )
+        assert np.array_equal(ref.wind_ned_mps, trace.wind_ned_mps[:, i])
+        assert np.allclose(ref.x, trace.x[:, i], rtol=0.0, atol=1e-9)
+        assert np.allclose(ref.u, trace.u[:, i], rtol=0.0, atol=1e-9)
+    assert not np.allclose(trace.x[-1, 0], trace.x[-1, 1])
+
+
+def test_stack_parameters_only_stacks_differing_fields() -> None:
+    base = AircraftParameters()
+    stacked = stack_parameters([base, replace(base, mass_kg=1200.0, inertia_kgm2=2.0 * base.inertia_kgm2)])
+    assert np.array_equal(stacked.mass_kg, [base.mass_kg, 1200.0])
+    assert stacked.inertia_kgm2.shape == (2, 3, 3)
+    assert stacked.S_m2 == base.S_m2
+    assert isinstance(stacked, StackedParameters) and not isinstance(stacked, AircraftParameters)
+    with pytest.raises(TypeError):
+        parameters_fingerprint(stacked)
+    with pytest.raises(TypeError):
+        compile_aircraft(stacked)
+    with pytest.raises(ValueError, match="parameter sets"):
+        EnsembleSimulator(3, params=stacked)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.aircraft.forces_moments import forces_and_moments_body
+from adcs_core.dynamics.equations import derivatives_6dof, rotation_body_to_inertial
+from adcs_core.dynamics.fast_rhs import FastRhs
+from adcs_core.dynamics.integrator import rk4_step
+from adcs_core.model import xdot_full
+from adcs_core.state import State
+
+
+def _reference_rhs(params, limits, u, w_ned, w_turb):
+    def f_dyn(ti: float, xi: np.ndarray) -> np.ndarray:
+        si = State.from_vector(xi)
+        C_bi_i = rotation_body_to_inertial(si.phi, si.theta, si.psi)
+        v_b_i = np.array([si.u, si.v, si.w], dtype=float)
+        v_air_b_i = v_b_i - C_bi_i.T @ w_ned - w_turb
+        F, M, _ = forces_and_moments_body(si, u, params, limits, uvw_air_mps=v_air_b_i)
+        return derivatives_6dof(ti, xi, params, F, M)
+
+    return f_dyn
+
+
+@pytest.mark.parametrize("aircraft_id", ["cessna_172r", "f16_research"])
+def test_fast_rhs_is_bit_identical_to_xdot_full(aircraft_id: str) -> None:
+    model = get_aircraft_model(aircraft_id)
+    rhs = FastRhs(model.params, model.limits)
+    rng = np.random.default_rng(17)
+    for _ in range(200):
+        x = rng.normal(0.0, 1.0, size=12)
+        x[3] += 60.0
+        x[7] = rng.uniform(-1.6, 1.6)
+        u = ControlInputs(
+            throttle=float(rng.uniform(-0.2, 1.2)),
+            aileron=float(rng.normal(0.0, 0.3)),
+            elevator=float(rng.normal(0.0, 0.3)),
+            rudder=float(rng.normal(0.0, 0.3)),
+        )
+        rhs.set_controls(u)
+        rhs.set_wind(None)
+        assert np.array_equal(rhs(0.0, x), xdot_full(x, u, params=model.params, limits=model.limits))
+
+
+def test_fast_rhs_rk4_with_wind_matches_reference_loop() -> None:
+    model = get_aircraft_model("cessna_172r")
+    rhs = FastRhs(model.params, model.limits)
+    rng = np.random.default_rng(5)
+    x_ref = State(z=-1000.0, u=35.0).as_vector()
+    x_fast = x_ref.copy()
+    u = ControlInputs(throttle=0.55, aileron=0.01, elevator=-0.03, rudder=0.0)
+    w_ned = np.array([3.0, -2.0, 0.5])
+    for k in range(250):
+        w_turb = rng.normal(0.0, 0.8, size=3)
+        rhs.set_controls(u)
+        rhs.set_wind(w_ned, w_turb)
+        x_fast = rk4_step(rhs, 0.02 * k, x_fast, 0.02)
+        x_ref = rk4_step(_reference_rhs(model.params, model.limits, u, w_ned, w_turb), 0.02 * k, x_ref, 0.02)
+    assert np.array_equal(x_fast, x_ref)
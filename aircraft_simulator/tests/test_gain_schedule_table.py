@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.gain_schedule_table import GainScheduleTable, build_gain_schedule_table
+from adcs_core.analysis.lqr_lateral import design_lateral_lqr
+from adcs_core.analysis.lqr_longitudinal import design_longitudinal_lqr
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.control.gain_schedule import GainSchedule
+from adcs_core.dynamics.jacobian import jacobian_full
+
+
+def test_table_nodes_match_pointwise_trim_and_lqr(tmp_path) -> None:
+    model = get_aircraft_model("cessna_172r")
+    table = build_gain_schedule_table(model, [45.0, 60.0], [0.0, 2000.0])
+    assert table.valid.all()
+    assert table.K_lon.shape == (2, 2, 2, 4) and table.K_lat.shape == (2, 2, 2, 4)
+
+    params = replace(model.params, rho_kgm3=float(table.rho_kgm3[1]))
+    trim = compute_level_trim(60.0, params, limits=model.limits)
+    A, B = jacobian_full(trim.x0, trim.u0, params, model.limits)
+    K_lon, K_lat = table.gains(60.0, 2000.0)
+    assert np.allclose(K_lon, design_longitudinal_lqr(A, B).K, rtol=1e-5, atol=1e-8)
+    assert np.allclose(K_lat, design_lateral_lqr(A, B).K, rtol=1e-5, atol=1e-8)
+
+    path = tmp_path / "schedule.npz"
+    table.save(path)
+    loaded = GainScheduleTable.load(path)
+    assert loaded.fingerprint == table.fingerprint
+    assert np.array_equal(loaded.K_lat, table.K_lat)
+
+
+def test_vectorized_lookup_is_bilinear_and_clamped() -> None:
+    rng = np.random.default_rng(3)
+    K_lon = rng.normal(size=(3, 4, 2, 4))
+    table = GainScheduleTable(
+        V_grid=np.array([40.0, 50.0, 60.0, 80.0]),
+        alt_grid=np.array([0.0, 1000.0, 3000.0]),
+        rho_kgm3=np.ones(3),
+        K_lon=K_lon,
+        K_lat=-K_lon,
+        x_trim=np.zeros((3, 4, 12)),
+        u_trim=np.zeros((3, 4, 4)),
+        valid=np.ones((3, 4), dtype=bool),
+        fingerprint="",
+    )
+    V = np.array([45.0, 70.0, 10.0, 90.0])
+    alt = np.array([500.0, 2000.0, -50.0, 5000.0])
+    K, K_neg = table.gains(V, alt)
+    assert K.shape == (4, 2, 4)
+    assert np.array_equal(K_neg, -K)
+
+    expected0 = 0.25 * (K_lon[0, 0] + K_lon[0, 1] + K_lon[1, 0] + K_lon[1, 1])
+    assert np.allclose(K[0], expected0)
+    assert np.allclose(K[2], K_lon[0, 0]) and np.allclose(K[3], K_lon[-1, -1])
+    for i in range(V.size):
+        assert np.allclose(table.gains(V[i], alt[i])[0], K[i])
+
+
+def test_lookup_blends_only_valid_cells() -> None:
+    K_lon = np.arange(4 * 8, dtype=float).reshape(2, 2, 2, 4)
+    valid = np.array([[True, False], [True, True]])
+    K_lon[~valid] = np.nan
+    x_trim = np.ones((2, 2, 12))
+    x_trim[~valid] = np.nan
+    table = GainScheduleTable(
+        V_grid=np.array([40.0, 60.0]),
+        alt_grid=np.array([0.0, 1000.0]),
+        rho_kgm3=np.ones(2),
+        K_lon=K_lon,
+        K_lat=K_lon,
+        x_trim=x_trim,
+        u_trim=np.zeros((2, 2, 4)),
+        valid=valid,
+        fingerprint="",
+    )
+    # At a valid node the NaN neighbour has zero weight and must not leak in.
+    assert np.array_equal(table.gains(40.0, 0.0)[0], K_lon[0, 0])
+    mid, _ = table.gains(np.array([50.0]), np.array([500.0]))
+    assert np.allclose(mid[0], (K_lon[0, 0] + K_lon[1, 0] + K_lon[1, 1]) / 3.0)
+    assert np.allclose(table.gains(50.0, 500.0)[0], mid[0])
+    assert np.allclose(table.trim(55.0, 100.0)[0], 1.0)
+
+    empty = replace(table, valid=np.zeros((2, 2), dtype=bool))
+    assert np.all(np.isnan(empty.gains(50.0, 500.0)[0]))
+    assert np.all(np.isnan(empty.gains(np.array([50.0]), np.array([500.0]))[0]))
+
+
+def test_gain_schedule_interpolation_matches_np_interp_with_repeated_speeds() -> None:
+    speeds = np.array([50.0, 60.0, 60.0])
+    gains = np.arange(3 * 2 * 4, dtype=float).reshape(3, 2, 4) ** 1.5
+    schedule = GainSchedule(speeds_mps=speeds, gains=gains)
+    for V in (45.0, 55.0, 60.0, 75.0):
+        K = schedule.interpolate(V)
+        assert np.all(np.isfinite(K))
+        ref = np.array([[np.interp(V, speeds, gains[:, i, j]) for j in range(4)] for i in range(2)])
+        assert np.allclose(K, ref, rtol=1e-15, atol=0.0)
+
+    with pytest.raises(ValueError, match="ascending"):
+        GainSchedule(speeds_mps=speeds[::-1], gains=gains).interpolate(55.0)
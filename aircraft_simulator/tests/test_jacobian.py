@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.dynamics.jacobian import jacobian_full
+from adcs_core.dynamics.linearize import linearize
+from adcs_core.model import xdot_full
+
+
+def _fd(x, u, model):
+    def f(xx, uu):
+        return xdot_full(xx, ControlInputs(*uu), params=model.params, limits=model.limits)
+
+    return linearize(f, x, u, eps_x=1e-6, eps_u=1e-7)
+
+
+@pytest.mark.parametrize(("aircraft_id", "speed_mps"), [("cessna_172r", 60.0), ("f16_research", 150.0)])
+def test_analytic_jacobian_matches_finite_differences(aircraft_id: str, speed_mps: float) -> None:
+    model = get_aircraft_model(aircraft_id)
+    trim = compute_level_trim(speed_mps, model.params, limits=model.limits)
+    rng = np.random.default_rng(3)
+    scale = np.array([10.0, 10.0, 10.0, 3.0, 3.0, 3.0, 0.2, 0.2, 0.5, 0.3, 0.3, 0.3])
+    points = [
+        (trim.x0, trim.u0),
+        (trim.x0 + scale * rng.standard_normal(12), trim.u0 + np.array([0.05, 0.05, 0.02, 0.05])),
+    ]
+    for x, u in points:
+        A, B = jacobian_full(x, u, model.params, model.limits)
+        A_fd, B_fd = _fd(x, u, model)
+        assert np.allclose(A, A_fd, rtol=1e-6, atol=1e-6 * np.abs(A_fd).max())
+        assert np.allclose(B, B_fd, rtol=1e-6, atol=1e-6 * np.abs(B_fd).max())
+
+
+def test_saturated_controls_have_zero_b_column() -> None:
+    model = get_aircraft_model("cessna_172r")
+    trim = compute_level_trim(60.0, model.params, limits=model.limits)
+    u = np.array(trim.u0, dtype=float)
+    u[2] = 2.0 * model.limits.elevator_max_rad
+    _A, B = jacobian_full(trim.x0, u, model.params, model.limits)
+    assert np.all(B[:, 2] == 0.0)
+    assert np.any(B[:, 0] != 0.0)
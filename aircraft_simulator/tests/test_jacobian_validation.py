@@ -7,6 +7,7 @@ from adcs_core.analysis.jacobian_validation import validate_jacobian
 from adcs_core.analysis.trim import compute_level_trim
 
 
+@pytest.mark.parametrize("method", ["fd", "analytic"])
 @pytest.mark.parametrize(
     ("aircraft_id", "speed_mps"),
     [
@@ -14,7 +15,7 @@ from adcs_core.analysis.trim import compute_level_trim
         ("f16_research", 150.0),
     ],
 )
-def test_jacobian_directional_consistency(aircraft_id: str, speed_mps: float) -> None:
+def test_jacobian_directional_consistency(aircraft_id: str, speed_mps: float, method: str) -> None:
     model = get_aircraft_model(aircraft_id)
     trim = compute_level_trim(speed_mps, model.params, limits=model.limits)
 
@@ -25,6 +26,7 @@ def test_jacobian_directional_consistency(aircraft_id: str, speed_mps: float) ->
         limits=model.limits,
         epsilon=1e-6,
         seed=7,
+        method=method,
     )
 
     assert result.relative_error < 1e-3
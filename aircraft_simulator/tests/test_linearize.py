@@ -1,8 +1,20 @@
 import numpy as np
+import pytest
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
-from adcs_core.control.linearize import linearize, select_subsystem
-from adcs_core.model import xdot_full
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.control.linearize import (
+    color_columns,
+    detect_sparsity,
+    discretize_zoh,
+    jacobian_full,
+    linearize,
+    linearize_batch,
+    select_subsystem,
+    xdot_full_sparsity,
+)
+from adcs_core.model import xdot_full, xdot_full_batch
 from adcs_core.state import State
 
 
@@ -24,3 +36,54 @@ def test_linearize_shapes():
     assert B_sub.shape == (4, 2)
 
 
+def test_discretize_zoh_matches_closed_form():
+    # Double integrator: Ad = [[1, dt], [0, 1]], Bd = [dt^2/2, dt].
+    A = np.array([[0.0, 1.0], [0.0, 0.0]])
+    B = np.array([[0.0], [1.0]])
+    dt = 0.2
+    Ad, Bd = discretize_zoh(A, B, dt)
+    assert np.allclose(Ad, [[1.0, dt], [0.0, 1.0]], atol=1e-14)
+    assert np.allclose(Bd, [[0.5 * dt * dt], [dt]], atol=1e-14)
+
+
+@pytest.mark.parametrize(("scheme", "rtol"), [("central", 1e-8), ("forward", 1e-5), ("complex", 1e-13)])
+def test_linearize_batch_schemes_match_analytic(scheme: str, rtol: float):
+    model = get_aircraft_model("cessna_172r")
+    trim = compute_level_trim(60.0, model.params, limits=model.limits)
+
+    def f_batch(X, U):
+        return xdot_full_batch(X, U, params=model.params, limits=model.limits)
+
+    A, B = linearize_batch(f_batch, trim.x0, trim.u0, scheme=scheme)
+    A_ref, B_ref = jacobian_full(trim.x0, trim.u0, model.params, model.limits)
+    assert np.abs(A - A_ref).max() <= rtol * np.abs(A_ref).max()
+    assert np.abs(B - B_ref).max() <= rtol * np.abs(B_ref).max()
+
+
+def test_column_coloring_groups_never_share_rows():
+    S = xdot_full_sparsity()
+    colors = color_columns(S)
+    assert np.all(colors[:3] == -1)  # position never feeds back
+    for g in range(colors.max() + 1):
+        assert np.all(S[:, colors == g].sum(axis=1) <= 1)
+    assert colors.max() + 1 <= 10
+
+
+def test_sparse_linearize_matches_dense_with_fewer_evaluations():
+    model = get_aircraft_model("f16_research")
+    trim = compute_level_trim(150.0, model.params, limits=model.limits)
+    calls = [0]
+
+    def f(x, uvec):
+        calls[0] += 1
+        return xdot_full(x, ControlInputs(*uvec), params=model.params, limits=model.limits)
+
+    A, B = linearize(f, trim.x0, trim.u0)
+    dense_calls, calls[0] = calls[0], 0
+    A_s, B_s = linearize(f, trim.x0, trim.u0, sparsity=xdot_full_sparsity())
+    assert calls[0] <= 20 < dense_calls
+    assert np.allclose(A_s, A, rtol=1e-9, atol=1e-12)
+    assert np.allclose(B_s, B, rtol=1e-9, atol=1e-12)
+
+    detected = detect_sparsity(lambda z: f(z[:12], z[12:]), np.concatenate((trim.x0, trim.u0)))
+    assert not np.any(detected & ~xdot_full_sparsity())
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.analysis.lqr_lateral import design_lateral_lqr
+from adcs_core.analysis.lqr_longitudinal import design_longitudinal_lqr
+from adcs_core.analysis.lqr_sweep import longitudinal_weight_grid, pareto_mask, sweep_lqr_weights
+from backend_api.workbench import build_analysis_bundle, control_response, control_sweep_response
+
+
+def test_sweep_matches_single_designs() -> None:
+    bundle = build_analysis_bundle({"aircraft_id": "f16_research", "V_mps": 150.0})
+    A, B = bundle["A"], bundle["B"]
+    mults = [0.2, 1.0, 5.0]
+    Q_scale, R_scale = longitudinal_weight_grid(mults, mults, mults)
+    lon = sweep_lqr_weights(A, B, Q_scale, R_scale)
+    assert lon.K.shape == (27, 2, 4) and lon.pareto.any()
+    for i in (0, 13, 26):
+        d = design_longitudinal_lqr(A, B, Q=np.diag(lon.Q_diag[i]), R=np.diag(lon.R_diag[i]))
+        assert np.allclose(lon.K[i], d.K, rtol=1e-8, atol=1e-10)
+        assert np.isclose(lon.spectral_margin[i], -np.max(d.closed_loop_eigenvalues.real))
+
+    lat = sweep_lqr_weights(A, B, np.ones((2, 4)), np.array([1.0, 3.0]), loop="lateral")
+    assert np.allclose(lat.K[1], design_lateral_lqr(A, B, R=3.0 * np.eye(2)).K, rtol=1e-8, atol=1e-10)
+
+
+def test_pareto_mask_and_sweep_response() -> None:
+    costs = np.array([[1.0, 2.0], [2.0, 1.0], [2.0, 2.0], [np.nan, 0.0], [1.0, 2.0]])
+    assert pareto_mask(costs).tolist() == [True, True, False, True, True]
+
+    payload = {"aircraft_id": "cessna_172r", "V_mps": 60.0}
+    out = control_sweep_response({**payload, "q_pitch_mults": [0.5, 1.0, 2.0], "r_effort_mults": [1.0, 4.0]})
+    assert out["points"] == 6 and len(out["control_effort"]) == 6 and out["pareto"]
+    single = control_response({**payload, "q_pitch_mult": 2.0, "r_effort_mult": 4.0})
+    assert np.allclose(out["K"][5], single["lqr"]["K"], rtol=1e-8)
+
+
+def test_sweep_response_ignores_client_limits() -> None:
+    mults = list(np.linspace(0.5, 2.0, 150))
+    payload = {"aircraft_id": "cessna_172r", "V_mps": 60.0, "max_points": 10**9, "max_workers": 64}
+    with pytest.raises(ValueError, match="at most 20000"):
+        control_sweep_response({**payload, "q_speed_mults": mults, "q_pitch_mults": mults, "r_effort_mults": [1.0]})
@@ -4,7 +4,7 @@ import numpy as np
 
 from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.database import get_aircraft_model
-from adcs_core.analysis.modal_analysis import analyze_modal_structure
+from adcs_core.analysis.modal_analysis import analyze_modal_stack, analyze_modal_structure
 from adcs_core.analysis.trim import compute_level_trim
 from adcs_core.control.linearize import linearize
 from adcs_core.model import xdot_full
@@ -45,3 +45,32 @@ def test_modal_metrics_f16_trimmed_case_detects_instability() -> None:
     assert result.spectral_margin < 0.0
     assert result.min_damping_ratio is not None
     assert len(result.modes) > 0
+
+
+def test_modal_stack_matches_single_analysis_and_tracks_modes() -> None:
+    speeds = (50.0, 60.0, 70.0)
+    A_stack = np.stack([_linearize_at_trim("cessna_172r", V) for V in speeds])
+    stack = analyze_modal_stack(A_stack)
+
+    for k in range(len(speeds)):
+        single = analyze_modal_structure(A_stack[k])
+        assert np.isclose(stack.spectral_margin[k], single.spectral_margin)
+        assert np.isclose(stack.min_damping_ratio[k], single.min_damping_ratio)
+        assert stack.unstable_modes[k] == single.unstable_modes
+    for mode in ("short_period", "phugoid", "dutch_roll"):
+        cols = stack.tracks(mode)
+        assert len(cols) == 2 and stack.partner[0, cols[0]] == cols[1]
+        assert np.all(stack.mode_type[:, cols] == mode)
+
+
+def test_modal_stack_follows_eigenvectors_through_a_crossing() -> None:
+    s = np.linspace(0.0, 1.0, 11)
+    A_stack = np.zeros((s.size, 9, 9))
+    A_stack[:, 0, 0] = -0.2 - s  # u root moves left...
+    A_stack[:, 7, 7] = -1.2 + s  # ...while the q root moves right, crossing at s=0.5
+    for i in (1, 2, 3, 4, 5, 6, 8):
+        A_stack[:, i, i] = -3.0 - i
+    stack = analyze_modal_stack(A_stack)
+    j = int(np.argmax(np.abs(stack.eigenvectors[0, 0, :])))
+    assert np.allclose(stack.eigenvalues[:, j].real, -0.2 - s)
+    assert np.all(np.abs(stack.eigenvectors[:, 0, j]) > 0.99)
@@ -87,3 +87,15 @@ def test_f16_unstable_real_mode_growth_rate_matches_linear_sign_and_order() -> N
     assert sigma_linear > 0.0
     assert est.sigma_nonlinear > 0.0
     assert est.sigma_error_percent < 35.0
+
+
+def test_cessna_short_period_modal_fidelity_adaptive_matches_rk4() -> None:
+    model, trim, A_lon, _B = _linearize_at_trim("cessna_172r", 60.0)
+    ev = select_longitudinal_complex_mode(A_lon, preference="short_period")
+    kwargs = dict(params=model.params, limits=model.limits, trim=trim, eigenvalue=ev, K=None, tfinal_s=10.0, dt_s=0.01)
+    fixed = validate_modal_fidelity(**kwargs)
+    adaptive = validate_modal_fidelity(**kwargs, method="dopri45")
+
+    assert adaptive.omega_error_percent < 5.0
+    assert abs(adaptive.nonlinear.omega_d - fixed.nonlinear.omega_d) < 1e-3 * fixed.nonlinear.omega_d
+    assert abs(adaptive.nonlinear.sigma - fixed.nonlinear.sigma) < 1e-2 * abs(fixed.nonlinear.sigma)
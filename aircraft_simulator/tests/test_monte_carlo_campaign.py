@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.control.autopilot import AutopilotTargets
+from adcs_core.control.failure_modes import FailureManager
+from adcs_core.scenarios.monte_carlo import (
+    MonteCarloCampaign,
+    final_targets,
+    history_stats,
+    run_monte_carlo_campaign,
+    trace_metrics,
+)
+from adcs_core.scenarios.scenario_runner import ScenarioEvent
+from adcs_core.seeding import derive_seed
+from adcs_core.simulator import apply_scenario_event
+
+
+def test_campaign_is_reproducible_for_any_worker_count_and_chunking() -> None:
+    campaign = MonteCarloCampaign(
+        tfinal=2.0,
+        initial_airspeed_sigma_mps=1.0,
+        events=(ScenarioEvent(1.0, "actuator_failure", {"elevator_stuck_rad": 0.02}),),
+    )
+    serial = run_monte_carlo_campaign(campaign, 5, seed=11)
+    chunked = run_monte_carlo_campaign(campaign, 5, seed=11, chunk_size=2)
+    pooled = run_monte_carlo_campaign(campaign, 5, seed=11, max_workers=2, chunk_size=1)
+    for name, values in serial.metrics.items():
+        assert values.shape == (5,)
+        assert np.array_equal(values, chunked.metrics[name], equal_nan=True)
+        assert np.array_equal(values, pooled.metrics[name], equal_nan=True)
+    assert np.unique(serial.metrics["wind_n_mps"]).size == 5
+    other = run_monte_carlo_campaign(campaign, 5, seed=12)
+    assert not np.array_equal(other.metrics["wind_n_mps"], serial.metrics["wind_n_mps"])
+    assert len(serial.as_records()) == 5 and "alt_err_rms_m" in serial.summary()
+
+
+def test_scenario_events_map_to_failures_and_targets() -> None:
+    failures = FailureManager()
+    base = AutopilotTargets(airspeed_mps=40.0, altitude_m=1000.0, heading_rad=0.5)
+    assert apply_scenario_event(ScenarioEvent(0.0, "sensor_dropout", {"signal": "altitude_m"}), failures, base) is base
+    apply_scenario_event(ScenarioEvent(0.0, "actuator_failure", {"throttle_scale": 0.5}), failures, base)
+    targets = apply_scenario_event(ScenarioEvent(0.0, "targets", {"altitude_m": 1100.0}), failures, base)
+    assert failures.sens.dropout["altitude_m"] and failures.act.throttle_scale == 0.5
+    assert targets == AutopilotTargets(airspeed_mps=40.0, altitude_m=1100.0, heading_rad=0.5)
+
+    # Out-of-order events are replayed by time; events after the run never take effect.
+    events = [
+        ScenarioEvent(30.0, "targets", {"altitude_m": 900.0}),
+        ScenarioEvent(5.0, "targets", {"heading_rad": 1.0}),
+        ScenarioEvent(2.0, "targets", {"heading_rad": 0.2, "airspeed_mps": 38.0}),
+    ]
+    assert final_targets(base, events, 20.0) == AutopilotTargets(airspeed_mps=38.0, altitude_m=1000.0, heading_rad=1.0)
+
+
+_calls: list[int] = []
+
+
+def _flaky_metrics(trace, targets):
+    _calls.append(1)
+    if len(_calls) == 4:
+        raise RuntimeError("simulated crash")
+    return trace_metrics(trace, targets)
+
+
+def test_interrupted_campaign_resumes_from_checkpoint(tmp_path) -> None:
+    campaign = MonteCarloCampaign(tfinal=1.0)
+    path = tmp_path / "campaign.ckpt"
+    reference = run_monte_carlo_campaign(campaign, 6, seed=3, chunk_size=2, stats=history_stats(campaign))
+
+    kwargs = dict(seed=3, metric_fn=_flaky_metrics, stats=history_stats(campaign), checkpoint_path=path, checkpoint_every=1)
+    with pytest.raises(RuntimeError, match="simulated crash"):
+        run_monte_carlo_campaign(campaign, 6, chunk_size=2, **kwargs)
+    resumed = run_monte_carlo_campaign(campaign, 6, **kwargs)
+    assert len(_calls) == 4 + 4
+    for name, values in reference.metrics.items():
+        assert np.array_equal(values, resumed.metrics[name], equal_nan=True)
+    assert resumed.stats is not None and reference.stats is not None and resumed.stats.runs == 6
+    assert np.array_equal(resumed.stats["alt_err_m"].m2, reference.stats["alt_err_m"].m2)
+    assert np.array_equal(resumed.stats["theta_rad"].sketch.counts, reference.stats["theta_rad"].sketch.counts)
+
+    with pytest.raises(ValueError):
+        run_monte_carlo_campaign(campaign, 6, **{**kwargs, "seed": 4})
+
+
+def test_spawned_run_seeds_give_independent_sub_streams() -> None:
+    assert derive_seed(5, 1) == 6 and derive_seed(None, 3) is None
+    runs = np.random.SeedSequence(0).spawn(2)
+    children = [derive_seed(seq, k) for seq in runs for k in (1, 2, 3, 4, 10, 11, 12)]
+    states = {tuple(child.generate_state(4)) for child in children}
+    assert len(states) == len(children) and runs[0].n_children_spawned == 0
+    first = np.random.default_rng(derive_seed(runs[0], 1)).standard_normal(3)
+    assert np.array_equal(first, np.random.default_rng(derive_seed(runs[0], 1)).standard_normal(3))
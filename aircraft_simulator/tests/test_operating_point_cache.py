@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.operating_point_cache import OperatingPointCache, solve_operating_point
+from adcs_core.analysis.result_store import ResultStore
+from backend_api.workbench import build_analysis_bundle
+
+
+def test_cache_hits_match_direct_solve_and_are_read_only() -> None:
+    model = get_aircraft_model("cessna_172r")
+    cache = OperatingPointCache(maxsize=4)
+
+    op = cache.get(model.params, model.limits, 60.0)
+    again = cache.get(model.params, model.limits, 60.0)
+    assert again is op
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    direct = solve_operating_point(model.params, model.limits, 60.0)
+    assert np.array_equal(op.A, direct.A)
+    assert np.array_equal(op.trim.x0, direct.trim.x0)
+    with pytest.raises(ValueError):
+        op.A[0, 0] = 1.0
+
+    cache.get(model.params, model.limits, 60.0, method="analytic")
+    assert cache.stats()["misses"] == 2
+
+
+def test_restarted_cache_reloads_from_result_store(tmp_path) -> None:
+    model = get_aircraft_model("cessna_172r")
+    cache = OperatingPointCache(maxsize=1, store=ResultStore(tmp_path))
+
+    first = cache.get(model.params, model.limits, 55.0)
+    cache.get(model.params, model.limits, 65.0)
+    assert cache.stats()["evictions"] == 1
+
+    reloaded = cache.get(model.params, model.limits, 55.0)
+    stats = cache.stats()
+    assert stats["disk_hits"] == 1 and stats["misses"] == 2
+    assert np.array_equal(reloaded.A, first.A)
+    assert not reloaded.A.flags.writeable
+
+    # A fresh process-level cache over the same directory solves nothing.
+    restarted = OperatingPointCache(store=ResultStore(tmp_path))
+    again = restarted.get(model.params, model.limits, 65.0)
+    assert restarted.stats()["misses"] == 0 and restarted.stats()["disk_hits"] == 1
+    assert np.array_equal(again.trim.x0, cache.get(model.params, model.limits, 65.0).trim.x0)
+
+
+def test_analysis_bundle_reuses_cached_operating_point() -> None:
+    cache = OperatingPointCache()
+    payload = {"aircraft_id": "f16_research", "V_mps": 150.0, "altitude_m": 3000.0}
+    b1 = build_analysis_bundle(payload, cache=cache)
+    b2 = build_analysis_bundle({**payload, "headwind_mps": 5.0}, cache=cache)
+    assert b2["A"] is b1["A"]
+    assert cache.stats()["hits"] == 1
+
+    build_analysis_bundle({**payload, "altitude_m": 4000.0}, cache=cache)
+    assert cache.stats()["misses"] == 2
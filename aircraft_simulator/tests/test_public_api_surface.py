@@ -37,5 +37,50 @@ def test_public_api_surface_is_frozen() -> None:
         "rotation_body_to_inertial",
         "xdot_full",
         "WindModel",
+        "LateralLqrDesign",
+        "compute_lqr_lateral",
+        "design_lateral_lqr",
+        "extract_lateral_subsystem",
+        "analyze_modal_stack",
+        "build_gain_schedule_table",
+        "compute_trim_envelope",
+        "default_operating_point_cache",
+        "Dispersion",
+        "DrydenTurbulence",
+        "DrydenTurbulenceBank",
+        "EnsembleSimulator",
+        "EnsembleTrace",
+        "FastRhs",
+        "GainScheduleTable",
+        "history_stats",
+        "jacobian_full",
+        "longitudinal_weight_grid",
+        "LqrSweepResult",
+        "ModalStackResult",
+        "MonteCarloCampaign",
+        "MonteCarloResult",
+        "OperatingPoint",
+        "OperatingPointCache",
+        "parameters_fingerprint",
+        "pareto_mask",
+        "QuantileSketch",
+        "result_key",
+        "RESULT_STORE_VERSION",
+        "ResultStore",
+        "RiccatiSession",
+        "rk4_step_inplace",
+        "Rk4Workspace",
+        "run_dispersion_campaign",
+        "run_monte_carlo_campaign",
+        "SignalStats",
+        "simulate",
+        "stack_parameters",
+        "StackedParameters",
+        "StateFeedback",
+        "StoppingRule",
+        "StreamingStats",
+        "sweep_lqr_weights",
+        "TrimEnvelope",
+        "xdot_full_sparsity",
     }
     assert set(api.__all__) == expected
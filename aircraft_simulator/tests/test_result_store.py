@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import stat
+from dataclasses import replace
+
+import numpy as np
+
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis import result_store
+from adcs_core.analysis.result_store import ResultStore, result_key
+
+
+def test_result_key_is_deterministic_and_content_sensitive() -> None:
+    model = get_aircraft_model("cessna_172r")
+    Q = np.diag([1.0, 10.0, 100.0, 50.0])
+    key = result_key("lqr", model.params, model.limits, 60.0, Q)
+
+    assert key == result_key("lqr", replace(model.params), replace(model.limits), 60.0, Q.copy())
+    assert key != result_key("lqr", model.params, model.limits, 60.0 + 1e-12, Q)
+    assert key != result_key("lqr", replace(model.params, mass_kg=model.params.mass_kg + 1.0), model.limits, 60.0, Q)
+    assert key != result_key("lqr", model.params, replace(model.limits, elevator_max_rad=0.3), 60.0, Q)
+    assert key != result_key("trim", model.params, model.limits, 60.0, Q)
+
+
+def test_result_key_changes_with_code_revision(monkeypatch) -> None:
+    key = result_key("trim", 60.0)
+    monkeypatch.setattr(result_store, "code_revision", lambda: "edited-solver")
+    assert result_key("trim", 60.0) != key
+
+
+def test_backend_store_is_off_in_tests() -> None:
+    from backend_api import app as backend_app
+
+    assert backend_app._result_store is None
+
+
+def test_store_persists_versions_and_evicts_least_recent(tmp_path) -> None:
+    store = ResultStore(tmp_path)
+    calls = []
+    value = store.get_or_compute("ab" * 32, lambda: calls.append(1) or np.arange(3.0))
+    again = ResultStore(tmp_path).get_or_compute("ab" * 32, lambda: calls.append(1) or None)
+    assert len(calls) == 1
+    assert np.array_equal(again, value)
+
+    assert ResultStore(tmp_path, version=99).get("ab" * 32) is None
+
+    small = ResultStore(tmp_path / "small", max_bytes=3000)
+    for i in range(5):
+        small.put(f"{i:02d}" * 32, np.zeros(100))
+    stats = small.stats()
+    assert stats["bytes"] <= 3000 and stats["evictions"] > 0
+    assert f"{4:02d}" * 32 in small and f"{0:02d}" * 32 not in small
+
+
+def test_store_ignores_entries_it_does_not_trust(tmp_path) -> None:
+    store = ResultStore(tmp_path / "store")
+    key = result_key("trim", 1.0)
+    store.put(key, {"x": 1})
+    path = store._path(key)
+    assert store.get(key) == {"x": 1}
+    if not hasattr(os, "getuid"):
+        return
+    assert stat.S_IMODE(store.root.stat().st_mode) & 0o077 == 0
+    assert stat.S_IMODE(path.stat().st_mode) & 0o077 == 0
+
+    path.chmod(0o666)
+    assert store.get(key, "miss") == "miss"
+
+    path.chmod(0o600)
+    link_key = result_key("trim", 2.0)
+    link = store._path(link_key)
+    link.parent.mkdir(parents=True, exist_ok=True)
+    link.symlink_to(path)
+    assert store.get(link_key, "miss") == "miss"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+from scipy import linalg
+
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.lqr_longitudinal import design_longitudinal_lqr, extract_longitudinal_subsystem
+from adcs_core.analysis.operating_point_cache import solve_operating_point
+from adcs_core.analysis.riccati import RiccatiSession, solve_care
+from backend_api.workbench import build_analysis_bundle, control_response
+
+
+def _plant() -> tuple[np.ndarray, np.ndarray]:
+    model = get_aircraft_model("f16_research")
+    op = solve_operating_point(model.params, model.limits, 150.0, aircraft_category=model.stability_mode)
+    return extract_longitudinal_subsystem(op.A, op.B)
+
+
+def test_warm_started_session_tracks_schur_solution() -> None:
+    A, B = _plant()
+    session = RiccatiSession(A, B)
+    for m in (1.0, 1.2, 1.5, 2.0, 0.7):
+        Q = np.diag([1.0, 10.0 * m, 100.0 * m, 50.0 * m])
+        R = np.diag([1.0, 0.5]) / m
+        sol = session.solve(Q, R)
+        P = linalg.solve_continuous_are(A, B, Q, R)
+        assert np.allclose(sol.P, P, rtol=1e-8, atol=1e-10)
+        assert np.allclose(sol.K, np.linalg.solve(R, B.T @ P), rtol=1e-8, atol=1e-10)
+        if m != 1.0:
+            assert sol.method == "newton-kleinman" and sol.iterations <= 8
+
+
+def test_non_stabilizing_warm_start_falls_back_to_schur() -> None:
+    A, B = _plant()
+    Q, R = np.eye(4), np.eye(2)
+    sol = solve_care(A, B, Q, R, P0=np.zeros((4, 4)))
+    assert sol.method == "schur"
+    assert np.allclose(sol.P, linalg.solve_continuous_are(A, B, Q, R))
+
+
+def test_control_response_matches_direct_design() -> None:
+    payload = {"aircraft_id": "cessna_172r", "V_mps": 60.0, "q_pitch_mult": 3.0, "r_effort_mult": 0.5}
+    control_response({**payload, "q_pitch_mult": 1.0})
+    out = control_response(payload)
+    Q = np.asarray(out["weights"]["Q"])
+    R = np.asarray(out["weights"]["R"])
+
+    bundle = build_analysis_bundle(payload)
+    design = design_longitudinal_lqr(bundle["A"], bundle["B"], Q=Q, R=R)
+    assert out["lqr"]["riccati_method"] == "newton-kleinman"
+    assert np.allclose(out["lqr"]["K"], design.K, rtol=1e-8, atol=1e-10)
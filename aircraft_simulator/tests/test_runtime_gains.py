@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from backend_api.app import SimRuntime
+
+
+def _trim_speed(rt: SimRuntime) -> float:
+    return float(np.hypot(rt.trim_x0[3], rt.trim_x0[5]))
+
+
+def test_target_change_swaps_gains_from_worker_and_cancels_superseded() -> None:
+    rt = SimRuntime()
+    K_before = rt.K_lon.copy()
+
+    # Hold the worker so both requests queue behind it deterministically.
+    gate = threading.Event()
+    rt._gain_executor.submit(gate.wait)
+    rt.set_targets(V=45.0)
+    first = rt._gain_future
+    rt.set_targets(V=50.0)
+    last = rt._gain_future
+
+    rt.step()  # flies on the old gains while the solve is pending
+    assert rt.gains_pending and np.array_equal(rt.K_lon, K_before)
+    gate.set()
+
+    assert last.result(timeout=60)["success"]
+    assert first.cancelled()
+    assert abs(_trim_speed(rt) - 50.0) < 1e-9
+    assert not np.array_equal(rt.K_lon, K_before)
+
+
+def test_running_solve_discards_result_when_superseded() -> None:
+    rt = SimRuntime()
+    with rt.lock:
+        stale = rt._gain_inputs(rt.category)
+        generation = rt._gain_generation
+    rt.set_targets(V=45.0)
+    rt._gain_future.result(timeout=60)
+
+    result = rt._background_gains(generation, stale)
+    assert result["superseded"]
+    assert abs(_trim_speed(rt) - 45.0) < 1e-9
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from adcs_core.aircraft.aerodynamics import ControlInputs
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.lqr_longitudinal import (
+    LONGITUDINAL_INPUT_IDX_FULL,
+    LONGITUDINAL_STATE_IDX_FULL,
+    design_longitudinal_lqr,
+)
+from adcs_core.analysis.simulation import StateFeedback, simulate
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.control.linearize import linearize
+from adcs_core.dynamics.integrator import rk4_step
+from adcs_core.model import xdot_full
+
+
+@pytest.fixture(scope="module")
+def f16_design():
+    model = get_aircraft_model("f16_research")
+    trim = compute_level_trim(150.0, model.params, limits=model.limits)
+
+    def f(x, u_vec):
+        ctrl = ControlInputs(throttle=u_vec[0], aileron=u_vec[1], elevator=u_vec[2], rudder=u_vec[3])
+        return xdot_full(x, ctrl, params=model.params, limits=model.limits)
+
+    A, B = linearize(f, trim.x0, trim.u0)
+    return model, trim, design_longitudinal_lqr(A, B)
+
+
+def _feedback(model, trim, K):
+    return StateFeedback(
+        x_ref=trim.x0,
+        u_ref=trim.u0,
+        K=K,
+        state_idx=LONGITUDINAL_STATE_IDX_FULL,
+        input_idx=LONGITUDINAL_INPUT_IDX_FULL,
+        limits=model.limits,
+    )
+
+
+def test_simulate_matches_hand_rolled_closed_loop_rk4(f16_design) -> None:
+    model, trim, design = f16_design
+    K = np.asarray(design.K, dtype=float)
+    x0 = np.asarray(trim.x0, dtype=float).copy()
+    x0[5] += 1.0
+
+    def f_dyn(_t, xx):
+        du = -K @ (xx[LONGITUDINAL_STATE_IDX_FULL] - trim.x0[LONGITUDINAL_STATE_IDX_FULL])
+        de = float(np.clip(trim.u0[2] + du[0], -model.limits.elevator_max_rad, model.limits.elevator_max_rad))
+        thr = float(np.clip(trim.u0[0] + du[1], 0.0, 1.0))
+        return xdot_full(xx, ControlInputs(throttle=thr, elevator=de), params=model.params, limits=model.limits)
+
+    x = x0.copy()
+    for k in range(100):
+        x = rk4_step(f_dyn, 0.01 * k, x, 0.01)
+
+    sim = simulate(x0, _feedback(model, trim, K), 0.01, 100, params=model.params, limits=model.limits, record=("state", "q", "controls"))
+    assert sim["state"].shape == (101, 12)
+    assert sim["controls"].shape == (101, 4)
+    assert np.allclose(sim["state"][-1], x, rtol=1e-10, atol=1e-10)
+    assert np.array_equal(sim["q"], sim["state"][:, 10])
+
+
+def test_batched_initial_conditions_and_controllers_match_individual_runs(f16_design) -> None:
+    model, trim, design = f16_design
+    K = np.asarray(design.K, dtype=float)
+    rng = np.random.default_rng(4)
+    X0 = np.tile(trim.x0, (3, 1))
+    X0[:, 5] += rng.normal(0.0, 1.0, size=3)
+    K_stack = np.stack([K, 0.5 * K, np.zeros_like(K)])
+
+    batch = simulate(X0, _feedback(model, trim, K_stack), 0.01, 80, params=model.params, limits=model.limits, record=("alpha",))
+    assert batch["alpha"].shape == (81, 3)
+    for i in range(3):
+        single = simulate(X0[i], _feedback(model, trim, K_stack[i]), 0.01, 80, params=model.params, limits=model.limits, record=("alpha",))
+        assert np.allclose(batch["alpha"][:, i], single["alpha"], rtol=1e-12, atol=1e-14)
+
+
+def test_adaptive_method_samples_same_grid(f16_design) -> None:
+    model, trim, design = f16_design
+    x0 = np.asarray(trim.x0, dtype=float).copy()
+    x0[5] += 0.5
+    fb = _feedback(model, trim, np.asarray(design.K, dtype=float))
+    fixed = simulate(x0, fb, 0.01, 200, params=model.params, limits=model.limits, record=("theta",))
+    adaptive = simulate(x0, fb, 0.01, 200, params=model.params, limits=model.limits, record=("theta",), method="dopri45")
+    fine = simulate(x0, fb, 0.001, 2000, params=model.params, limits=model.limits, record=("theta",))
+    assert np.array_equal(fixed.t, adaptive.t)
+    # Elevator saturates early on, so the error-controlled run beats fixed-step RK4 at dt.
+    err_fixed = np.max(np.abs(fixed["theta"] - fine["theta"][::10]))
+    err_adaptive = np.max(np.abs(adaptive["theta"] - fine["theta"][::10]))
+    assert err_adaptive < 1e-7 < err_fixed
+
+    with pytest.raises(ValueError, match="record channel"):
+        simulate(x0, fb, 0.01, 2, params=model.params, limits=model.limits, record=("nope",))
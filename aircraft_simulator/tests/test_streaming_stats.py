@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+
+from adcs_core.analysis.streaming_stats import SignalStats, StreamingStats
+from adcs_core.scenarios.monte_carlo import MonteCarloCampaign, history_stats, run_monte_carlo_campaign
+
+
+def test_merged_partials_match_full_sample_statistics() -> None:
+    rng = np.random.default_rng(3)
+    data = rng.normal(2.0, 1.5, size=(4000, 3))
+    data[5, 1] = np.nan
+    parts = [SignalStats(3, thresholds=(3.0,), relative_accuracy=0.01) for _ in range(3)]
+    for i, row in enumerate(data[:1000]):
+        parts[i % 2].update(row)
+    parts[2].update(data[1000:])
+    total = parts[0].empty_like()
+    for part in parts:
+        total.merge(part)
+
+    assert total.count.tolist() == [4000, 3999, 4000]
+    assert np.allclose(total.mean, np.nanmean(data, axis=0), rtol=0.0, atol=1e-12)
+    assert np.allclose(total.variance(), np.nanvar(data, axis=0, ddof=1), rtol=1e-12)
+    assert np.array_equal(total.max, np.nanmax(data, axis=0))
+    assert np.array_equal(total.exceed[0], np.sum(data > 3.0, axis=0))
+    sketch = total.sketch.quantile([0.05, 0.5, 0.95])
+    exact = np.nanquantile(data, [0.05, 0.5, 0.95], axis=0, method="lower")
+    assert np.all(np.abs(sketch - exact) <= 0.0101 * np.abs(exact))
+
+
+def test_campaign_history_stats_are_independent_of_chunking() -> None:
+    campaign = MonteCarloCampaign(tfinal=1.0)
+    template = history_stats(campaign, thresholds={"phi_rad": (0.01,)})
+    serial = run_monte_carlo_campaign(campaign, 4, seed=5, stats=template)
+    pooled = run_monte_carlo_campaign(campaign, 4, seed=5, stats=template, max_workers=2, chunk_size=1)
+    assert serial.stats is not None and pooled.stats is not None and template.runs == 0
+    assert serial.stats.runs == 4 and serial.stats["theta_rad"].count.shape == (51,)
+    for name in ("alt_err_m", "phi_rad"):
+        a, b = serial.stats[name], pooled.stats[name]
+        assert np.allclose(a.mean, b.mean, rtol=0.0, atol=1e-12)
+        assert np.array_equal(a.sketch.counts, b.sketch.counts)
+    layout = template.layout()
+    rebuilt = StreamingStats.from_layout(layout)
+    assert len(pickle.dumps(layout)) < 2000 < len(pickle.dumps(template))
+    assert rebuilt.layout() == layout and rebuilt["phi_rad"].thresholds.tolist() == [0.01]
+    summary = serial.stats.as_dict()
+    assert set(summary["signals"]["phi_rad"]["quantiles"]) == {"p5", "p50", "p95"}
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+
+from adcs_core.aircraft.database import get_aircraft_model
+from adcs_core.analysis.trim import compute_level_trim
+from adcs_core.analysis.trim_envelope import compute_trim_envelope
+
+
+def test_warm_started_envelope_matches_cold_point_solves() -> None:
+    model = get_aircraft_model("cessna_172r")
+    V = np.array([45.0, 55.0, 65.0])
+    alt = np.array([0.0, 1500.0])
+    env = compute_trim_envelope(model, V, alt)
+
+    assert env.alpha.shape == (2, 3)
+    assert env.converged.all()
+    assert env.rho_kgm3[1] < env.rho_kgm3[0]
+    for i, rho in enumerate(env.rho_kgm3):
+        params = replace(model.params, rho_kgm3=float(rho))
+        for j, v in enumerate(V):
+            cold = compute_level_trim(float(v), params, limits=model.limits, aircraft_category=model.stability_mode)
+            assert np.isclose(env.alpha[i, j], cold.alpha, atol=1e-6)
+            assert np.isclose(env.elevator[i, j], cold.elevator, atol=1e-6)
+            assert np.isclose(env.throttle[i, j], cold.throttle, atol=1e-6)
+
+
+def test_parallel_envelope_matches_serial() -> None:
+    model = get_aircraft_model("cessna_172r")
+    V = np.array([45.0, 60.0])
+    alt = np.array([0.0, 1000.0, 2000.0])
+    serial = compute_trim_envelope(model, V, alt)
+    parallel = compute_trim_envelope(model, V, alt, max_workers=2)
+    assert np.array_equal(serial.alpha, parallel.alpha)
+    assert np.array_equal(serial.nfev, parallel.nfev)
+
+
+def test_failed_solves_still_count_evaluations() -> None:
+    model = get_aircraft_model("cessna_172r")
+    failed = compute_level_trim(60.0, model.params, limits=model.limits, residual_tol=0.0, raise_on_failure=False)
+    assert not failed.success and failed.nfev > 0
+
+    env = compute_trim_envelope(model, np.array([50.0, 60.0]), np.array([0.0]), residual_tol=0.0)
+    assert not env.converged.any()
+    assert np.all(np.isnan(env.alpha))
+    assert env.nfev[0, 1] == failed.nfev
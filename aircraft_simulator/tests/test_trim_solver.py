@@ -45,3 +45,23 @@ def test_trim_state_is_dynamic_equilibrium(aircraft_id: str, speed_mps: float) -
     xdot = xdot_full(trim.x0, controls, params=model.params, limits=model.limits)
     dyn_residual = np.linalg.norm(xdot[3:12])
     assert dyn_residual < 1e-6
+
+
+@pytest.mark.parametrize(
+    ("aircraft_id", "speed_mps"),
+    [
+        ("cessna_172r", 60.0),
+        ("f16_research", 150.0),
+    ],
+)
+def test_analytic_trim_jacobian_matches_finite_differences(aircraft_id: str, speed_mps: float) -> None:
+    model = get_aircraft_model(aircraft_id)
+    exact = compute_level_trim(speed_mps, model.params, limits=model.limits)
+    fd = compute_level_trim(speed_mps, model.params, limits=model.limits, jac="2-point")
+
+    assert np.allclose(exact.x0, fd.x0, rtol=0.0, atol=1e-9)
+    assert np.allclose(exact.u0, fd.u0, rtol=0.0, atol=1e-9)
+    # A 2-point Jacobian costs one residual evaluation per unknown (4); charging each
+    # analytic jacobian_full call the same, the exact solve needs no more work.
+    assert exact.njev > 0 and fd.njev == 0
+    assert exact.nfev + 4 * exact.njev <= fd.nfev
@@ -117,6 +117,13 @@ def test_step_response_endpoint_is_deterministic():
     assert first["traces"]["closed_loop"]["airspeed_mps"] == second["traces"]["closed_loop"]["airspeed_mps"]
 
 
+def test_modal_sweep_endpoint_caps_grid_size():
+    payload = {"aircraft_id": "cessna_172r", "V_grid": [60.0] * 201}
+    response = client.post("/api/v1/analysis/modal-sweep", json=payload)
+    assert response.status_code == 200
+    assert "at most 200" in response.json()["error"]
+
+
 def test_estimation_endpoint_returns_consistency_series():
     response = client.post("/api/v1/estimation/run", json={"aircraft_id": "cessna_172r", "V_mps": 60.0, "duration_s": 3.0})
     payload = response.json()
@@ -4,10 +4,12 @@ import asyncio
 import json
 import os
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
 from typing import Any, Dict, Optional
 from pathlib import Path
 import traceback
+from dataclasses import replace
 
 import numpy as np
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
@@ -26,23 +28,26 @@ from adcs_core.api import (
     Compass,
     ControlInputs,
     FailureManager,
+    FastRhs,
+    GainScheduleTable,
     IMU,
     State,
     WindModel,
     analyze_modal_structure,
-    compute_level_trim,
+    build_gain_schedule_table,
     compute_lqr_lateral,
     compute_lqr_longitudinal,
+    default_operating_point_cache,
     design_lateral_lqr,
     design_longitudinal_lqr,
-    derivatives_6dof,
-    forces_and_moments_body,
     get_aircraft_model,
-    linearize,
+    parameters_fingerprint,
     post_step_sanitize,
-    rk4_step,
+    ResultStore,
+    Rk4Workspace,
+    result_key,
+    rk4_step_inplace,
     rotation_body_to_inertial,
-    xdot_full,
 )
 from adcs_core.analysis.lqr_longitudinal import LONGITUDINAL_STATE_IDX_FULL, LONGITUDINAL_INPUT_IDX_FULL
 from adcs_core.analysis.lqr_lateral import LATERAL_STATE_IDX_FULL, LATERAL_INPUT_IDX_FULL
@@ -51,10 +56,12 @@ from adcs_core.environment.dryden import DrydenTurbulence
 from backend_api.workbench import (
     build_analysis_bundle,
     control_response,
+    control_sweep_response,
     custom_aircraft_response,
     estimation_response,
     frequency_response,
     linearization_response,
+    modal_sweep_response,
     mode_shapes_response,
     resolve_model_from_payload,
     serialize_model,
@@ -79,6 +86,17 @@ _default_origins = [
 _origins_env = os.getenv("ALLOWED_ORIGINS", "").strip()
 _allowed_origins = [o.strip() for o in _origins_env.split(",") if o.strip()] if _origins_env else _default_origins
 
+# Solved trims, linearizations and gains persist across restarts only when RESULT_STORE_DIR
+# names a directory (unset or "off": no on-disk store).
+_store_dir_env = os.getenv("RESULT_STORE_DIR", "").strip()
+_result_store: ResultStore | None = None
+if _store_dir_env and _store_dir_env.lower() != "off":
+    _result_store = ResultStore(
+        _store_dir_env,
+        max_bytes=int(float(os.getenv("RESULT_STORE_MAX_MB", "256")) * 1024 * 1024),
+    )
+default_operating_point_cache().store = _result_store
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_allowed_origins,
@@ -109,6 +127,9 @@ class SimRuntime:
         self.selected_aircraft_id = "cessna_172r"
         self.params = AircraftParameters()
         self.limits = ActuatorLimits()
+        self.rhs = FastRhs(self.params, self.limits)
+        self.rk4_work = Rk4Workspace.for_shape(12)
+        self.x_buf = np.empty(12, dtype=float)
 
         self.state = State(x=0.0, y=0.0, z=-1000.0, u=35.0, v=0.0, w=0.0)
         self.t = 0.0
@@ -127,8 +148,13 @@ class SimRuntime:
         self.Q_lat = np.diag([1.0, 10.0, 10.0, 50.0])
         self.R_lat = np.diag([1.0, 1.0])  # [aileron, rudder]
 
+        # "fd" (central differences), "batch" (stacked FD) or "analytic" (jacobian_full)
+        self.jacobian_method = "fd"
+
         self.K_lon = np.zeros((2, 4))
         self.K_lat = np.zeros((2, 4))
+        # Optional (V, altitude) gain schedule; when set, K_lon/K_lat are looked up each step.
+        self.gain_schedule: GainScheduleTable | None = None
         self.trim_x0 = self.state.as_vector()
         self.trim_u0 = np.array([0.5, 0.0, 0.0, 0.0]) # throttle, aileron, elevator, rudder
 
@@ -148,54 +174,84 @@ class SimRuntime:
 
         self.last_packet: Dict[str, Any] = {}
         self.category = "stable"
-        
+
+        # Background gain recomputation (single worker, latest request wins)
+        self._gain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gain-solver")
+        self._gain_future: Future | None = None
+        self._gain_generation = 0
+
         # Initial trim and gain calculation
         self.recompute_gains(category=self.category)
 
-    def recompute_gains(self, category: str = "stable") -> Dict[str, Any]:
+    def _gain_inputs(self, category: str) -> tuple:
         """
-        Computes the LQR gains based on current aircraft and targets.
+        Snapshot of everything a gain solve reads, taken while the caller holds the lock.
         """
-        try:
-            # 1. Trim for current target airspeed
-            trim = compute_level_trim(
-                self.targets.airspeed_mps, 
-                self.params, 
-                limits=self.limits,
-                aircraft_category=category
-            )
-            self.trim_x0 = trim.x0
-            self.trim_u0 = trim.u0
-
-            # 2. Linearize
-            def f_sim(x, u_vec):
-                ctrl = ControlInputs(throttle=u_vec[0], aileron=u_vec[1], elevator=u_vec[2], rudder=u_vec[3])
-                return xdot_full(x, ctrl, params=self.params, limits=self.limits)
-            
-            A, B = linearize(f_sim, trim.x0, trim.u0)
+        weights = (self.Q_lon.copy(), self.R_lon.copy(), self.Q_lat.copy(), self.R_lat.copy())
+        return self.params, self.limits, float(self.targets.airspeed_mps), category, self.jacobian_method, weights
 
-            # 3. Design LQR
-            design_lon = design_longitudinal_lqr(A, B, Q=self.Q_lon, R=self.R_lon)
-            design_lat = design_lateral_lqr(A, B, Q=self.Q_lat, R=self.R_lat)
+    def _apply_gains(self, solved: tuple[Any, np.ndarray, np.ndarray]) -> Dict[str, Any]:
+        trim, self.K_lon, self.K_lat = solved
+        self.trim_x0 = trim.x0
+        self.trim_u0 = trim.u0
+        return {
+            "success": True,
+            "error": None,
+            "trim": {
+                "alpha_rad": float(trim.alpha),
+                "theta_rad": float(trim.theta),
+                "throttle": float(trim.throttle),
+                "elevator_rad": float(trim.elevator),
+            },
+        }
 
-            self.K_lon = design_lon.K
-            self.K_lat = design_lat.K
-            
-            return {
-                "success": True, 
-                "error": None,
-                "trim": {
-                    "alpha_rad": float(trim.alpha),
-                    "theta_rad": float(trim.theta),
-                    "throttle": float(trim.throttle),
-                    "elevator_rad": float(trim.elevator),
-                }
-            }
+    def recompute_gains(self, category: str = "stable") -> Dict[str, Any]:
+        """
+        Computes the LQR gains based on current aircraft and targets (blocking).
+        Supersedes any background request still in flight.
+        """
+        self._gain_generation += 1
+        try:
+            return self._apply_gains(_solve_gains(*self._gain_inputs(category)))
         except Exception as e:
             err_msg = f"Error computing LQR gains: {e}\n{traceback.format_exc()}"
             print(err_msg)
             return {"success": False, "error": str(e)}
 
+    def request_gains(self, category: str | None = None) -> Future:
+        """
+        Queue a gain recompute on the worker thread and return immediately; step() keeps
+        flying on the current gains until the result is swapped in under the lock.
+        Each request bumps a generation counter: a queued request is cancelled outright
+        and a running one discards its result if a newer request arrived meanwhile.
+        Call with self.lock held.
+        """
+        self._gain_generation += 1
+        generation = self._gain_generation
+        inputs = self._gain_inputs(self.category if category is None else category)
+        if self._gain_future is not None:
+            self._gain_future.cancel()
+        self._gain_future = self._gain_executor.submit(self._background_gains, generation, inputs)
+        return self._gain_future
+
+    def _background_gains(self, generation: int, inputs: tuple) -> Dict[str, Any]:
+        superseded = {"success": False, "error": "superseded", "superseded": True}
+        if generation != self._gain_generation:
+            return superseded
+        try:
+            solved = _solve_gains(*inputs)
+        except Exception as e:
+            print(f"Error computing LQR gains: {e}\n{traceback.format_exc()}")
+            return {"success": False, "error": str(e)}
+        with self.lock:
+            if generation != self._gain_generation:
+                return superseded
+            return self._apply_gains(solved)
+
+    @property
+    def gains_pending(self) -> bool:
+        return self._gain_future is not None and not self._gain_future.done()
+
     def select_aircraft(self, aircraft_id: str | None = None, model_override: Any = None) -> Dict[str, Any]:
         if model_override:
             model = model_override
@@ -223,6 +279,7 @@ class SimRuntime:
             self.selected_aircraft_id = model.id
             self.params = model.params
             self.limits = model.limits
+            self.rhs = FastRhs(self.params, self.limits)
             
             # Reset Targets
             self.targets = AutopilotTargets(airspeed_mps=v_init, altitude_m=alt_init, heading_rad=0.0)
@@ -236,6 +293,7 @@ class SimRuntime:
             self.failures = FailureManager()
             
             self.category = category
+            self.gain_schedule = None
             res = self.recompute_gains(category=self.category)
             if not res["success"]:
                 print(f"WARNING: Selection completed but gains could not be computed: {res['error']}")
@@ -248,6 +306,27 @@ class SimRuntime:
             "init_status": res,
         }
 
+    def set_gain_schedule(self, table: GainScheduleTable | None) -> None:
+        with self.lock:
+            if table is not None and table.fingerprint != parameters_fingerprint(self.params, self.limits):
+                raise ValueError("Gain schedule was built for a different aircraft.")
+            self.gain_schedule = table
+
+    def build_gain_schedule(self, V_grid: list[float], alt_grid: list[float]) -> GainScheduleTable:
+        with self.lock:
+            model = replace(get_aircraft_model(self.selected_aircraft_id), params=self.params, limits=self.limits)
+            weights = (self.Q_lon, self.R_lon, self.Q_lat, self.R_lat)
+
+        def build() -> GainScheduleTable:
+            return build_gain_schedule_table(
+                model, V_grid, alt_grid, Q_lon=weights[0], R_lon=weights[1], Q_lat=weights[2], R_lat=weights[3]
+            )
+
+        if _result_store is None:
+            return build()
+        key = result_key("gain_schedule_table", model.params, model.limits, model.stability_mode, V_grid, alt_grid, *weights)
+        return _result_store.get_or_compute(key, build)
+
     def set_wind(self, n: float, e: float, d: float) -> None:
         with self.lock:
             self.wind.steady_ned_mps = np.array([n, e, d], dtype=float)
@@ -260,9 +339,9 @@ class SimRuntime:
                 altitude_m=self.targets.altitude_m if alt is None else float(alt),
                 heading_rad=self.targets.heading_rad if hdg_deg is None else float(np.deg2rad(hdg_deg)),
             )
-            # If airspeed target changed significantly, recompute gains
+            # If airspeed target changed significantly, recompute gains off the hot path
             if V is not None and abs(V - old_V) > 1.0:
-                self.recompute_gains(category=self.category)
+                self.request_gains()
 
     def set_autopilot(self, enabled: bool) -> None:
         with self.lock:
@@ -299,11 +378,20 @@ class SimRuntime:
             u_cmd = ControlInputs(throttle=self.trim_u0[0], aileron=0.0, elevator=self.trim_u0[2], rudder=0.0)
             lqr_debug = {}
             
+            # Scheduled gains regulate about the trim they were designed at, which is also
+            # the feed-forward; the fixed trim and gains are the fallback outside the table.
+            K_lon, K_lat, x_trim, u_trim = self.K_lon, self.K_lat, self.trim_x0, self.trim_u0
+            if self.autopilot_enabled and self.gain_schedule is not None:
+                K_lon_s, K_lat_s = self.gain_schedule.gains(v_air_mps, -float(s.z))
+                x_trim_s, u_trim_s = self.gain_schedule.trim(v_air_mps, -float(s.z))
+                if all(np.all(np.isfinite(a)) for a in (K_lon_s, K_lat_s, x_trim_s, u_trim_s)):
+                    K_lon, K_lat, x_trim, u_trim = K_lon_s, K_lat_s, x_trim_s, u_trim_s
+
             if self.autopilot_enabled:
                 # 1. Longitudinal LQR
                 # States: [u, w, q, theta]
                 x_lon = s.as_vector()[LONGITUDINAL_STATE_IDX_FULL]
-                x_ref_lon = self.trim_x0[LONGITUDINAL_STATE_IDX_FULL].copy()
+                x_ref_lon = x_trim[LONGITUDINAL_STATE_IDX_FULL].copy()
                 
                 # Altitude command -> pitch command using a simple outer loop or altitude state in LQR
                 # For now, let's keep it simple: penalize theta vs trim.
@@ -313,23 +401,23 @@ class SimRuntime:
                 theta_cmd = np.clip(0.008 * alt_err, -0.3, 0.3)
                 x_ref_lon[3] = theta_cmd 
                 
-                du_lon = -self.K_lon @ (x_lon - x_ref_lon) # [elevator, throttle]
+                du_lon = -K_lon @ (x_lon - x_ref_lon) # [elevator, throttle]
                 
                 # 2. Lateral LQR
                 # States: [v, p, r, phi]
                 x_lat = s.as_vector()[LATERAL_STATE_IDX_FULL]
-                x_ref_lat = self.trim_x0[LATERAL_STATE_IDX_FULL].copy()
+                x_ref_lat = x_trim[LATERAL_STATE_IDX_FULL].copy()
                 
                 # Heading command -> bank command
                 psi_err = float((self.targets.heading_rad - s.psi + np.pi) % (2.0 * np.pi) - np.pi)
                 phi_cmd = np.clip(1.2 * psi_err, -0.6, 0.6)
                 x_ref_lat[3] = phi_cmd
                 
-                du_lat = -self.K_lat @ (x_lat - x_ref_lat) # [aileron, rudder]
+                du_lat = -K_lat @ (x_lat - x_ref_lat) # [aileron, rudder]
                 
                 u_cmd = ControlInputs(
-                    throttle=float(np.clip(self.trim_u0[0] + du_lon[1], 0, 1)),
-                    elevator=float(np.clip(self.trim_u0[2] + du_lon[0], -limits.elevator_max_rad, limits.elevator_max_rad)),
+                    throttle=float(np.clip(u_trim[0] + du_lon[1], 0, 1)),
+                    elevator=float(np.clip(u_trim[2] + du_lon[0], -limits.elevator_max_rad, limits.elevator_max_rad)),
                     aileron=float(np.clip(du_lat[0], -limits.aileron_max_rad, limits.aileron_max_rad)),
                     rudder=float(np.clip(du_lat[1], -limits.rudder_max_rad, limits.rudder_max_rad))
                 )
@@ -345,17 +433,11 @@ class SimRuntime:
             u_cmd = self.failures.apply_actuator(u_cmd)
             u = self.act.update(u_cmd, dt)
 
-            # dynamics
-            def f_dyn(ti: float, xi: np.ndarray) -> np.ndarray:
-                si = State.from_vector(xi)
-                C_bi_i = rotation_body_to_inertial(si.phi, si.theta, si.psi)
-                w_body_steady_i = C_bi_i.T @ w_ned
-                v_b_i = np.array([si.u, si.v, si.w], dtype=float)
-                v_air_b_i = v_b_i - w_body_steady_i - w_body_turb
-                F, M, _ = forces_and_moments_body(si, u, params, limits, uvw_air_mps=v_air_b_i)
-                return derivatives_6dof(ti, xi, params, F, M)
-
-            x_next = rk4_step(f_dyn, t, s.as_vector(), dt)
+            # dynamics (wind and controls held constant over RK4 substeps)
+            self.rhs.set_controls(u)
+            self.rhs.set_wind(w_ned, w_body_turb)
+
+            x_next = rk4_step_inplace(self.rhs.evaluate_into, t, s.as_vector(), dt, out=self.x_buf, work=self.rk4_work)
             x_next = post_step_sanitize(x_next)
             self.state = State.from_vector(x_next)
             self.t = t + dt
@@ -386,15 +468,53 @@ class SimRuntime:
                     "gust_uvw": self.dryden.last_output.tolist(),
                 },
                 "ap": lqr_debug,
+                "gains_pending": self.gains_pending,
             }
 
             self.last_packet = packet
             return packet
 
 
+def _solve_gains(
+    params: AircraftParameters,
+    limits: ActuatorLimits,
+    V_mps: float,
+    category: str,
+    method: str,
+    weights: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> tuple[Any, np.ndarray, np.ndarray]:
+    """
+    Trim, linearize (shared operating-point cache) and design both LQR loops -> (trim, K_lon, K_lat).
+    Reads no runtime state, so it can run on the gain worker without the lock.
+    """
+    op = default_operating_point_cache().get(params, limits, V_mps, aircraft_category=category, method=method)
+    A, B = op.A, op.B
+    Q_lon, R_lon, Q_lat, R_lat = weights
+
+    def design() -> tuple[np.ndarray, np.ndarray]:
+        design_lon = design_longitudinal_lqr(A, B, Q=Q_lon, R=R_lon)
+        design_lat = design_lateral_lqr(A, B, Q=Q_lat, R=R_lat)
+        return np.asarray(design_lon.K, dtype=float), np.asarray(design_lat.K, dtype=float)
+
+    # LQR gains are stored per operating point and weights
+    if _result_store is None:
+        K_lon, K_lat = design()
+    else:
+        K_lon, K_lat = _result_store.get_or_compute(result_key("lqr_gains", op.key, *weights), design)
+    return op.trim, K_lon, K_lat
+
+
 runtime = SimRuntime()
 
 
+@app.get("/api/v1/cache/stats")
+def cache_stats() -> Dict[str, Any]:
+    return {
+        **default_operating_point_cache().stats(),
+        "result_store": None if _result_store is None else _result_store.stats(),
+    }
+
+
 @app.post("/api/v1/aircraft/select")
 def select_aircraft(payload: Dict[str, Any]) -> Dict[str, Any]:
     try:
@@ -413,6 +533,35 @@ def select_aircraft(payload: Dict[str, Any]) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.post("/api/v1/autopilot/gain-schedule")
+def set_gain_schedule(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    {"V_grid": [...], "alt_grid": [...]} builds (or loads) a gain schedule for the selected
+    aircraft and enables it; {"enabled": false} returns to the fixed trim-point gains.
+    """
+    try:
+        if not payload.get("enabled", True):
+            runtime.set_gain_schedule(None)
+            return {"enabled": False}
+        V_grid = [float(v) for v in payload["V_grid"]]
+        alt_grid = [float(h) for h in payload["alt_grid"]]
+        if V_grid != sorted(V_grid) or alt_grid != sorted(alt_grid):
+            raise ValueError("V_grid and alt_grid must be ascending.")
+        table = runtime.build_gain_schedule(V_grid, alt_grid)
+        runtime.set_gain_schedule(table)
+        return {
+            "enabled": True,
+            "V_grid": table.V_grid.tolist(),
+            "alt_grid": table.alt_grid.tolist(),
+            "valid_points": int(table.valid.sum()),
+            "total_points": int(table.valid.size),
+        }
+    except KeyError as exc:
+        raise HTTPException(status_code=422, detail=f"Missing field {exc}")
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
 @app.post("/api/v1/aircraft/custom/analyze")
 def analyze_custom_aircraft(payload: Dict[str, Any]) -> Dict[str, Any]:
     try:
@@ -446,6 +595,13 @@ def compute_control_analysis(payload: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@app.post("/api/v1/analysis/control/sweep")
+def compute_control_sweep(payload: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return control_sweep_response(payload, current_model=get_aircraft_model(runtime.selected_aircraft_id))
+    except Exception as e:
+        return {"error": str(e)}
+
 @app.post("/api/v1/analysis/step-response")
 def compute_step_response(payload: Dict[str, Any]) -> Dict[str, Any]:
     try:
@@ -477,6 +633,13 @@ def compute_mode_shapes(payload: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"error": str(e)}
 
+@app.post("/api/v1/analysis/modal-sweep")
+def compute_modal_sweep(payload: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        return modal_sweep_response(payload, current_model=get_aircraft_model(runtime.selected_aircraft_id))
+    except Exception as e:
+        return {"error": str(e)}
+
 
 @app.post("/api/v1/validation/run")
 def run_validation(payload: Dict[str, Any]) -> Dict[str, Any]:
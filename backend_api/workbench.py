@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import asdict, replace
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
 from typing import Any, Dict
 
 import numpy as np
 from scipy import signal
 from scipy.stats import chi2
 
-from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.database import AircraftModel, build_aircraft_model_from_payload, get_aircraft_model
 from adcs_core.aircraft.forces_moments import ActuatorLimits
 from adcs_core.aircraft.parameters import AircraftParameters
@@ -15,14 +16,21 @@ from adcs_core.analysis.jacobian_validation import validate_jacobian
 from adcs_core.analysis.lqr_longitudinal import (
     LONGITUDINAL_INPUT_IDX_FULL,
     LONGITUDINAL_STATE_IDX_FULL,
+    controllability_matrix,
     design_longitudinal_lqr,
+    extract_longitudinal_subsystem,
 )
-from adcs_core.analysis.modal_analysis import analyze_modal_structure
-from adcs_core.analysis.trim import compute_level_trim
-from adcs_core.control.linearize import linearize
+from adcs_core.api import (
+    OperatingPointCache,
+    RiccatiSession,
+    analyze_modal_stack,
+    default_operating_point_cache,
+    longitudinal_weight_grid,
+    sweep_lqr_weights,
+)
+from adcs_core.control.linearize import discretize_zoh, linearize_xdot_full
 from adcs_core.environment.atmosphere import ISAParams, isa_atmosphere
 from adcs_core.estimation.ekf import AttitudeEKF
-from adcs_core.model import xdot_full
 from adcs_core.state.state_definition import StateIndex
 
 
@@ -130,17 +138,16 @@ def apply_flight_condition(params: AircraftParameters, fc: dict[str, float]) ->
     return replace(params, rho_kgm3=float(rho))
 
 
-def linearize_full(x0: np.ndarray, u0: np.ndarray, params: AircraftParameters, limits: ActuatorLimits) -> tuple[np.ndarray, np.ndarray]:
-    def f(x: np.ndarray, u_vec: np.ndarray) -> np.ndarray:
-        ctrl = ControlInputs(
-            throttle=float(u_vec[0]),
-            aileron=float(u_vec[1]),
-            elevator=float(u_vec[2]),
-            rudder=float(u_vec[3]),
-        )
-        return xdot_full(x, ctrl, params=params, limits=limits)
-
-    return linearize(f, x0, u0)
+def linearize_full(
+    x0: np.ndarray,
+    u0: np.ndarray,
+    params: AircraftParameters,
+    limits: ActuatorLimits,
+    *,
+    method: str = "fd",
+    scheme: str = "central",
+) -> tuple[np.ndarray, np.ndarray]:
+    return linearize_xdot_full(x0, u0, params, limits, method=method, scheme=scheme)
 
 
 def compute_metrics_from_modal(modal: dict[str, Any]) -> dict[str, float | None]:
@@ -176,20 +183,30 @@ def compute_metrics_from_modal(modal: dict[str, Any]) -> dict[str, float | None]
     }
 
 
-def build_analysis_bundle(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
+def build_analysis_bundle(
+    payload: Dict[str, Any],
+    current_model: AircraftModel | None = None,
+    *,
+    cache: OperatingPointCache | None = None,
+) -> dict[str, Any]:
     model, fc = resolve_model_from_payload(payload, current_model=current_model)
-    trim = compute_level_trim(fc["V_mps"], model.params, limits=model.limits, aircraft_category=model.stability_mode)
-    A, B = linearize_full(trim.x0, trim.u0, model.params, model.limits)
-    eigvals = np.linalg.eigvals(A)
-    modal = analyze_modal_structure(A).as_dict()
+    op = (cache or default_operating_point_cache()).get(
+        model.params,
+        model.limits,
+        fc["V_mps"],
+        aircraft_category=model.stability_mode,
+        method="batch",
+    )
+    modal = op.modal.as_dict()
 
     return {
+        "key": op.key,
         "model": model,
         "flight_condition": fc,
-        "trim": trim,
-        "A": A,
-        "B": B,
-        "eigenvalues": eigvals,
+        "trim": op.trim,
+        "A": op.A,
+        "B": op.B,
+        "eigenvalues": op.eigenvalues,
         "modal_analysis": modal,
         "metrics": compute_metrics_from_modal(modal),
     }
@@ -250,6 +267,64 @@ def custom_aircraft_response(payload: Dict[str, Any]) -> dict[str, Any]:
 
 def control_response(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
     bundle = build_analysis_bundle(payload, current_model=current_model)
+    return _control_response_from_bundle(bundle, payload)
+
+
+@dataclass(frozen=True)
+class _LongitudinalTuning:
+    """
+    Weight-independent part of the longitudinal LQR design for one operating point,
+    plus a warm-started Riccati session for slider-driven Q/R changes.
+    """
+
+    A_lon: np.ndarray
+    B_lon: np.ndarray
+    controllability_rank: int
+    controllability_condition: float
+    open_loop_eigenvalues: np.ndarray
+    riccati: RiccatiSession
+
+
+_TUNING_MAXSIZE = 32
+# Server-side bounds of /analysis/control/sweep; request payloads cannot change them.
+_SWEEP_MAX_POINTS = 20000
+_SWEEP_MAX_WORKERS = 1
+# /analysis/modal-sweep trims and linearizes once per airspeed.
+_MODAL_SWEEP_MAX_POINTS = 200
+_TUNING_SESSIONS: OrderedDict[str, _LongitudinalTuning] = OrderedDict()
+_TUNING_LOCK = threading.Lock()
+
+
+def _longitudinal_tuning(bundle: dict[str, Any]) -> _LongitudinalTuning:
+    key = bundle["key"]
+    with _TUNING_LOCK:
+        entry = _TUNING_SESSIONS.get(key)
+        if entry is not None:
+            _TUNING_SESSIONS.move_to_end(key)
+            return entry
+
+    A_lon, B_lon = extract_longitudinal_subsystem(bundle["A"], bundle["B"])
+    C = controllability_matrix(A_lon, B_lon)
+    rank = int(np.linalg.matrix_rank(C))
+    if rank < A_lon.shape[0]:
+        raise RuntimeError(f"Longitudinal subsystem not controllable: rank={rank}, n={A_lon.shape[0]}")
+    entry = _LongitudinalTuning(
+        A_lon=A_lon,
+        B_lon=B_lon,
+        controllability_rank=rank,
+        controllability_condition=float(np.linalg.cond(C)),
+        open_loop_eigenvalues=np.linalg.eigvals(A_lon),
+        riccati=RiccatiSession(A_lon, B_lon),
+    )
+    with _TUNING_LOCK:
+        entry = _TUNING_SESSIONS.setdefault(key, entry)
+        _TUNING_SESSIONS.move_to_end(key)
+        while len(_TUNING_SESSIONS) > _TUNING_MAXSIZE:
+            _TUNING_SESSIONS.popitem(last=False)
+    return entry
+
+
+def _control_response_from_bundle(bundle: dict[str, Any], payload: Dict[str, Any]) -> dict[str, Any]:
     q_pitch_mult = float(payload.get("q_pitch_mult", 1.0))
     q_speed_mult = float(payload.get("q_speed_mult", 1.0))
     r_effort_mult = float(payload.get("r_effort_mult", 1.0))
@@ -262,9 +337,11 @@ def control_response(payload: Dict[str, Any], current_model: AircraftModel | Non
         q_base[3, 3] * max(1e-6, q_pitch_mult),
     ])
     r_eff = r_base * max(1e-6, r_effort_mult)
-    design = design_longitudinal_lqr(bundle["A"], bundle["B"], Q=q_eff, R=r_eff)
-    eig_open = np.asarray(design.open_loop_eigenvalues, dtype=complex)
-    eig_closed = np.asarray(design.closed_loop_eigenvalues, dtype=complex)
+    # Plant data is reused per operating point; only the Riccati solve depends on Q/R.
+    tuning = _longitudinal_tuning(bundle)
+    care = tuning.riccati.solve(q_eff, r_eff)
+    eig_open = np.asarray(tuning.open_loop_eigenvalues, dtype=complex)
+    eig_closed = np.asarray(np.linalg.eigvals(tuning.A_lon - tuning.B_lon @ care.K), dtype=complex)
     max_re_open = float(np.max(np.real(eig_open)))
     max_re_closed = float(np.max(np.real(eig_closed)))
     return {
@@ -280,9 +357,11 @@ def control_response(payload: Dict[str, Any], current_model: AircraftModel | Non
             "R": r_eff.tolist(),
         },
         "lqr": {
-            "K": np.asarray(design.K, dtype=float).tolist(),
-            "controllability_rank": int(design.controllability_rank),
-            "controllability_condition": float(design.controllability_condition),
+            "K": np.asarray(care.K, dtype=float).tolist(),
+            "controllability_rank": int(tuning.controllability_rank),
+            "controllability_condition": float(tuning.controllability_condition),
+            "riccati_method": care.method,
+            "riccati_iterations": int(care.iterations),
         },
         "open_loop": {
             "eigenvalues": _serialize_eigs(eig_open),
@@ -303,6 +382,49 @@ def control_response(payload: Dict[str, Any], current_model: AircraftModel | Non
     }
 
 
+def _nullable(values: np.ndarray) -> list[float | None]:
+    return [None if not np.isfinite(v) else float(v) for v in np.asarray(values, dtype=float)]
+
+
+def control_sweep_response(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
+    """
+    LQR designs for every combination of the control-tuning multipliers against one
+    trimmed plant. Longitudinal loop: q_speed_mults x q_pitch_mults x r_effort_mults as
+    in /analysis/control; lateral loop: q_mults x r_effort_mults scaling all of Q and R.
+    Sweeps of more than _SWEEP_MAX_POINTS designs are rejected.
+    """
+    bundle = build_analysis_bundle(payload, current_model=current_model)
+    loop = str(payload.get("loop", "longitudinal"))
+    r_mults = [float(v) for v in payload.get("r_effort_mults", [1.0])]
+    if loop == "longitudinal":
+        Q_scale, R_scale = longitudinal_weight_grid(
+            [float(v) for v in payload.get("q_speed_mults", [1.0])],
+            [float(v) for v in payload.get("q_pitch_mults", [1.0])],
+            r_mults,
+        )
+    else:
+        qs, rs = np.meshgrid([float(v) for v in payload.get("q_mults", [1.0])], r_mults, indexing="ij")
+        Q_scale, R_scale = np.repeat(qs.reshape(-1, 1), 4, axis=1), rs.ravel()
+    if Q_scale.shape[0] > _SWEEP_MAX_POINTS:
+        raise ValueError(f"Sweep has {Q_scale.shape[0]} points; at most {_SWEEP_MAX_POINTS} are allowed.")
+    result = sweep_lqr_weights(bundle["A"], bundle["B"], Q_scale, R_scale, loop=loop, max_workers=_SWEEP_MAX_WORKERS)
+    return {
+        "aircraft_id": bundle["model"].id,
+        "V_mps": bundle["flight_condition"]["V_mps"],
+        "flight_condition": bundle["flight_condition"],
+        "loop": result.loop,
+        "points": int(result.K.shape[0]),
+        "Q_diag": result.Q_diag.tolist(),
+        "R_diag": result.R_diag.tolist(),
+        "K": result.K.tolist(),
+        "spectral_margin": result.spectral_margin.tolist(),
+        "min_damping_ratio": _nullable(result.min_damping),
+        "control_effort": _nullable(result.control_effort),
+        "state_energy": _nullable(result.state_energy),
+        "pareto": np.flatnonzero(result.pareto).tolist(),
+    }
+
+
 def step_response(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
     bundle = build_analysis_bundle(payload, current_model=current_model)
     design = design_longitudinal_lqr(bundle["A"], bundle["B"])
@@ -319,39 +441,23 @@ def step_response(payload: Dict[str, Any], current_model: AircraftModel | None =
     u_trim = np.asarray(bundle["trim"].u0, dtype=float)
     A = np.asarray(bundle["A"], dtype=float)
     B = np.asarray(bundle["B"], dtype=float)
-    state_names = ["airspeed_mps", "pitch_rad", "pitch_rate_radps", "altitude_m", "ground_distance_m"]
-
-    def step_vec(tt: float) -> np.ndarray:
-        du = np.zeros(4, dtype=float)
-        if tt >= 0.5:
-            if step_input == "throttle":
-                du[0] = step_amplitude
-            else:
-                du[2] = step_amplitude
-        return du
-
-    def rk4_linear(x_dev: np.ndarray, u_dev: np.ndarray) -> np.ndarray:
-        f = lambda xx: A @ np.clip(xx, -1e4, 1e4) + B @ np.clip(u_dev, -10.0, 10.0)
-        k1 = f(x_dev)
-        k2 = f(x_dev + 0.5 * dt_s * k1)
-        k3 = f(x_dev + 0.5 * dt_s * k2)
-        k4 = f(x_dev + dt_s * k3)
-        next_state = x_dev + (dt_s / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
-        return np.nan_to_num(next_state, nan=0.0, posinf=1e6, neginf=-1e6)
-
-    def project(x_dev: np.ndarray, tt: float) -> dict[str, float]:
+
+    # Exact ZOH discretization once per request; the input (step + sampled feedback)
+    # is held over each dt_s interval, so each sample is a single matrix update.
+    Ad, Bd = discretize_zoh(A, B, dt_s)
+    u_steps = np.zeros((t.size, 4), dtype=float)
+    u_steps[t >= 0.5, 0 if step_input == "throttle" else 2] = step_amplitude
+    K_full = np.zeros((4, 12), dtype=float)
+    K_full[np.ix_(LONGITUDINAL_INPUT_IDX_FULL, LONGITUDINAL_STATE_IDX_FULL)] = np.asarray(design.K, dtype=float)
+
+    def project(x_dev: np.ndarray) -> dict[str, np.ndarray]:
         x_full = x_trim + x_dev
-        u = float(x_full[int(StateIndex.U)])
-        theta = float(x_full[int(StateIndex.THETA)])
-        q = float(x_full[int(StateIndex.Q)])
-        altitude = -float(x_full[int(StateIndex.Z)])
-        ground_distance = float(x_full[int(StateIndex.X)] - bundle["flight_condition"]["headwind_mps"] * tt)
         return {
-            "airspeed_mps": u,
-            "pitch_rad": theta,
-            "pitch_rate_radps": q,
-            "altitude_m": altitude,
-            "ground_distance_m": ground_distance,
+            "airspeed_mps": x_full[:, int(StateIndex.U)],
+            "pitch_rad": x_full[:, int(StateIndex.THETA)],
+            "pitch_rate_radps": x_full[:, int(StateIndex.Q)],
+            "altitude_m": -x_full[:, int(StateIndex.Z)],
+            "ground_distance_m": x_full[:, int(StateIndex.X)] - bundle["flight_condition"]["headwind_mps"] * t,
         }
 
     traces: dict[str, dict[str, list[float]]] = {}
@@ -360,26 +466,21 @@ def step_response(payload: Dict[str, Any], current_model: AircraftModel | None =
             continue
         if mode == "closed_loop" and not include_closed:
             continue
-        x_dev = np.zeros(12, dtype=float)
-        outputs = {name: [] for name in state_names}
-        controls = {"elevator": [], "throttle": []}
-        for tt in t:
-            base_step = step_vec(float(tt))
-            if mode == "closed_loop":
-                lon_dev = x_dev[LONGITUDINAL_STATE_IDX_FULL]
-                feedback = -(np.asarray(design.K, dtype=float) @ lon_dev)
-                u_dev = base_step.copy()
-                u_dev[2] += float(feedback[0])
-                u_dev[0] += float(feedback[1])
-            else:
-                u_dev = base_step
-            sample = project(x_dev, float(tt))
-            for name, value in sample.items():
-                outputs[name].append(float(value))
-            controls["elevator"].append(float(u_trim[2] + u_dev[2]))
-            controls["throttle"].append(float(u_trim[0] + u_dev[0]))
-            x_dev = rk4_linear(x_dev, u_dev)
-        traces[mode] = {**outputs, "controls_elevator": controls["elevator"], "controls_throttle": controls["throttle"]}
+        K_mode = K_full if mode == "closed_loop" else np.zeros_like(K_full)
+        x_dev = np.zeros((t.size, 12), dtype=float)
+        u_dev = np.zeros((t.size, 4), dtype=float)
+        x_k = np.zeros(12, dtype=float)
+        for k in range(t.size):
+            x_dev[k] = x_k
+            u_dev[k] = u_steps[k] - K_mode @ x_k
+            x_k = Ad @ np.clip(x_k, -1e4, 1e4) + Bd @ np.clip(u_dev[k], -10.0, 10.0)
+            x_k = np.nan_to_num(x_k, nan=0.0, posinf=1e6, neginf=-1e6)
+        outputs = {name: values.tolist() for name, values in project(x_dev).items()}
+        traces[mode] = {
+            **outputs,
+            "controls_elevator": (u_trim[2] + u_dev[:, 2]).tolist(),
+            "controls_throttle": (u_trim[0] + u_dev[:, 0]).tolist(),
+        }
 
     closed_alt = np.asarray(traces.get("closed_loop", traces.get("open_loop", {})).get("altitude_m", []), dtype=float)
     closed_u = np.asarray(traces.get("closed_loop", traces.get("open_loop", {})).get("airspeed_mps", []), dtype=float)
@@ -413,7 +514,7 @@ def step_response(payload: Dict[str, Any], current_model: AircraftModel | None =
         "traces": traces,
         "metrics": metrics,
         "uncertainty": uncertainty,
-        "spectral": control_response(payload, current_model=current_model),
+        "spectral": _control_response_from_bundle(bundle, payload),
     }
 
 
@@ -561,6 +662,27 @@ def mode_shapes_response(payload: Dict[str, Any], current_model: AircraftModel |
     }
 
 
+def modal_sweep_response(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
+    """
+    Tracked modes over an airspeed sweep (V_grid) at the payload's flight condition.
+    Grids of more than _MODAL_SWEEP_MAX_POINTS airspeeds are rejected.
+    """
+    raw_grid = payload.get("V_grid", [])
+    if len(raw_grid) > _MODAL_SWEEP_MAX_POINTS:
+        raise ValueError(f"V_grid has {len(raw_grid)} points; at most {_MODAL_SWEEP_MAX_POINTS} are allowed.")
+    V_grid = [float(v) for v in raw_grid]
+    if len(V_grid) < 1:
+        raise ValueError("V_grid must contain at least one airspeed.")
+    bundles = [build_analysis_bundle({**payload, "V_mps": V}, current_model=current_model) for V in V_grid]
+    result = analyze_modal_stack(np.stack([b["A"] for b in bundles]))
+    return {
+        "aircraft_id": bundles[0]["model"].id,
+        "flight_condition": {**bundles[0]["flight_condition"], "V_mps": None},
+        "V_grid": V_grid,
+        **result.as_dict(),
+    }
+
+
 def validation_response(payload: Dict[str, Any], current_model: AircraftModel | None = None) -> dict[str, Any]:
     bundle = build_analysis_bundle(payload, current_model=current_model)
     trim = bundle["trim"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -11,3 +12,5 @@ for p in (str(ROOT), str(PKG)):
     if p not in sys.path:
         sys.path.insert(0, p)
 
+# Keep tests off the on-disk result store, whatever the developer's environment sets.
+os.environ["RESULT_STORE_DIR"] = "off"
@@ -7,9 +7,9 @@ import numpy as np
 from adcs_core.aircraft.aerodynamics import ControlInputs
 from adcs_core.aircraft.database import get_aircraft_model
 from adcs_core.analysis.lqr_longitudinal import design_longitudinal_lqr
+from adcs_core.analysis.simulation import StateFeedback, simulate
 from adcs_core.analysis.trim import compute_level_trim
 from adcs_core.control.linearize import linearize
-from adcs_core.dynamics.integrator import rk4_step
 from adcs_core.model import xdot_full
 
 
@@ -83,24 +83,13 @@ def _trajectory_sample(aircraft_id: str, speed_mps: float, K: np.ndarray) -> np.
     assert SAMPLE_INDEX < t.size
 
     lon_idx = np.array([3, 5, 10, 7], dtype=int)
-
-    def f_dyn(_tt: float, xx: np.ndarray) -> np.ndarray:
-        x_sub = xx[lon_idx]
-        x_ref_sub = x_ref[lon_idx]
-        du = -K @ (x_sub - x_ref_sub)
-        de = float(np.clip(u_ref[2] + du[0], -model.limits.elevator_max_rad, model.limits.elevator_max_rad))
-        thr = float(np.clip(u_ref[0] + du[1], 0.0, 1.0))
-        ctrl = ControlInputs(throttle=thr, aileron=0.0, elevator=de, rudder=0.0)
-        return xdot_full(xx, ctrl, params=model.params, limits=model.limits)
-
-    x_hist = np.zeros((t.size, x.size), dtype=float)
-    for i, tt in enumerate(t):
-        x_hist[i] = x
-        if i < t.size - 1:
-            x = rk4_step(f_dyn, float(tt), x, DT_S)
+    controller = StateFeedback(x_ref=x_ref, u_ref=u_ref, K=K, state_idx=lon_idx, input_idx=[2, 0], limits=model.limits)
+    # Only the sample row is needed; simulate up to it.
+    sim = simulate(x, controller, DT_S, SAMPLE_INDEX, params=model.params, limits=model.limits)
+    x_sample = sim["state"][SAMPLE_INDEX]
 
     # snapshot selected states: theta, q, u, v
-    return np.array([x_hist[SAMPLE_INDEX, 7], x_hist[SAMPLE_INDEX, 10], x_hist[SAMPLE_INDEX, 3], x_hist[SAMPLE_INDEX, 4]])
+    return np.array([x_sample[7], x_sample[10], x_sample[3], x_sample[4]])
 
 
 def main() -> None: